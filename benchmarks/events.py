@@ -0,0 +1,123 @@
+"""
+Compares the previous log decoding (a linear selector search and a hash per log) with `tinyman.event.EventRegistry`.
+
+    python benchmarks/events.py --log-count 100000
+"""
+import argparse
+import random
+import timeit
+
+from Cryptodome.Hash import SHA512
+from algosdk import abi
+from algosdk.abi.base_type import ABI_LENGTH_SIZE
+from algosdk.account import generate_account
+
+from tinyman.event import EventRegistry
+from tinyman.governance.proposal_voting.events import proposal_voting_events
+from tinyman.governance.rewards.events import rewards_events
+from tinyman.governance.staking_voting.events import staking_voting_events
+from tinyman.governance.vault.events import vault_events
+
+
+def get_selector(event):
+    sha_512_256_hash = SHA512.new(truncate="256")
+    sha_512_256_hash.update(event.signature.encode("utf-8"))
+    return sha_512_256_hash.digest()[:4]
+
+
+def decode_log(event, log):
+    event_data = log[4:]
+    data = {"event_name": event.name}
+    start = 0
+    for arg in event.args:
+        if arg.type.is_dynamic():
+            size = int.from_bytes(event_data[start : start + ABI_LENGTH_SIZE], "big")
+            if isinstance(arg.type, abi.ArrayDynamicType):
+                size *= arg.type.child_type.byte_len()
+            end = start + ABI_LENGTH_SIZE + size
+        else:
+            end = start + arg.type.byte_len()
+
+        value = event_data[start:end]
+        if isinstance(arg.type, abi.ArrayStaticType) and isinstance(
+            arg.type.child_type, abi.ByteType
+        ):
+            data[arg.name] = bytes(arg.type.decode(value))
+        else:
+            data[arg.name] = arg.type.decode(value)
+        start = end
+    return data
+
+
+def decode_logs_previous(logs, events):
+    # The previous implementation, kept as the baseline.
+    decoded_logs = []
+    for log in logs:
+        events_filtered = [event for event in events if get_selector(event) == log[:4]]
+        assert len(events_filtered) == 1
+        event = events_filtered[0]
+        assert get_selector(event) == log[:4]
+        decoded_logs.append(decode_log(event, log))
+    return decoded_logs
+
+
+def generate_value(arg_type, addresses):
+    if isinstance(arg_type, abi.UintType):
+        return random.getrandbits(arg_type.bit_size)
+    if isinstance(arg_type, abi.ByteType):
+        return random.getrandbits(8)
+    if isinstance(arg_type, abi.BoolType):
+        return random.choice([True, False])
+    if isinstance(arg_type, abi.AddressType):
+        return random.choice(addresses)
+    if isinstance(arg_type, abi.ArrayStaticType):
+        return bytes(random.getrandbits(8) for _ in range(arg_type.static_length))
+    if isinstance(arg_type, abi.ArrayDynamicType):
+        return [generate_value(arg_type.child_type, addresses) for _ in range(4)]
+    return "".join(random.choices("abcdef", k=8))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--log-count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    # Some events are shared by the apps.
+    events = list(
+        {
+            event.signature: event
+            for event in vault_events
+            + rewards_events
+            + proposal_voting_events
+            + staking_voting_events
+        }.values()
+    )
+    addresses = [generate_account()[1] for _ in range(100)]
+    logs = []
+    for _ in range(args.log_count):
+        event = random.choice(events)
+        logs.append(
+            event.encode([generate_value(arg.type, addresses) for arg in event.args])
+        )
+
+    registry = EventRegistry(events)
+    expected = decode_logs_previous(logs, events)
+    assert list(registry.iter_decode(logs)) == expected
+
+    decoders = {
+        "linear search (previous)": lambda: decode_logs_previous(logs, events),
+        "EventRegistry.iter_decode": lambda: list(registry.iter_decode(logs)),
+    }
+    print(f"{len(events)} events, {args.log_count} logs")
+    print(f"{'decoder':<32} {'ms':>10} {'us/log':>10}")
+    for name, function in decoders.items():
+        duration = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{name:<32} {duration * 1000:>10.2f} {duration * 1e6 / args.log_count:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
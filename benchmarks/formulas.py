@@ -0,0 +1,61 @@
+"""
+Compares the float formulas in `tinyman.v2.formulas` with the integer-only formulas in `tinyman.v2.integer_formulas`.
+
+    python benchmarks/formulas.py --number 100000
+"""
+import argparse
+import timeit
+
+from tinyman.v2 import formulas, integer_formulas
+
+ARGUMENTS = {
+    "calculate_initial_add_liquidity": (10_000_000_000, 25_000_000_000),
+    "calculate_remove_liquidity_output_amounts": (
+        1_000_000,
+        10_000_000_000,
+        25_000_000_000,
+        15_000_000_000,
+    ),
+    "calculate_subsequent_add_liquidity": (
+        10_000_000_000,
+        25_000_000_000,
+        15_000_000_000,
+        30,
+        1_000_000,
+        2_000_000,
+    ),
+    "calculate_fixed_input_swap": (10_000_000_000, 25_000_000_000, 1_000_000, 30),
+    "calculate_fixed_output_swap": (10_000_000_000, 25_000_000_000, 1_000_000, 30),
+    "calculate_flash_swap_asset_2_payment_amount": (
+        10_000_000_000,
+        25_000_000_000,
+        30,
+        6,
+        0,
+        1_000_000,
+        100_000,
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'function':<46} {'float ns':>10} {'integer ns':>10} {'ratio':>7}")
+    for name, arguments in ARGUMENTS.items():
+        timings = []
+        for module in (formulas, integer_formulas):
+            function = getattr(module, name)
+            timer = timeit.Timer(lambda: function(*arguments))
+            best = min(timer.repeat(repeat=args.repeat, number=args.number))
+            timings.append(best / args.number * 1e9)
+        print(
+            f"{name:<46} {timings[0]:>10.0f} {timings[1]:>10.0f} {timings[1] / timings[0]:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Cold import cost of the SDK entry points.
+
+Each module is imported in a fresh interpreter with `python -X importtime` and the cumulative time of the module is reported.
+Pass `--budget <ms>` to exit with a non-zero status if any entry point is slower than the budget.
+
+    python benchmarks/importtime.py --repeat 5 --budget 300
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINTS = [
+    "tinyman",
+    "tinyman.v1",
+    "tinyman.v2",
+    "tinyman.swap_router",
+    "tinyman.v1.client",
+    "tinyman.v2.client",
+    "tinyman.v2.pools",
+    "tinyman.swap_router.routes",
+    "tinyman.ordering.client",
+    "tinyman.governance.client",
+    "tinyman.liquid_staking.talgo_client",
+]
+
+
+def measure_import_time(module: str) -> float:
+    """Return the cumulative import time of `module` in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    raise Exception(f"{module} is not found in the import time output.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=None, help="milliseconds")
+    args = parser.parse_args()
+
+    over_budget = []
+    print(f"{'module':<40} {'median ms':>10} {'min ms':>10}")
+    for module in args.modules:
+        timings = [measure_import_time(module) for _ in range(args.repeat)]
+        median = statistics.median(timings)
+        print(f"{module:<40} {median:>10.1f} {min(timings):>10.1f}")
+        if args.budget is not None and median > args.budget:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"Over the {args.budget} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares quoting every open trigger order on each price tick with `tinyman.ordering.matcher.TriggerOrderMatcher`.
+
+    python benchmarks/order_matcher.py --order-count 50000 --tick-count 100
+"""
+import argparse
+import random
+import timeit
+
+from tinyman.ordering.matcher import OpenTriggerOrder, TriggerOrderMatcher
+from tinyman.v2.integer_formulas import calculate_fixed_input_swap
+
+TOTAL_FEE_SHARE = 30
+
+
+def rescan(orders, input_supply, output_supply):
+    # Quotes the remaining amount of every order, as a caller without an index does.
+    matches = []
+    for order in orders:
+        swap_output_amount, _, _ = calculate_fixed_input_swap(
+            input_supply, output_supply, order.remaining_amount, TOTAL_FEE_SHARE
+        )
+        if swap_output_amount >= order.get_required_target_amount(
+            order.remaining_amount
+        ):
+            matches.append(order.key)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--order-count", type=int, default=50_000)
+    parser.add_argument("--tick-count", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+    orders = []
+    for order_id in range(args.order_count):
+        amount = random.randint(1_000, 100_000)
+        orders.append(
+            OpenTriggerOrder(
+                app_id=1,
+                order_id=order_id,
+                user_address=None,
+                asset_id=1,
+                amount=amount,
+                target_asset_id=2,
+                target_amount=int(amount * random.uniform(1.0, 2.0)),
+                filled_amount=0,
+                is_partial_allowed=False,
+                expiration_timestamp=0,
+            )
+        )
+    matcher = TriggerOrderMatcher()
+    for order in orders:
+        matcher.add_order(order)
+
+    # Prices around the best limit prices, a few orders cross on each tick.
+    ticks = [
+        (10**12, int(10**12 * random.uniform(0.95, 1.01)))
+        for _ in range(args.tick_count)
+    ]
+    for input_supply, output_supply in ticks:
+        assert sorted(rescan(orders, input_supply, output_supply)) == sorted(
+            match.order.key
+            for match in matcher.match(
+                1, 2, input_supply, output_supply, TOTAL_FEE_SHARE
+            )
+        )
+
+    matchers = {
+        "rescan every order": lambda: [rescan(orders, *tick) for tick in ticks],
+        "TriggerOrderMatcher.match": lambda: [
+            matcher.match(1, 2, *tick, TOTAL_FEE_SHARE) for tick in ticks
+        ],
+    }
+    print(f"{args.order_count} orders, {args.tick_count} ticks")
+    print(f"{'matcher':<32} {'ms':>10} {'us/tick':>10}")
+    for name, function in matchers.items():
+        duration = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{name:<32} {duration * 1000:>10.2f} {duration * 1e6 / args.tick_count:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
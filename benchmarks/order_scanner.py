@@ -0,0 +1,51 @@
+"""
+Compares decoding trigger order boxes one struct at a time with the columnar decoding of `tinyman.ordering.scanner`.
+
+    python benchmarks/order_scanner.py --order-count 50000
+"""
+import argparse
+import random
+import timeit
+
+from tinyman.ordering.scanner import parse_order_boxes_into_columns
+from tinyman.ordering.structs import TriggerOrder
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--order-count", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    raw_boxes = [random.randbytes(TriggerOrder._size) for _ in range(args.order_count)]
+    field_names = list(TriggerOrder._fields)
+
+    def decode_structs():
+        orders = [TriggerOrder(raw_box) for raw_box in raw_boxes]
+        return {
+            name: [getattr(order, name) for order in orders] for name in field_names
+        }
+
+    def decode_columns():
+        return parse_order_boxes_into_columns(TriggerOrder, raw_boxes)
+
+    assert {
+        name: list(column) for name, column in decode_columns().items()
+    } == decode_structs()
+
+    decoders = {
+        "struct per box": decode_structs,
+        "parse_order_boxes_into_columns": decode_columns,
+    }
+    print(f"{args.order_count} orders")
+    print(f"{'decoder':<32} {'ms':>10} {'ns/order':>10}")
+    for name, function in decoders.items():
+        duration = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{name:<32} {duration * 1000:>10.2f} {duration * 1e9 / args.order_count:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
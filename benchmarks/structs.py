@@ -0,0 +1,89 @@
+"""
+Compares the field reads of the previous Struct (a field lookup and a type handler per read) with the compiled struct classes of `tinyman.struct`.
+
+    python benchmarks/structs.py --box-count 10000
+"""
+import argparse
+import random
+import timeit
+
+from tinyman.ordering.struct import STRUCT_REGISTRY
+from tinyman.ordering.structs import TriggerOrder
+
+
+class TealishInt:
+    def __call__(self, value):
+        return int.from_bytes(value, "big")
+
+
+class PreviousStruct:
+    # The previous implementation, kept as the baseline.
+    def __init__(self, name, size, fields):
+        self._name = name
+        self._size = size
+        self._fields = fields
+        self._data = None
+
+    def __call__(self, data=None):
+        struct = PreviousStruct(self._name, self._size, self._fields)
+        struct._data = memoryview(data)
+        return struct
+
+    def __getattribute__(self, name):
+        if name.startswith("_"):
+            return super().__getattribute__(name)
+        field = self._fields[name]
+        start = field["offset"]
+        end = field["offset"] + field["size"]
+        value = self._data[start:end]
+        # The registry returned a new handler on every read.
+        type = TealishInt()
+        return type(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--box-count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    raw_boxes = [random.randbytes(TriggerOrder._size) for _ in range(args.box_count)]
+    previous_struct = PreviousStruct(
+        "TriggerOrder", **STRUCT_REGISTRY.struct_definitions["TriggerOrder"]
+    )
+    field_names = list(TriggerOrder._fields)
+
+    def read_previous():
+        return [
+            tuple(getattr(previous_struct(raw_box), name) for name in field_names)
+            for raw_box in raw_boxes
+        ]
+
+    def read_compiled():
+        return [
+            tuple(getattr(TriggerOrder(raw_box), name) for name in field_names)
+            for raw_box in raw_boxes
+        ]
+
+    def unpack_all():
+        return [TriggerOrder(raw_box).unpack_all() for raw_box in raw_boxes]
+
+    assert read_previous() == read_compiled() == unpack_all()
+
+    readers = {
+        "field reads (previous)": read_previous,
+        "field reads": read_compiled,
+        "unpack_all": unpack_all,
+    }
+    print(f"{args.box_count} boxes, {len(field_names)} fields")
+    print(f"{'reader':<32} {'ms':>10} {'ns/field':>10}")
+    for name, function in readers.items():
+        duration = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{name:<32} {duration * 1000:>10.2f} {duration * 1e9 / (args.box_count * len(field_names)):>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
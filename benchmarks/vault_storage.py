@@ -0,0 +1,107 @@
+"""
+Compares the row by row parser of vault power boxes with the memoryview based parsers in `tinyman.governance.vault.storage`.
+
+    python benchmarks/vault_storage.py --box-count 1000
+"""
+import argparse
+import random
+import timeit
+
+from tinyman.governance.vault.constants import (
+    ACCOUNT_POWER_BOX_ARRAY_LEN,
+    ACCOUNT_POWER_SIZE,
+)
+from tinyman.governance.vault.storage import (
+    AccountPower,
+    parse_box_account_power,
+    parse_box_powers_into_columns,
+)
+from tinyman.utils import bytes_to_int, int_to_bytes
+
+
+def parse_box_account_power_by_row(raw_box):
+    # The previous implementation, kept as the baseline.
+    box_size = ACCOUNT_POWER_SIZE
+    rows = [raw_box[i : i + box_size] for i in range(0, len(raw_box), box_size)]
+    powers = []
+    for row in rows:
+        if row == (b"\x00" * box_size):
+            break
+
+        powers.append(
+            AccountPower(
+                bias=bytes_to_int(row[:8]),
+                timestamp=bytes_to_int(row[8:16]),
+                slope=bytes_to_int(row[16:32]),
+                cumulative_power=bytes_to_int(row[32:48]),
+            )
+        )
+    return powers
+
+
+def parse_boxes_into_columns(raw_boxes):
+    columns = None
+    for raw_box in raw_boxes:
+        columns = parse_box_powers_into_columns(raw_box, columns)
+    return columns
+
+
+def generate_box(row_count):
+    raw_box = b"".join(
+        int_to_bytes(random.getrandbits(40))
+        + int_to_bytes(random.getrandbits(32))
+        + int_to_bytes(random.getrandbits(100), 16)
+        + int_to_bytes(random.getrandbits(100), 16)
+        for _ in range(row_count)
+    )
+    return raw_box + b"\x00" * (
+        ACCOUNT_POWER_BOX_ARRAY_LEN * ACCOUNT_POWER_SIZE - len(raw_box)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--box-count", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    raw_boxes = [
+        generate_box(random.randint(1, ACCOUNT_POWER_BOX_ARRAY_LEN))
+        for _ in range(args.box_count)
+    ]
+
+    expected = [parse_box_account_power_by_row(raw_box) for raw_box in raw_boxes]
+    assert [parse_box_account_power(raw_box) for raw_box in raw_boxes] == expected
+    columns = parse_boxes_into_columns(raw_boxes)
+    assert [
+        AccountPower(*row)
+        for row in zip(
+            columns.biases,
+            columns.timestamps,
+            columns.slopes,
+            columns.cumulative_powers,
+        )
+    ] == [power for powers in expected for power in powers]
+
+    parsers = {
+        "row by row (previous)": lambda: [
+            parse_box_account_power_by_row(raw_box) for raw_box in raw_boxes
+        ],
+        "parse_box_account_power": lambda: [
+            parse_box_account_power(raw_box) for raw_box in raw_boxes
+        ],
+        "parse_box_powers_into_columns": lambda: parse_boxes_into_columns(raw_boxes),
+    }
+    row_count = sum(len(powers) for powers in expected)
+    print(f"{args.box_count} boxes, {row_count} powers")
+    print(f"{'parser':<32} {'ms':>10} {'ns/power':>10}")
+    for name, function in parsers.items():
+        duration = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{name:<32} {duration * 1000:>10.2f} {duration * 1e9 / row_count:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,12 +17,14 @@ setuptools.setup(
         "Source": "https://github.com/tinyman/tinyman-py-sdk",
     },
     install_requires=["py-algorand-sdk >= 1.10.0", "requests >= 2.0.0"],
+    extras_require={"async": ["aiohttp >= 3.8.0"], "numpy": ["numpy"]},
     packages=setuptools.find_packages(),
     python_requires=">=3.8",
     package_data={
         "tinyman.v1": ["asc.json"],
         "tinyman.v2": ["amm_approval.map.json", "swap_router_approval.map.json"],
         "tinyman.liquid_staking": ["structs.json"],
+        "tinyman.ordering": ["*.json", "build/*.teal.tok"],
     },
     include_package_data=True,
 )
@@ -0,0 +1,50 @@
+from base64 import b64encode
+
+from algosdk.error import AlgodHTTPError
+
+
+class FakeAlgodClient:
+    def __init__(self):
+        self.boxes = {}
+        self.global_states = {}
+        self.requests = []
+
+    def set_global_state(self, app_id, state):
+        self.global_states[app_id] = state
+
+    def application_info(self, app_id):
+        self.requests.append(("application_info", app_id))
+        global_state = []
+        for key, value in self.global_states.get(app_id, {}).items():
+            if isinstance(value, bytes):
+                value = {"type": 1, "bytes": b64encode(value).decode()}
+            else:
+                value = {"type": 2, "uint": value}
+            global_state.append(
+                {"key": b64encode(key.encode()).decode(), "value": value}
+            )
+        return {"id": app_id, "params": {"global-state": global_state}}
+
+    def application_box_by_name(self, app_id, box_name):
+        self.requests.append(("application_box_by_name", app_id, box_name))
+        if (app_id, box_name) not in self.boxes:
+            raise AlgodHTTPError("box not found", 404)
+        value = self.boxes[(app_id, box_name)]
+        return {
+            "name": b64encode(box_name).decode(),
+            "value": b64encode(value).decode(),
+        }
+
+    def application_boxes(self, app_id, limit=0):
+        self.requests.append(("application_boxes", app_id))
+        return {
+            "boxes": [
+                {"name": b64encode(box_name).decode()}
+                for (box_app_id, box_name) in self.boxes
+                if box_app_id == app_id
+            ]
+        }
+
+    def send_transactions(self, signed_transactions):
+        self.requests.append(("send_transactions", len(signed_transactions)))
+        return "TXID"
@@ -0,0 +1,91 @@
+import random
+from unittest import TestCase
+
+from tinyman.governance.bitset import Bitset
+from tinyman.governance.proposal_voting.storage import AttendanceSheet
+from tinyman.governance.rewards.storage import RewardClaimSheet
+from tinyman.governance.staking_voting.storage import StakingVotingAttendanceSheet
+from tinyman.governance.utils import check_nth_bit_from_left
+
+
+class BitsetTestCase(TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.value = bytes(random.getrandbits(8) for _ in range(64)) + b"\x00\xff"
+
+    def test_bits(self):
+        bitset = Bitset(self.value)
+        bits = [
+            bool(int.from_bytes(self.value, "big") >> (len(self.value) * 8 - 1 - n) & 1)
+            for n in range(len(self.value) * 8)
+        ]
+
+        self.assertEqual(bitset.size, len(bits))
+        self.assertEqual(bitset.to_bools(), bits)
+        self.assertEqual([bitset[n] for n in range(bitset.size)], bits)
+        self.assertEqual(
+            [check_nth_bit_from_left(self.value, n) for n in range(bitset.size)],
+            [int(bit) for bit in bits],
+        )
+        self.assertEqual(list(bitset), [n for n, bit in enumerate(bits) if bit])
+        self.assertEqual(
+            list(bitset.iter_unset()), [n for n, bit in enumerate(bits) if not bit]
+        )
+        self.assertEqual(
+            list(bitset.iter_set(13, 100)),
+            [n for n, bit in enumerate(bits) if bit and 13 <= n < 100],
+        )
+        self.assertEqual(len(bitset), sum(bits))
+        self.assertNotIn(bitset.size, bitset)
+        self.assertNotIn(-1, bitset)
+        with self.assertRaises(ValueError):
+            bitset.test(bitset.size)
+        with self.assertRaises(IndexError):
+            bitset[bitset.size]
+        with self.assertRaises(IndexError):
+            bitset[-1]
+        with self.assertRaises(ValueError):
+            check_nth_bit_from_left(self.value, bitset.size)
+
+    def test_from_indexes(self):
+        bitset = Bitset.from_indexes([0, 7, 8, 20], size=24)
+        self.assertEqual(bytes(bitset), b"\x81\x80\x08")
+        self.assertEqual(list(bitset), [0, 7, 8, 20])
+        self.assertEqual(Bitset.from_indexes([], size=10).size, 16)
+        self.assertFalse(Bitset.from_indexes([], size=10))
+        with self.assertRaises(ValueError):
+            Bitset.from_indexes([24], size=24)
+
+    def test_set_operations(self):
+        a = Bitset.from_indexes([1, 2, 3, 10], size=16)
+        b = Bitset.from_indexes([2, 3, 20], size=24)
+
+        self.assertEqual(list(a | b), [1, 2, 3, 10, 20])
+        self.assertEqual(list(a & b), [2, 3])
+        self.assertEqual(list(a - b), [1, 10])
+        self.assertEqual(list(a ^ b), [1, 10, 20])
+        self.assertEqual((a | b).size, 24)
+        self.assertTrue((a & b).issubset(a))
+        self.assertFalse(a.issubset(b))
+        self.assertEqual(a, Bitset(bytes(a)))
+
+    def test_reward_claim_sheet(self):
+        claim_sheet = RewardClaimSheet(value=Bitset.from_indexes([0, 5], size=8).value)
+        self.assertTrue(claim_sheet.is_reward_claimed_for_period(5))
+        self.assertFalse(claim_sheet.is_reward_claimed_for_period(4))
+        self.assertEqual(
+            claim_sheet.claim_sheet,
+            [True, False, False, False, False, True, False, False],
+        )
+        self.assertEqual(list(claim_sheet.bitset), [0, 5])
+
+    def test_sheet_bitsets_are_cached(self):
+        value = Bitset.from_indexes([1], size=8).value
+        for sheet in [
+            RewardClaimSheet(value=value),
+            StakingVotingAttendanceSheet(value=value),
+            AttendanceSheet(value=value),
+        ]:
+            with self.subTest(sheet=sheet):
+                self.assertIs(sheet.bitset, sheet.bitset)
+                self.assertEqual(list(sheet.bitset), [1])
@@ -0,0 +1,118 @@
+import os
+import tempfile
+from base64 import b64encode
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from algosdk.error import AlgodHTTPError
+
+from tinyman.constants import CACHE_DIR_ENV
+from tinyman.governance.box_cache import (
+    InMemoryBoxCache,
+    SQLiteBoxCache,
+    get_default_box_cache,
+    set_default_box_cache,
+)
+from tinyman.governance.utils import get_raw_box_value
+
+
+class InMemoryBoxCacheTestCase(TestCase):
+    def test_lru(self):
+        cache = InMemoryBoxCache(max_size=2)
+        cache.set(1, b"a", b"1")
+        cache.set(1, b"b", b"2")
+        cache.get(1, b"a")
+        cache.set(1, b"c", b"3")
+
+        self.assertEqual(cache.get(1, b"a"), b"1")
+        self.assertIsNone(cache.get(1, b"b"))
+        self.assertEqual(cache.get(1, b"c"), b"3")
+        self.assertIsNone(cache.get(2, b"a"))
+
+
+class SQLiteBoxCacheTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "cache" / "boxes.sqlite3"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_persistence(self):
+        cache = SQLiteBoxCache(self.path)
+        cache.set(1, b"tp\x00", b"value")
+        cache.set(1, b"tp\x00", b"new value")
+        cache.close()
+
+        cache = SQLiteBoxCache(self.path)
+        self.assertEqual(cache.get(1, b"tp\x00"), b"new value")
+        self.assertIsNone(cache.get(2, b"tp\x00"))
+
+        cache.delete(1, b"tp\x00")
+        self.assertIsNone(cache.get(1, b"tp\x00"))
+
+    def test_concurrent_writers(self):
+        caches = [SQLiteBoxCache(self.path), SQLiteBoxCache(self.path)]
+
+        def write(i):
+            caches[i % 2].set(1, i.to_bytes(8, "big"), bytes(i % 256))
+
+        with ThreadPool(8) as pool:
+            pool.map(write, range(200))
+
+        for i in range(200):
+            self.assertEqual(caches[0].get(1, i.to_bytes(8, "big")), bytes(i % 256))
+
+
+class DefaultBoxCacheTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.addCleanup(set_default_box_cache, None)
+        set_default_box_cache(None)
+
+    def test_cache_dir(self):
+        with patch.dict(os.environ, {CACHE_DIR_ENV: self.directory.name}):
+            cache = get_default_box_cache()
+        self.addCleanup(cache.close)
+
+        self.assertIsInstance(cache, SQLiteBoxCache)
+        self.assertEqual(cache.path.parent, Path(self.directory.name))
+        self.assertIs(get_default_box_cache(), cache)
+
+    def test_in_memory_without_cache_dir(self):
+        environ = {k: v for k, v in os.environ.items() if k != CACHE_DIR_ENV}
+        with patch.dict(os.environ, environ, clear=True), patch(
+            "os.getcwd", return_value=self.directory.name
+        ):
+            cache = get_default_box_cache()
+
+        # Nothing is written to the working directory unless a cache directory is configured.
+        self.assertIsInstance(cache, InMemoryBoxCache)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+class GetRawBoxValueTestCase(TestCase):
+    def test_cache(self):
+        algod = MagicMock()
+        algod.application_box_by_name.return_value = {
+            "value": b64encode(b"value").decode()
+        }
+        cache = InMemoryBoxCache()
+
+        self.assertEqual(get_raw_box_value(algod, 1, b"box", cache=cache), b"value")
+        self.assertEqual(get_raw_box_value(algod, 1, b"box", cache=cache), b"value")
+        self.assertEqual(algod.application_box_by_name.call_count, 1)
+
+        self.assertEqual(get_raw_box_value(algod, 1, b"box"), b"value")
+        self.assertEqual(algod.application_box_by_name.call_count, 2)
+
+    def test_box_not_found(self):
+        algod = MagicMock()
+        algod.application_box_by_name.side_effect = AlgodHTTPError("box not found", 404)
+        cache = InMemoryBoxCache()
+
+        self.assertIsNone(get_raw_box_value(algod, 1, b"box", cache=cache))
+        self.assertEqual(len(cache), 0)
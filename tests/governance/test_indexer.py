@@ -0,0 +1,229 @@
+import json
+import tempfile
+from base64 import b64encode
+from pathlib import Path
+from unittest import TestCase
+
+from algosdk.account import generate_account
+
+from tinyman.governance.indexer import GovernanceIndexer, GovernanceIndexStore
+from tinyman.governance.proposal_voting.events import (
+    event_cast_vote,
+    event_create_proposal,
+    event_proposal,
+)
+from tinyman.governance.proposal_voting.storage import Proposal
+from tinyman.governance.staking_voting import events as staking_voting_events
+from tinyman.governance.staking_voting.storage import StakingDistributionProposal
+
+PROPOSAL_VOTING_APP_ID = 10
+STAKING_VOTING_APP_ID = 20
+PROPOSAL_ID = "bafkreiaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+
+
+def make_transaction(txid, round, app_id, logs, inner_transactions=()):
+    return {
+        "id": txid,
+        "confirmed-round": round,
+        "application-transaction": {"application-id": app_id},
+        "logs": [b64encode(log).decode() for log in logs],
+        "inner-txns": list(inner_transactions),
+    }
+
+
+class GovernanceIndexerTestCase(TestCase):
+    def setUp(self):
+        self.user_address = generate_account()[1]
+        self.proposal = Proposal(
+            index=0,
+            creation_timestamp=1000,
+            voting_start_timestamp=2000,
+            voting_end_timestamp=3000,
+            snapshot_total_voting_power=100,
+            vote_count=0,
+            quorum_threshold=10,
+            against_voting_power=0,
+            for_voting_power=0,
+            abstain_voting_power=0,
+            is_approved=True,
+            is_cancelled=False,
+            is_executed=False,
+            is_quorum_reached=False,
+            proposer_address=self.user_address,
+            execution_hash=b"\x00" * 34,
+            executor_address=self.user_address,
+        )
+
+    def encode_proposal(self, proposal):
+        return event_proposal.encode(
+            [PROPOSAL_ID.encode()]
+            + [getattr(proposal, arg.name) for arg in event_proposal.args[1:]]
+        )
+
+    def get_transactions(self):
+        voted_proposal = Proposal(
+            **{**self.proposal.__dict__, "vote_count": 1, "for_voting_power": 40}
+        )
+        staking_proposal = StakingDistributionProposal(
+            index=3,
+            creation_timestamp=1000,
+            voting_start_timestamp=2000,
+            voting_end_timestamp=3000,
+            voting_power=50,
+            vote_count=1,
+            is_cancelled=False,
+        )
+        return (
+            [
+                make_transaction(
+                    "TX1",
+                    5,
+                    PROPOSAL_VOTING_APP_ID,
+                    [
+                        event_create_proposal.encode(
+                            [self.user_address, PROPOSAL_ID.encode()]
+                        ),
+                        self.encode_proposal(self.proposal),
+                    ],
+                ),
+                make_transaction(
+                    "TX2",
+                    6,
+                    PROPOSAL_VOTING_APP_ID,
+                    [
+                        event_cast_vote.encode(
+                            [self.user_address, PROPOSAL_ID.encode(), 1, 40]
+                        ),
+                        self.encode_proposal(voted_proposal),
+                    ],
+                ),
+                # A staking vote made by an inner transaction.
+                make_transaction(
+                    "TX3",
+                    6,
+                    99,
+                    [],
+                    inner_transactions=[
+                        make_transaction(
+                            None,
+                            6,
+                            STAKING_VOTING_APP_ID,
+                            [
+                                staking_voting_events.event_cast_vote.encode(
+                                    [self.user_address, PROPOSAL_ID.encode(), 50]
+                                ),
+                                staking_voting_events.event_vote.encode([7, 30, 60]),
+                                staking_voting_events.event_vote.encode([8, 20, 40]),
+                                staking_voting_events.event_proposal.encode(
+                                    [PROPOSAL_ID.encode()]
+                                    + list(staking_proposal.__dict__.values())
+                                ),
+                            ],
+                        )
+                    ],
+                ),
+            ],
+            voted_proposal,
+            staking_proposal,
+        )
+
+    def test_indexer(self):
+        transactions, voted_proposal, staking_proposal = self.get_transactions()
+        indexer = GovernanceIndexer(PROPOSAL_VOTING_APP_ID, STAKING_VOTING_APP_ID)
+        indexer.process_pages([{"transactions": transactions[:1]}])
+        self.assertEqual(
+            indexer.store.get_proposal(PROPOSAL_VOTING_APP_ID, PROPOSAL_ID),
+            self.proposal,
+        )
+
+        # Transactions that are already processed are skipped.
+        indexer.process_transactions(transactions)
+        indexer.process_transactions(transactions)
+        store = indexer.store
+
+        self.assertEqual(store.last_round, 6)
+        self.assertEqual(
+            store.get_proposals(PROPOSAL_VOTING_APP_ID), {PROPOSAL_ID: voted_proposal}
+        )
+        self.assertEqual(
+            store.get_proposal(STAKING_VOTING_APP_ID, PROPOSAL_ID), staking_proposal
+        )
+        self.assertEqual(len(store.votes), 2)
+        vote = store.get_votes(app_id=PROPOSAL_VOTING_APP_ID)[0]
+        self.assertEqual(
+            (vote.proposal_id, vote.user_address, vote.vote, vote.voting_power),
+            (PROPOSAL_ID, self.user_address, 1, 40),
+        )
+        vote = store.get_votes(app_id=STAKING_VOTING_APP_ID)[0]
+        self.assertEqual(vote.txid, "TX3")
+        self.assertEqual(vote.asset_votes, [(7, 30, 60), (8, 20, 40)])
+
+    def test_dump_and_store(self):
+        transactions, voted_proposal, staking_proposal = self.get_transactions()
+        with tempfile.TemporaryDirectory() as directory:
+            dump_path = Path(directory) / "pages.json"
+            dump_path.write_text(
+                json.dumps(
+                    [
+                        {"transactions": transactions[:2]},
+                        {"transactions": transactions[2:]},
+                    ]
+                )
+            )
+            indexer = GovernanceIndexer(PROPOSAL_VOTING_APP_ID, STAKING_VOTING_APP_ID)
+            indexer.load_dump(dump_path)
+
+            store_path = Path(directory) / "store.json"
+            indexer.store.save(store_path)
+            store = GovernanceIndexStore.load(store_path)
+
+        self.assertEqual(store, indexer.store)
+        self.assertTrue(store.is_processed(6, "TX3"))
+        self.assertFalse(store.is_processed(6, "TX4"))
+
+    def test_catch_up(self):
+        transactions, voted_proposal, staking_proposal = self.get_transactions()
+        indexer_client = FakeIndexerClient(transactions[:2])
+        indexer = GovernanceIndexer(PROPOSAL_VOTING_APP_ID, STAKING_VOTING_APP_ID)
+
+        indexer.catch_up(indexer_client, page_size=1)
+        self.assertEqual(len(indexer.store.votes), 1)
+
+        indexer_client.transactions = transactions
+        indexer.catch_up(indexer_client, page_size=1)
+        self.assertEqual(len(indexer.store.votes), 2)
+        self.assertEqual(
+            indexer.store.get_proposal(STAKING_VOTING_APP_ID, PROPOSAL_ID),
+            staking_proposal,
+        )
+        # Only the last processed round is searched again.
+        self.assertEqual({request[1] for request in indexer_client.requests[-2:]}, {6})
+
+
+class FakeIndexerClient:
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.requests = []
+
+    def search_transactions(self, application_id, min_round, limit, next_page):
+        self.requests.append((application_id, min_round))
+
+        def calls_app(transaction):
+            if (
+                transaction["application-transaction"]["application-id"]
+                == application_id
+            ):
+                return True
+            return any(calls_app(inner) for inner in transaction["inner-txns"])
+
+        transactions = [
+            transaction
+            for transaction in self.transactions
+            if calls_app(transaction)
+            and transaction["confirmed-round"] >= (min_round or 0)
+        ]
+        offset = int(next_page or 0)
+        page = {"transactions": transactions[offset : offset + limit]}
+        if offset + limit < len(transactions):
+            page["next-token"] = str(offset + limit)
+        return page
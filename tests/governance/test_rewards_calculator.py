@@ -0,0 +1,214 @@
+from unittest import TestCase
+
+from algosdk.account import generate_account
+from algosdk.encoding import decode_address
+
+from tests.governance import FakeAlgodClient
+from tests.governance.test_vault_snapshot import serialize_account_power
+from tinyman.governance.bitset import Bitset
+from tinyman.governance.box_cache import InMemoryBoxCache, set_default_box_cache
+from tinyman.governance.client import TinymanGovernanceClient
+from tinyman.governance.constants import WEEK
+from tinyman.governance.rewards.calculator import RewardsCalculator
+from tinyman.governance.rewards.constants import (
+    REWARD_CLAIM_SHEET_BOX_SIZE,
+    REWARD_PERIOD_BOX_ARRAY_LEN,
+)
+from tinyman.governance.rewards.storage import (
+    RewardPeriod,
+    get_account_reward_claim_sheet_box_name,
+    get_reward_period_box_name,
+)
+from tinyman.governance.rewards.utils import calculate_reward_amount
+from tinyman.governance.vault.storage import (
+    AccountPower,
+    get_account_power_box_name,
+    get_account_state_box_name,
+)
+from tinyman.utils import int_to_bytes
+
+VAULT_APP_ID = 1
+REWARDS_APP_ID = 2
+FIRST_PERIOD_TIMESTAMP = 100 * WEEK
+
+
+class RewardsCalculatorTestCase(TestCase):
+    def setUp(self):
+        set_default_box_cache(InMemoryBoxCache())
+        self.algod = FakeAlgodClient()
+        self.client = TinymanGovernanceClient(
+            algod_client=self.algod,
+            tiny_asset_id=5,
+            vault_app_id=VAULT_APP_ID,
+            rewards_app_id=REWARDS_APP_ID,
+            staking_voting_app_id=3,
+            proposal_voting_app_id=4,
+        )
+        self.reward_periods = []
+        self.add_reward_periods(REWARD_PERIOD_BOX_ARRAY_LEN + 3)
+
+        self.addresses = [generate_account()[1] for _ in range(3)]
+        self.add_account(
+            self.addresses[0],
+            [
+                AccountPower(
+                    bias=10_000_000,
+                    timestamp=FIRST_PERIOD_TIMESTAMP + WEEK // 2,
+                    slope=2**64 // 10,
+                    cumulative_power=0,
+                )
+            ],
+        )
+        self.add_account(
+            self.addresses[1],
+            [
+                AccountPower(
+                    bias=2_000_000,
+                    timestamp=FIRST_PERIOD_TIMESTAMP - WEEK,
+                    slope=2**64 // 1000,
+                    cumulative_power=0,
+                ),
+                AccountPower(
+                    bias=30_000_000,
+                    timestamp=FIRST_PERIOD_TIMESTAMP + 3 * WEEK,
+                    slope=2**64 // 20,
+                    cumulative_power=1_000_000_000_000,
+                ),
+            ],
+        )
+        # Period 1 is claimed.
+        self.algod.boxes[
+            (
+                REWARDS_APP_ID,
+                get_account_reward_claim_sheet_box_name(self.addresses[1], 0),
+            )
+        ] = Bitset.from_indexes([1], REWARD_CLAIM_SHEET_BOX_SIZE * 8).value
+
+    def tearDown(self):
+        set_default_box_cache(None)
+
+    def add_reward_periods(self, count):
+        for _ in range(count):
+            i = len(self.reward_periods)
+            self.reward_periods.append(
+                RewardPeriod(
+                    total_reward_amount=1_000_000_000 + i,
+                    total_cumulative_power_delta=10**15 * (i + 1),
+                )
+            )
+        for box_index in range(
+            0, len(self.reward_periods), REWARD_PERIOD_BOX_ARRAY_LEN
+        ):
+            rows = self.reward_periods[
+                box_index : box_index + REWARD_PERIOD_BOX_ARRAY_LEN
+            ]
+            raw_box = b"".join(
+                int_to_bytes(row.total_reward_amount)
+                + int_to_bytes(row.total_cumulative_power_delta, 16)
+                for row in rows
+            )
+            raw_box += b"\x00" * (1008 - len(raw_box))
+            box_name = get_reward_period_box_name(
+                box_index // REWARD_PERIOD_BOX_ARRAY_LEN
+            )
+            self.algod.boxes[(REWARDS_APP_ID, box_name)] = raw_box
+        self.algod.set_global_state(
+            REWARDS_APP_ID,
+            {
+                "tiny_asset_id": 5,
+                "vault_app_id": VAULT_APP_ID,
+                "reward_history_count": 1,
+                "reward_period_count": len(self.reward_periods),
+                "first_period_timestamp": FIRST_PERIOD_TIMESTAMP,
+                "manager": decode_address(generate_account()[1]),
+                "rewards_manager": decode_address(generate_account()[1]),
+            },
+        )
+
+    def add_account(self, address, powers):
+        self.algod.boxes[(VAULT_APP_ID, get_account_state_box_name(address))] = (
+            int_to_bytes(1_000_000)
+            + int_to_bytes(0)
+            + int_to_bytes(len(powers))
+            + int_to_bytes(0)
+        )
+        raw_box = b"".join(serialize_account_power(power) for power in powers)
+        raw_box += b"\x00" * (1008 - len(raw_box))
+        self.algod.boxes[
+            (VAULT_APP_ID, get_account_power_box_name(address, 0))
+        ] = raw_box
+
+    def get_expected_pending_rewards(self, address, claimed_period_indexes=()):
+        expected = []
+        for period_index, reward_period in enumerate(self.reward_periods):
+            if period_index in claimed_period_indexes:
+                continue
+            start = FIRST_PERIOD_TIMESTAMP + period_index * WEEK
+            delta = self.client.get_cumulative_tiny_power(
+                address, start + WEEK
+            ) - self.client.get_cumulative_tiny_power(address, start)
+            if delta:
+                expected.append(
+                    (period_index, delta, calculate_reward_amount(delta, reward_period))
+                )
+        return expected
+
+    def test_get_pending_rewards_of(self):
+        calculator = RewardsCalculator(self.algod, REWARDS_APP_ID, VAULT_APP_ID)
+        pending_rewards = calculator.get_pending_rewards_of(self.addresses)
+
+        self.assertEqual(len(calculator.reward_periods), len(self.reward_periods))
+        self.assertEqual(pending_rewards[self.addresses[2]], [])
+        for address, claimed_period_indexes in (
+            (self.addresses[0], ()),
+            (self.addresses[1], (1,)),
+        ):
+            expected = self.get_expected_pending_rewards(
+                address, claimed_period_indexes
+            )
+            self.assertTrue(expected)
+            self.assertEqual(
+                [
+                    (
+                        pending_reward.period_index,
+                        pending_reward.account_cumulative_power_delta,
+                        pending_reward.reward_amount,
+                    )
+                    for pending_reward in pending_rewards[address]
+                ],
+                expected,
+            )
+        self.assertEqual(
+            self.client.get_pending_rewards(self.addresses[1]),
+            pending_rewards[self.addresses[1]],
+        )
+
+    def test_refresh_with_missing_reward_period_box(self):
+        box_name = get_reward_period_box_name(1)
+        raw_box = self.algod.boxes.pop((REWARDS_APP_ID, box_name))
+        calculator = RewardsCalculator(self.algod, REWARDS_APP_ID, VAULT_APP_ID)
+
+        # The periods end before the missing box.
+        self.assertEqual(
+            calculator.refresh(), self.reward_periods[:REWARD_PERIOD_BOX_ARRAY_LEN]
+        )
+
+        self.algod.boxes[(REWARDS_APP_ID, box_name)] = raw_box
+        self.assertEqual(calculator.refresh(), self.reward_periods)
+
+    def test_refresh(self):
+        calculator = RewardsCalculator(self.algod, REWARDS_APP_ID, VAULT_APP_ID)
+        self.assertEqual(calculator.refresh(), self.reward_periods)
+
+        self.algod.requests = []
+        self.add_reward_periods(REWARD_PERIOD_BOX_ARRAY_LEN)
+        self.assertEqual(calculator.refresh(), self.reward_periods)
+        # The full box is not fetched again.
+        self.assertEqual(
+            sorted(
+                request[2]
+                for request in self.algod.requests
+                if request[0] == "application_box_by_name"
+            ),
+            [get_reward_period_box_name(1), get_reward_period_box_name(2)],
+        )
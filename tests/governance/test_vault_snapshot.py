@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from algosdk.account import generate_account
+
+from tests.governance import FakeAlgodClient
+from tinyman.governance.client import TinymanGovernanceClient
+from tinyman.governance.vault.constants import ACCOUNT_POWER_BOX_ARRAY_LEN
+from tinyman.governance.vault.storage import (
+    AccountPower,
+    get_account_power_box_name,
+    get_account_state_box_name,
+    get_total_power_box_name,
+)
+from tinyman.governance.vault.snapshot import fetch_vault_snapshot
+from tinyman.utils import int_to_bytes
+
+VAULT_APP_ID = 1
+
+
+def serialize_account_power(account_power: AccountPower) -> bytes:
+    return (
+        int_to_bytes(account_power.bias)
+        + int_to_bytes(account_power.timestamp)
+        + int_to_bytes(account_power.slope, 16)
+        + int_to_bytes(account_power.cumulative_power, 16)
+    )
+
+
+class VaultSnapshotTestCase(TestCase):
+    def setUp(self):
+        self.algod = FakeAlgodClient()
+        self.algod.boxes[(VAULT_APP_ID, get_total_power_box_name(0))] = b"\x00" * 1008
+        self.client = TinymanGovernanceClient(
+            algod_client=self.algod,
+            tiny_asset_id=5,
+            vault_app_id=VAULT_APP_ID,
+            rewards_app_id=2,
+            staking_voting_app_id=3,
+            proposal_voting_app_id=4,
+        )
+        self.addresses = [generate_account()[1] for _ in range(3)]
+        # The first box of the first account is deleted.
+        self.add_account(self.addresses[0], power_count=30, deleted_power_count=21)
+        self.add_account(self.addresses[1], power_count=1, deleted_power_count=0)
+
+    def add_account(self, address, power_count, deleted_power_count):
+        powers = [
+            AccountPower(
+                bias=1_000_000 + i * 1000,
+                timestamp=1000 * (i + 1),
+                slope=2**64 // (i + 1),
+                cumulative_power=i * 10_000,
+            )
+            for i in range(power_count)
+        ]
+        self.algod.boxes[(VAULT_APP_ID, get_account_state_box_name(address))] = (
+            int_to_bytes(1_000_000)
+            + int_to_bytes(100_000)
+            + int_to_bytes(power_count)
+            + int_to_bytes(deleted_power_count)
+        )
+        for i in range(
+            deleted_power_count
+            // ACCOUNT_POWER_BOX_ARRAY_LEN
+            * ACCOUNT_POWER_BOX_ARRAY_LEN,
+            power_count,
+            ACCOUNT_POWER_BOX_ARRAY_LEN,
+        ):
+            rows = powers[i : i + ACCOUNT_POWER_BOX_ARRAY_LEN]
+            raw_box = b"".join(serialize_account_power(row) for row in rows)
+            raw_box += b"\x00" * (1008 - len(raw_box))
+            box_name = get_account_power_box_name(
+                address, i // ACCOUNT_POWER_BOX_ARRAY_LEN
+            )
+            self.algod.boxes[(VAULT_APP_ID, box_name)] = raw_box
+
+    def test_snapshot(self):
+        snapshot = fetch_vault_snapshot(self.algod, VAULT_APP_ID)
+
+        self.assertEqual(len(snapshot), 2)
+        self.assertEqual(sorted(snapshot.addresses), sorted(self.addresses[:2]))
+        self.assertEqual(len(snapshot.get_account_powers(self.addresses[0])), 9)
+        self.assertEqual(len(snapshot.get_account_powers(self.addresses[1])), 1)
+        self.assertEqual(
+            snapshot.get_account_state(self.addresses[0]),
+            self.client.fetch_account_state(self.addresses[0]),
+        )
+        self.assertIsNone(snapshot.get_account_state(self.addresses[2]))
+
+        timestamps = [0, 500, 1000, 1500, 21_999, 22_000, 25_500, 31_000, 40_000]
+        tiny_powers = snapshot.get_tiny_powers_at(self.addresses, timestamps)
+        cumulative_tiny_powers = snapshot.get_cumulative_tiny_powers_at(
+            self.addresses, timestamps
+        )
+        for i, address in enumerate(self.addresses):
+            for j, timestamp in enumerate(timestamps):
+                self.assertEqual(
+                    tiny_powers[i][j],
+                    self.client.get_tiny_power(address, timestamp),
+                )
+                self.assertEqual(
+                    cumulative_tiny_powers[i][j],
+                    self.client.get_cumulative_tiny_power(address, timestamp),
+                )
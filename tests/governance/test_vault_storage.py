@@ -0,0 +1,375 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from tests.governance import FakeAlgodClient
+from tinyman.governance.box_cache import InMemoryBoxCache, set_default_box_cache
+from tinyman.governance.client import TinymanGovernanceClient
+from tinyman.governance.constants import WEEK
+from tinyman.governance.vault.constants import TOTAL_POWER_BOX_ARRAY_LEN
+from tinyman.governance.vault.storage import (
+    AccountPower,
+    cumulative_powers_at,
+    get_power_index_at,
+    get_power_indexes_at,
+    get_power_timestamps,
+    get_powers_at,
+    parse_box_powers_into_columns,
+    parse_box_total_power,
+    get_slope_change_box_name,
+    PowerList,
+    SlopeChangeIndex,
+    TotalPowerHistory,
+    TotalPower,
+    get_total_power_box_name,
+    get_all_total_powers,
+)
+from tinyman.utils import int_to_bytes
+
+VAULT_APP_ID = 1
+
+
+def serialize_total_power(total_power: TotalPower) -> bytes:
+    return (
+        int_to_bytes(total_power.bias)
+        + int_to_bytes(total_power.timestamp)
+        + int_to_bytes(total_power.slope, 16)
+        + int_to_bytes(total_power.cumulative_power, 16)
+    )
+
+
+class VaultStorageTestCase(TestCase):
+    def setUp(self):
+        set_default_box_cache(InMemoryBoxCache())
+        self.algod = FakeAlgodClient()
+        self.total_powers = []
+
+    def tearDown(self):
+        set_default_box_cache(None)
+
+    def add_total_powers(self, count):
+        for _ in range(count):
+            i = len(self.total_powers)
+            self.total_powers.append(
+                TotalPower(
+                    bias=1000 + i,
+                    timestamp=100 * i,
+                    slope=10 + i,
+                    cumulative_power=i * i,
+                )
+            )
+        for box_index in range(0, len(self.total_powers), TOTAL_POWER_BOX_ARRAY_LEN):
+            rows = self.total_powers[box_index : box_index + TOTAL_POWER_BOX_ARRAY_LEN]
+            raw_box = b"".join(serialize_total_power(row) for row in rows)
+            raw_box += b"\x00" * (TOTAL_POWER_BOX_ARRAY_LEN * 48 - len(raw_box))
+            self.algod.boxes[
+                (
+                    VAULT_APP_ID,
+                    get_total_power_box_name(box_index // TOTAL_POWER_BOX_ARRAY_LEN),
+                )
+            ] = raw_box
+        self.algod.set_global_state(
+            VAULT_APP_ID,
+            {
+                "tiny_asset_id": 5,
+                "total_locked_amount": 0,
+                "total_power_count": len(self.total_powers),
+                "last_total_power_timestamp": 0,
+            },
+        )
+
+    def get_box_requests(self):
+        requests = [
+            request[2]
+            for request in self.algod.requests
+            if request[0] == "application_box_by_name"
+        ]
+        self.algod.requests = []
+        return requests
+
+    def test_total_power_history(self):
+        history = TotalPowerHistory(self.algod, VAULT_APP_ID)
+
+        self.add_total_powers(TOTAL_POWER_BOX_ARRAY_LEN + 5)
+        self.assertEqual(history.refresh(), self.total_powers)
+        self.assertEqual(
+            self.get_box_requests(),
+            [get_total_power_box_name(0), get_total_power_box_name(1)],
+        )
+
+        # Only the last box is read again.
+        self.assertEqual(history.refresh(len(self.total_powers)), self.total_powers)
+        self.assertEqual(self.get_box_requests(), [get_total_power_box_name(1)])
+
+        self.add_total_powers(TOTAL_POWER_BOX_ARRAY_LEN)
+        self.assertEqual(history.refresh(len(self.total_powers)), self.total_powers)
+        self.assertEqual(
+            self.get_box_requests(),
+            [get_total_power_box_name(1), get_total_power_box_name(2)],
+        )
+        self.assertEqual(
+            get_all_total_powers(self.algod, VAULT_APP_ID, len(self.total_powers)),
+            self.total_powers,
+        )
+
+    def test_total_power_history_timestamps(self):
+        history = TotalPowerHistory(self.algod, VAULT_APP_ID)
+        self.add_total_powers(TOTAL_POWER_BOX_ARRAY_LEN + 5)
+        old_total_powers = history.refresh()
+        self.add_total_powers(TOTAL_POWER_BOX_ARRAY_LEN)
+        total_powers = history.refresh(len(self.total_powers))
+
+        self.assertIsInstance(total_powers, PowerList)
+        self.assertEqual(history.timestamps, get_power_timestamps(self.total_powers))
+        self.assertEqual(
+            old_total_powers.timestamps, get_power_timestamps(old_total_powers)
+        )
+
+        timestamp = self.total_powers[TOTAL_POWER_BOX_ARRAY_LEN].timestamp
+        with patch(
+            "tinyman.governance.vault.storage.get_power_timestamps"
+        ) as get_power_timestamps_mock:
+            self.assertEqual(
+                get_power_index_at(total_powers, timestamp), TOTAL_POWER_BOX_ARRAY_LEN
+            )
+        # The timestamps of the history are used, they are not rebuilt.
+        get_power_timestamps_mock.assert_not_called()
+
+    def test_total_power_history_full_box(self):
+        history = TotalPowerHistory(self.algod, VAULT_APP_ID)
+
+        self.add_total_powers(TOTAL_POWER_BOX_ARRAY_LEN)
+        self.assertEqual(history.refresh(len(self.total_powers)), self.total_powers)
+        self.get_box_requests()
+
+        self.add_total_powers(1)
+        self.assertEqual(history.refresh(len(self.total_powers)), self.total_powers)
+        # The full box is immutable and served from the cache.
+        self.assertEqual(self.get_box_requests(), [get_total_power_box_name(1)])
+
+    def test_parse_box_powers_into_columns(self):
+        self.add_total_powers(TOTAL_POWER_BOX_ARRAY_LEN + 5)
+        self.total_powers[-1].slope = 2**127 + 3
+        self.total_powers[-1].cumulative_power = 2**100
+        self.add_total_powers(0)
+        raw_boxes = [
+            self.algod.boxes[(VAULT_APP_ID, get_total_power_box_name(i))]
+            for i in range(2)
+        ]
+
+        columns = parse_box_powers_into_columns(raw_boxes[0])
+        parse_box_powers_into_columns(raw_boxes[1], columns)
+        self.assertEqual(len(columns), len(self.total_powers))
+        self.assertEqual(
+            [
+                TotalPower(*row)
+                for row in zip(
+                    columns.biases,
+                    columns.timestamps,
+                    columns.slopes,
+                    columns.cumulative_powers,
+                )
+            ],
+            self.total_powers,
+        )
+        self.assertEqual(
+            parse_box_total_power(raw_boxes[0]) + parse_box_total_power(raw_boxes[1]),
+            self.total_powers,
+        )
+        # The first power has a zero timestamp, only an empty row ends the array.
+        self.assertEqual(self.total_powers[0].timestamp, 0)
+        self.assertEqual(len(parse_box_powers_into_columns(b"\x00" * 48 * 2)), 0)
+
+    def test_slope_change_index(self):
+        # Slope changes of future weeks are not cached.
+        base_timestamp = (int(time.time()) // WEEK + 10) * WEEK
+        for week, slope_delta in [(2, 3), (0, 1), (1, 2)]:
+            self.algod.boxes[
+                (VAULT_APP_ID, get_slope_change_box_name(base_timestamp + week * WEEK))
+            ] = int_to_bytes(slope_delta, 16)
+        self.add_total_powers(1)
+
+        index = SlopeChangeIndex(self.algod, VAULT_APP_ID)
+        self.assertEqual(
+            index.refresh(),
+            {
+                base_timestamp + 0 * WEEK: 1,
+                base_timestamp + 1 * WEEK: 2,
+                base_timestamp + 2 * WEEK: 3,
+            },
+        )
+        self.assertEqual(
+            index.timestamps,
+            [
+                base_timestamp + 0 * WEEK,
+                base_timestamp + 1 * WEEK,
+                base_timestamp + 2 * WEEK,
+            ],
+        )
+        # Only the slope change boxes are fetched.
+        self.assertEqual(len(self.get_box_requests()), 3)
+
+        self.assertEqual(index.get_slope_delta(base_timestamp + 1 * WEEK), 2)
+        self.assertEqual(index.get_slope_delta(base_timestamp + 3 * WEEK), 0)
+        self.assertEqual(
+            index.get_slope_changes_between(
+                base_timestamp + 0 * WEEK, base_timestamp + 2 * WEEK
+            ),
+            [(base_timestamp + 1 * WEEK, 2), (base_timestamp + 2 * WEEK, 3)],
+        )
+
+        self.algod.boxes[
+            (VAULT_APP_ID, get_slope_change_box_name(base_timestamp + 2 * WEEK))
+        ] = int_to_bytes(5, 16)
+        index.refresh(start_timestamp=base_timestamp + 2 * WEEK)
+        self.assertEqual(
+            self.get_box_requests(),
+            [get_slope_change_box_name(base_timestamp + 2 * WEEK)],
+        )
+        self.assertEqual(
+            index.slope_deltas,
+            {
+                base_timestamp + 0 * WEEK: 1,
+                base_timestamp + 1 * WEEK: 2,
+                base_timestamp + 2 * WEEK: 5,
+            },
+        )
+
+    def test_slope_change_index_cache(self):
+        past_timestamp = (int(time.time()) // WEEK - 2) * WEEK
+        box_name = get_slope_change_box_name(past_timestamp)
+        self.algod.boxes[(VAULT_APP_ID, box_name)] = int_to_bytes(1, 16)
+
+        # Slope changes are not written to the default box cache unless it is asked for.
+        SlopeChangeIndex(self.algod, VAULT_APP_ID).refresh()
+        SlopeChangeIndex(self.algod, VAULT_APP_ID).refresh()
+        self.assertEqual(self.get_box_requests(), [box_name, box_name])
+
+        cache = InMemoryBoxCache()
+        index = SlopeChangeIndex(self.algod, VAULT_APP_ID, cache=cache)
+        index.refresh()
+        index.refresh()
+        self.assertEqual(self.get_box_requests(), [box_name])
+        self.assertEqual(cache.get(VAULT_APP_ID, box_name), int_to_bytes(1, 16))
+
+    def test_get_total_tiny_power_in_future(self):
+        self.total_powers = [
+            TotalPower(
+                bias=3 * WEEK, timestamp=10 * WEEK, slope=2**64, cumulative_power=0
+            )
+        ]
+        self.add_total_powers(0)
+        self.algod.boxes[
+            (VAULT_APP_ID, get_slope_change_box_name(11 * WEEK))
+        ] = int_to_bytes(2**63, 16)
+        client = TinymanGovernanceClient(
+            algod_client=self.algod,
+            tiny_asset_id=5,
+            vault_app_id=VAULT_APP_ID,
+            rewards_app_id=2,
+            staking_voting_app_id=3,
+            proposal_voting_app_id=4,
+        )
+
+        self.assertEqual(client.get_total_tiny_power(10 * WEEK + 100), 3 * WEEK - 100)
+        self.assertEqual(
+            client.get_total_tiny_power(13 * WEEK), 3 * WEEK - WEEK - 2 * WEEK // 2
+        )
+        slope_change_requests = [
+            name
+            for name in self.get_box_requests()
+            if name.startswith(get_slope_change_box_name(0)[:2])
+        ]
+        self.assertEqual(slope_change_requests, [get_slope_change_box_name(11 * WEEK)])
+
+        def get_listing_request_count():
+            count = len([r for r in self.algod.requests if r[0] == "application_boxes"])
+            self.algod.requests = []
+            return count
+
+        # By default every call refreshes the slope changes.
+        client.get_total_tiny_power(13 * WEEK)
+        self.assertEqual(get_listing_request_count(), 1)
+
+        # The slope changes of the range are fresh.
+        client.slope_change_index.max_age = 60
+        client.get_total_tiny_power(13 * WEEK)
+        client.get_total_tiny_power(12 * WEEK)
+        self.assertEqual(get_listing_request_count(), 0)
+
+        # The range is not covered.
+        client.get_total_tiny_power(14 * WEEK)
+        self.assertEqual(get_listing_request_count(), 1)
+        client.get_total_tiny_power(13 * WEEK)
+        self.assertEqual(get_listing_request_count(), 0)
+
+        # The last refresh expired.
+        client.slope_change_index.max_age = 0
+        client.get_total_tiny_power(13 * WEEK)
+        self.assertEqual(get_listing_request_count(), 1)
+
+
+class PowerIndexTestCase(TestCase):
+    def setUp(self):
+        self.powers = [
+            AccountPower(
+                bias=1_000_000, timestamp=0, slope=2**64, cumulative_power=0
+            ),
+            AccountPower(
+                bias=2_000_000, timestamp=100, slope=2**64, cumulative_power=50_000
+            ),
+            AccountPower(
+                bias=2_000_000, timestamp=100, slope=2**64, cumulative_power=50_000
+            ),
+            AccountPower(
+                bias=500_000, timestamp=1_000, slope=2**63, cumulative_power=900_000
+            ),
+        ]
+
+    def get_power_index_at_linear(self, timestamp):
+        power_index = None
+        for index, power in enumerate(self.powers):
+            if timestamp >= power.timestamp:
+                power_index = index
+            else:
+                break
+        return power_index
+
+    def test_get_power_index_at(self):
+        timestamps = [-1, 0, 1, 99, 100, 101, 999, 1_000, 5_000]
+        expected = [self.get_power_index_at_linear(t) for t in timestamps]
+
+        self.assertEqual(
+            [get_power_index_at(self.powers, t) for t in timestamps], expected
+        )
+        power_timestamps = get_power_timestamps(self.powers)
+        self.assertEqual(
+            [
+                get_power_index_at(self.powers, t, timestamps=power_timestamps)
+                for t in timestamps
+            ],
+            expected,
+        )
+        self.assertEqual(get_power_indexes_at(self.powers, timestamps), expected)
+        self.assertEqual(
+            get_power_indexes_at(self.powers, timestamps[::-1]), expected[::-1]
+        )
+        self.assertIsNone(get_power_index_at([], 10))
+
+    def test_powers_at(self):
+        timestamps = [5_000, -1, 50, 100, 1_500]
+
+        self.assertEqual(
+            get_powers_at(self.powers, timestamps),
+            [498_000, 0, 999_950, 2_000_000, 499_750],
+        )
+        self.assertEqual(
+            cumulative_powers_at(self.powers, timestamps),
+            [
+                self.powers[3].cumulative_power_at(5_000),
+                0,
+                self.powers[0].cumulative_power_at(50),
+                self.powers[2].cumulative_power_at(100),
+                self.powers[3].cumulative_power_at(1_500),
+            ],
+        )
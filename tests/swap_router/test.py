@@ -10,6 +10,7 @@ from algosdk.v2client.algod import AlgodClient
 from tests import get_suggested_params
 from tinyman.assets import Asset, AssetAmount
 from tinyman.compat import OnComplete
+from tinyman.swap_router.graph import PoolGraph
 from tinyman.swap_router.routes import (
     Route,
     get_best_fixed_input_route,
@@ -304,6 +305,67 @@ class RouteTestCase(BaseTestCase):
         self.assertEqual(first_quote.amount_in.amount, 40243)
 
 
+class PoolGraphTestCase(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.graph = PoolGraph([self.pool, self.pool_1, self.pool_2])
+
+    def test_get_routes(self):
+        routes = self.graph.get_routes(self.asset_in.id, self.asset_out.id)
+        self.assertEqual(
+            [route.pools for route in routes],
+            [[self.pool], [self.pool_1, self.pool_2]],
+        )
+        self.assertEqual(routes[0].asset_in.id, self.asset_in.id)
+        self.assertEqual(routes[0].asset_out.id, self.asset_out.id)
+
+        routes = self.graph.get_routes(self.asset_in, self.asset_out, max_hops=1)
+        self.assertEqual(routes, [self.direct_route])
+
+        self.assertEqual(self.graph.get_routes(self.asset_in.id, 999), [])
+
+    def test_add_pool_replaces_the_same_pool(self):
+        pool = V2Pool.from_state(
+            address=self.pool.address,
+            state=self.get_pool_state(
+                asset_1_id=self.asset_in.id,
+                asset_2_id=self.asset_out.id,
+                pool_token_asset_id=3,
+                issued_pool_tokens=10_000,
+            ),
+            round_number=101,
+            client=self.get_tinyman_client(),
+        )
+        self.graph.add_pool(pool)
+
+        self.assertEqual(
+            self.graph.get_pools(self.asset_in.id, self.asset_out.id), [pool]
+        )
+        self.assertEqual(
+            self.graph.get_pools(self.asset_out.id, self.asset_in.id), [pool]
+        )
+
+    def test_best_routes(self):
+        with patch("algosdk.v2client.algod.AlgodClient.account_info") as account_info:
+            best_route = self.graph.get_best_fixed_input_route(
+                self.asset_in.id, self.asset_out.id, amount_in=10_000
+            )
+            self.assertEqual(best_route.pools, [self.pool_1, self.pool_2])
+
+            best_route = self.graph.get_best_fixed_output_route(
+                self.asset_in.id, self.asset_out.id, amount_out=10_000
+            )
+            self.assertEqual(best_route.pools, [self.pool_1, self.pool_2])
+
+            self.graph.remove_pool(self.pool_2)
+            best_route = self.graph.get_best_fixed_input_route(
+                self.asset_in.id, self.asset_out.id, amount_in=10_000
+            )
+            self.assertEqual(best_route.pools, [self.pool])
+
+        account_info.assert_not_called()
+
+
 class SwapRouterTransactionsTestCase(BaseTestCase):
     def test_prepare_swap_router_asset_opt_in_transaction(self):
         sp = self.get_suggested_params()
@@ -0,0 +1,158 @@
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from algosdk.error import AlgodHTTPError
+
+from tests.governance import FakeAlgodClient
+from tinyman.box_cache import InMemoryBoxCache
+from tinyman.boxes import BoxReader, get_app_box_values, get_box_values
+from tinyman.exceptions import BoxNotFound
+from tinyman.governance.client import TinymanGovernanceClient
+from tinyman.ordering.base_client import BaseClient
+
+APP_ID = 1
+
+
+class BoxesTestCase(TestCase):
+    def setUp(self):
+        self.algod = FakeAlgodClient()
+        for i in range(20):
+            self.algod.boxes[(APP_ID, b"box%d" % i)] = b"value%d" % i
+
+    def get_box_requests(self):
+        requests = [
+            request[2]
+            for request in self.algod.requests
+            if request[0] == "application_box_by_name"
+        ]
+        self.algod.requests = []
+        return requests
+
+    def get_listing_requests(self):
+        requests = [
+            request
+            for request in self.algod.requests
+            if request[0] == "application_boxes"
+        ]
+        self.algod.requests = [
+            request
+            for request in self.algod.requests
+            if request[0] != "application_boxes"
+        ]
+        return requests
+
+    def test_get_box_values(self):
+        box_names = [b"box%d" % i for i in range(19, -1, -1)] + [b"missing"]
+        self.assertEqual(
+            get_box_values(self.algod, APP_ID, box_names),
+            [b"value%d" % i for i in range(19, -1, -1)] + [None],
+        )
+        self.assertEqual(sorted(self.get_box_requests()), sorted(box_names))
+
+        cache = InMemoryBoxCache()
+        get_box_values(self.algod, APP_ID, box_names[:5], cache=cache)
+        self.get_box_requests()
+        self.assertEqual(
+            get_box_values(self.algod, APP_ID, box_names[:5], cache=cache),
+            [b"value%d" % i for i in range(19, 14, -1)],
+        )
+        self.assertEqual(self.get_box_requests(), [])
+
+    def test_get_app_box_values(self):
+        self.algod.boxes[(APP_ID + 1, b"box0")] = b"other"
+        boxes = [(APP_ID + 1, b"box0"), (APP_ID, b"box0"), (APP_ID, b"missing")]
+        self.assertEqual(
+            get_app_box_values(self.algod, boxes), [b"other", b"value0", None]
+        )
+        self.assertEqual(get_app_box_values(self.algod, []), [])
+
+    def test_box_reader(self):
+        reader = BoxReader(self.algod, cache=InMemoryBoxCache())
+
+        self.assertEqual(
+            reader.get_boxes(APP_ID, [b"box1", b"box2", b"box1", b"missing"]),
+            {b"box1": b"value1", b"box2": b"value2", b"missing": None},
+        )
+
+        self.assertEqual(self.get_box_requests(), [b"box1", b"box2", b"missing"])
+
+        # A single lookup per check by default.
+        self.assertTrue(reader.box_exists(APP_ID, b"box1"))
+        self.assertFalse(reader.box_exists(APP_ID, b"new"))
+        self.assertEqual(self.get_listing_requests(), [])
+        self.assertEqual(self.get_box_requests(), [b"box1", b"new"])
+
+        reader.get_box(APP_ID, b"box3", cache=True)
+        self.assertEqual(reader.get_box(APP_ID, b"box3", cache=True), b"value3")
+        self.assertEqual(self.get_box_requests(), [b"box3"])
+
+    def test_box_reader_box_names(self):
+        reader = BoxReader(self.algod, cache_box_names=True)
+
+        self.assertTrue(reader.box_exists(APP_ID, b"box1"))
+        self.assertFalse(reader.box_exists(APP_ID, b"new"))
+        self.algod.boxes[(APP_ID, b"new")] = b""
+        # The box name listing is cached.
+        self.assertFalse(reader.box_exists(APP_ID, b"new"))
+        self.assertEqual(self.get_listing_requests(), [("application_boxes", APP_ID)])
+        reader.invalidate_box_names(APP_ID)
+        self.assertTrue(reader.box_exists(APP_ID, b"new"))
+        self.assertEqual(self.get_listing_requests(), [("application_boxes", APP_ID)])
+        # Box values are not downloaded to check if they exist.
+        self.assertEqual(self.get_box_requests(), [])
+
+    def test_base_client(self):
+        client = BaseClient(self.algod, APP_ID, user_address=None, user_sk=None)
+
+        self.assertTrue(client.box_exists(b"box1"))
+        self.assertFalse(client.box_exists(b"missing"))
+        # The boxes of the app are not listed to check if a box exists.
+        self.assertEqual(self.get_listing_requests(), [])
+        self.assertEqual(self.get_box_requests(), [b"box1", b"missing"])
+
+    def test_base_client_errors(self):
+        client = BaseClient(self.algod, APP_ID, user_address=None, user_sk=None)
+
+        with self.assertRaises(BoxNotFound) as context:
+            client.get_box(b"missing", "TriggerOrder")
+        # Callers of the previous versions catch AlgodHTTPError.
+        self.assertIsInstance(context.exception, AlgodHTTPError)
+        self.assertEqual(context.exception.code, 404)
+        self.assertEqual(context.exception.box_name, b"missing")
+
+        # Like the previous versions, box_exists does not raise.
+        with patch.object(
+            self.algod,
+            "application_box_by_name",
+            side_effect=AlgodHTTPError("internal error", 500),
+        ):
+            self.assertFalse(client.box_exists(b"box1"))
+            with self.assertRaises(AlgodHTTPError):
+                client.boxes.box_exists(APP_ID, b"box1")
+
+    def test_governance_client_submit(self):
+        client = TinymanGovernanceClient(
+            algod_client=self.algod,
+            tiny_asset_id=5,
+            vault_app_id=APP_ID,
+            rewards_app_id=2,
+            staking_voting_app_id=3,
+            proposal_voting_app_id=4,
+        )
+        client.boxes = BoxReader(self.algod, cache_box_names=True)
+        client.boxes.box_exists(APP_ID, b"box1")
+        cached_app_ids = []
+
+        def wait_for_confirmation(algod, txid):
+            cached_app_ids.extend(client.boxes.box_names)
+            return {"confirmed-round": 10}
+
+        with patch(
+            "tinyman.governance.client.wait_for_confirmation", wait_for_confirmation
+        ):
+            client.submit(SimpleNamespace(signed_transactions=[b""]), wait=True)
+
+        # The listing is invalidated once the transactions are confirmed.
+        self.assertEqual(cached_app_ids, [APP_ID])
+        self.assertEqual(client.boxes.box_names, {})
@@ -0,0 +1,305 @@
+import random
+from base64 import b64encode
+from unittest import TestCase
+
+import msgpack
+from algosdk import abi, transaction
+from algosdk.account import generate_account
+
+from tinyman.event import (
+    Event,
+    EventRegistry,
+    decode_logs,
+    iter_block_events,
+    iter_transaction_events,
+)
+from tinyman.governance import event as governance_event
+from tinyman.governance.proposal_voting.events import (
+    proposal_voting_event_registry,
+    proposal_voting_events,
+)
+from tinyman.governance.rewards.events import rewards_event_registry, rewards_events
+from tinyman.governance.staking_voting.events import (
+    staking_voting_event_registry,
+    staking_voting_events,
+)
+from tinyman.governance.vault.events import vault_event_registry, vault_events
+from tinyman.liquid_staking.events import (
+    restaking_event_registry,
+    restaking_events,
+    talgo_event_registry,
+    talgo_events,
+)
+from tinyman.ordering.events import (
+    ordering_event_registry,
+    ordering_events,
+    registry_event_registry,
+    registry_events,
+)
+
+EVENT_LISTS = [
+    proposal_voting_events,
+    rewards_events,
+    staking_voting_events,
+    vault_events,
+    restaking_events,
+    talgo_events,
+    ordering_events,
+    registry_events,
+]
+
+event_string_array = Event(
+    name="string_array",
+    args=[
+        abi.Argument(arg_type="uint64", name="id"),
+        abi.Argument(arg_type="string", name="note"),
+        abi.Argument(arg_type="uint64[]", name="values"),
+        abi.Argument(arg_type="bool", name="flag"),
+    ],
+)
+
+
+def generate_value(arg_type):
+    if isinstance(arg_type, abi.UintType):
+        return random.getrandbits(arg_type.bit_size)
+    if isinstance(arg_type, abi.ByteType):
+        return random.getrandbits(8)
+    if isinstance(arg_type, abi.BoolType):
+        return random.choice([True, False])
+    if isinstance(arg_type, abi.AddressType):
+        return generate_account()[1]
+    if isinstance(arg_type, abi.ArrayStaticType) and isinstance(
+        arg_type.child_type, abi.ByteType
+    ):
+        return bytes(random.getrandbits(8) for _ in range(arg_type.static_length))
+    if isinstance(arg_type, abi.StringType):
+        return "".join(random.choices("abcdef", k=random.randint(0, 8)))
+    if isinstance(arg_type, abi.ArrayDynamicType):
+        return [
+            generate_value(arg_type.child_type) for _ in range(random.randint(0, 4))
+        ]
+    raise NotImplementedError(arg_type)
+
+
+def decode_generic(event, log):
+    # Decodes every argument with the ABI type.
+    data = {"event_name": event.name}
+    start = 4
+    for arg in event.args:
+        if arg.type.is_dynamic():
+            length = int.from_bytes(log[start : start + 2], "big")
+            if isinstance(arg.type, abi.ArrayDynamicType):
+                length *= arg.type.child_type.byte_len()
+            end = start + 2 + length
+        else:
+            end = start + arg.type.byte_len()
+        value = arg.type.decode(log[start:end])
+        if isinstance(arg.type, abi.ArrayStaticType):
+            value = bytes(value)
+        data[arg.name] = value
+        start = end
+    return data
+
+
+class EventTestCase(TestCase):
+    def setUp(self):
+        random.seed(0)
+
+    def test_decode_all_events(self):
+        for events in EVENT_LISTS:
+            registry = EventRegistry(events)
+            self.assertEqual(len(registry), len(events))
+            logs = [
+                event.encode([generate_value(arg.type) for arg in event.args])
+                for event in events
+            ]
+
+            expected = [decode_generic(event, log) for event, log in zip(events, logs)]
+            self.assertEqual(list(registry.iter_decode(logs)), expected)
+            self.assertEqual(decode_logs(logs, events), expected)
+            self.assertEqual(
+                [event.decode(log) for event, log in zip(events, logs)], expected
+            )
+
+    def test_module_registries(self):
+        for events, registry in [
+            (proposal_voting_events, proposal_voting_event_registry),
+            (rewards_events, rewards_event_registry),
+            (staking_voting_events, staking_voting_event_registry),
+            (vault_events, vault_event_registry),
+            (restaking_events, restaking_event_registry),
+            (talgo_events, talgo_event_registry),
+            (ordering_events, ordering_event_registry),
+            (registry_events, registry_event_registry),
+        ]:
+            self.assertEqual(list(registry), events)
+            logs = [
+                event.encode([generate_value(arg.type) for arg in event.args])
+                for event in events
+            ]
+            self.assertEqual(decode_logs(logs, registry), decode_logs(logs, events))
+            self.assertEqual(
+                governance_event.decode_logs(logs, registry),
+                decode_logs(logs, events),
+            )
+
+    def test_dynamic_arguments(self):
+        log = event_string_array.encode([7, "note", [1, 2, 3], True])
+        self.assertFalse(event_string_array.decoder_plan.is_static)
+        self.assertEqual(
+            event_string_array.decode(log),
+            {
+                "event_name": "string_array",
+                "id": 7,
+                "note": "note",
+                "values": [1, 2, 3],
+                "flag": True,
+            },
+        )
+
+    def test_unknown_events(self):
+        event = vault_events[0]
+        log = event.encode([generate_value(arg.type) for arg in event.args])
+        unknown_log = b"\x00\x00\x00\x00"
+        registry = EventRegistry([event])
+
+        self.assertIsNone(registry.get_event(unknown_log))
+        self.assertEqual(len(list(registry.iter_decode([unknown_log, log]))), 1)
+        with self.assertRaises(ValueError):
+            list(registry.iter_decode([unknown_log], skip_unknown=False))
+        with self.assertRaises(AssertionError):
+            governance_event.decode_logs([unknown_log], [event])
+
+    def test_selector_collision(self):
+        other_event = Event(name=event_string_array.name, args=[])
+        other_event.__dict__["selector"] = event_string_array.selector
+        with self.assertRaises(ValueError):
+            EventRegistry([event_string_array, other_event])
+
+
+class EventStreamTestCase(TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.vault_app_id = 10
+        self.other_app_id = 20
+        self.vault_logs = [
+            event.encode([generate_value(arg.type) for arg in event.args])
+            for event in vault_events
+        ]
+        self.registries = {self.vault_app_id: vault_events}
+
+    def get_indexer_transaction(self, round, txid, app_id, logs, inner_txns=()):
+        return {
+            "id": txid,
+            "confirmed-round": round,
+            "group": "Z3JvdXA=",
+            "application-transaction": {"application-id": app_id},
+            "logs": [b64encode(log).decode() for log in logs],
+            "inner-txns": list(inner_txns),
+        }
+
+    def test_iter_transaction_events(self):
+        inner_txn = self.get_indexer_transaction(
+            None, None, self.vault_app_id, self.vault_logs[1:3]
+        )
+        del inner_txn["id"], inner_txn["confirmed-round"], inner_txn["group"]
+        transactions = [
+            self.get_indexer_transaction(
+                1, "A", self.vault_app_id, self.vault_logs[:1], [inner_txn]
+            ),
+            self.get_indexer_transaction(1, "B", self.other_app_id, self.vault_logs),
+            self.get_indexer_transaction(
+                2, "C", self.vault_app_id, [b"unknown"] + self.vault_logs[3:4]
+            ),
+        ]
+        # Not grouped
+        del transactions[2]["group"]
+
+        records = list(iter_transaction_events(iter(transactions), self.registries))
+        self.assertEqual(
+            [
+                (r.round, r.txid, r.group_index, r.inner_path, r.log_index)
+                for r in records
+            ],
+            [
+                (1, "A", None, (), 0),
+                (1, "A", None, (0,), 0),
+                (1, "A", None, (0,), 1),
+                (2, "C", 0, (), 1),
+            ],
+        )
+        self.assertEqual(
+            [record.data for record in records],
+            [vault_events[i].decode(self.vault_logs[i]) for i in range(4)],
+        )
+        self.assertEqual(records[0].event_name, vault_events[0].name)
+
+        with self.assertRaises(ValueError):
+            list(
+                iter_transaction_events(
+                    transactions, self.registries, skip_unknown=False
+                )
+            )
+
+    def test_iter_block_events(self):
+        _, address = generate_account()
+        genesis_hash = bytes(range(32))
+        sp = transaction.SuggestedParams(
+            fee=1000,
+            first=100,
+            last=1100,
+            gh=b64encode(genesis_hash).decode(),
+            gen="testnet-v1.0",
+            flat_fee=True,
+        )
+        txns = [
+            transaction.ApplicationNoOpTxn(address, sp, self.other_app_id),
+            transaction.ApplicationNoOpTxn(
+                address, sp, self.vault_app_id, app_args=[b"x"]
+            ),
+        ]
+        transaction.assign_group_id(txns)
+
+        block_txns = []
+        for txn, logs in zip(txns, [self.vault_logs[:1], self.vault_logs[1:2]]):
+            txn_dict = {
+                key: value
+                for key, value in txn.dictify().items()
+                if key not in ("gen", "gh") and value
+            }
+            block_txns.append(
+                {
+                    "txn": txn_dict,
+                    "hgi": True,
+                    "dt": {
+                        "lg": [b"unknown"],
+                        "itx": [
+                            {
+                                "txn": {"type": "appl", "apid": self.vault_app_id},
+                                "dt": {"lg": logs},
+                            }
+                        ],
+                    },
+                }
+            )
+        block = {
+            "rnd": 100,
+            "gen": "testnet-v1.0",
+            "gh": genesis_hash,
+            "txns": block_txns,
+        }
+        # Same types as a block fetched in msgpack format
+        block = msgpack.unpackb(msgpack.packb({"block": block}), raw=False)
+
+        records = list(iter_block_events([block], self.registries))
+        self.assertEqual(
+            [(r.round, r.txid, r.group_index, r.inner_path) for r in records],
+            [
+                (100, txns[0].get_txid(), 0, (0,)),
+                (100, txns[1].get_txid(), 1, (0,)),
+            ],
+        )
+        self.assertEqual(
+            [record.data for record in records],
+            [vault_events[i].decode(self.vault_logs[i]) for i in range(2)],
+        )
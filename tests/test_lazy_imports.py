@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+
+class LazyImportsTestCase(TestCase):
+    def get_imported_modules(self, code):
+        # A fresh interpreter is required, the test runner has already imported most of the SDK.
+        result = subprocess.run(
+            [sys.executable, "-c", f"import sys; {code}; print(' '.join(sys.modules))"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return set(result.stdout.split())
+
+    def test_package_imports_are_lazy(self):
+        modules = self.get_imported_modules(
+            "import tinyman, tinyman.v1, tinyman.v2, tinyman.swap_router"
+        )
+        self.assertNotIn("tinyman.v1.pools", modules)
+        self.assertNotIn("tinyman.v2.pools", modules)
+        self.assertNotIn("tinyman.swap_router.routes", modules)
+
+    def test_routes_does_not_import_v1(self):
+        modules = self.get_imported_modules("import tinyman.swap_router.routes")
+        self.assertIn("tinyman.v2.pools", modules)
+        self.assertNotIn("tinyman.v1.pools", modules)
+
+    def test_lazy_attributes(self):
+        from tinyman.swap_router.routes import Route
+        from tinyman.v2.pools import Pool
+
+        import tinyman
+
+        self.assertIs(tinyman.v2.Pool, Pool)
+        self.assertIs(tinyman.swap_router.Route, Route)
+        with self.assertRaises(AttributeError):
+            tinyman.v2.UnknownName
@@ -0,0 +1,176 @@
+import random
+from unittest import TestCase
+
+from tinyman.ordering.matcher import OpenTriggerOrder, TriggerOrderMatcher
+from tinyman.ordering.scanner import TriggerOrderTable, parse_order_boxes_into_columns
+from tinyman.ordering.structs import TriggerOrder
+from tinyman.v2.integer_formulas import calculate_fixed_input_swap
+
+TOTAL_FEE_SHARE = 30
+
+
+def generate_order(order_id, asset_id=1, target_asset_id=2):
+    amount = random.randint(1_000, 1_000_000)
+    return OpenTriggerOrder(
+        app_id=100 + order_id % 3,
+        order_id=order_id,
+        user_address=None,
+        asset_id=asset_id,
+        amount=amount,
+        target_asset_id=target_asset_id,
+        target_amount=int(amount * random.uniform(0.5, 1.5)),
+        filled_amount=random.choice([0, 0, amount // 2]),
+        is_partial_allowed=random.choice([True, False]),
+        expiration_timestamp=random.choice([0, 1_000, 3_000]),
+    )
+
+
+def is_executable(order, fill_amount, input_supply, output_supply):
+    # Exact integer quote, as the on-chain swap
+    swap_output_amount, _, _ = calculate_fixed_input_swap(
+        input_supply, output_supply, fill_amount, TOTAL_FEE_SHARE
+    )
+    return swap_output_amount * order.amount >= fill_amount * order.target_amount
+
+
+class TriggerOrderMatcherTestCase(TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.orders = [generate_order(order_id) for order_id in range(200)]
+        self.orders += [
+            generate_order(order_id, asset_id=2, target_asset_id=1)
+            for order_id in range(200, 300)
+        ]
+        self.matcher = TriggerOrderMatcher()
+        for order in self.orders:
+            self.matcher.add_order(order)
+
+    def test_match(self):
+        input_supply, output_supply = 10_000_000, 10_000_000
+        matches = self.matcher.match(
+            1, 2, input_supply, output_supply, TOTAL_FEE_SHARE, timestamp=2_000
+        )
+        self.assertTrue(matches)
+
+        limit_prices = [match.order.limit_price for match in matches]
+        self.assertEqual(limit_prices, sorted(limit_prices))
+        for match in matches:
+            order = match.order
+            self.assertEqual(order.asset_id, 1)
+            self.assertIn(order.expiration_timestamp, (0, 3_000))
+            self.assertTrue(
+                is_executable(order, match.fill_amount, input_supply, output_supply)
+            )
+            self.assertGreaterEqual(
+                match.swap_output_amount, match.required_target_amount
+            )
+            if match.fill_amount < order.remaining_amount:
+                self.assertTrue(order.is_partial_allowed)
+                self.assertFalse(
+                    is_executable(
+                        order, match.fill_amount + 1, input_supply, output_supply
+                    )
+                )
+
+        # Same result as checking every order
+        expected = [
+            order.key
+            for order in self.orders
+            if order.asset_id == 1
+            and order.expiration_timestamp in (0, 3_000)
+            and any(
+                is_executable(order, fill_amount, input_supply, output_supply)
+                for fill_amount in (
+                    range(1, order.remaining_amount + 1, 97)
+                    if order.is_partial_allowed
+                    else [order.remaining_amount]
+                )
+            )
+        ]
+        self.assertEqual(sorted(match.order.key for match in matches), sorted(expected))
+
+    def test_match_large_reserves(self):
+        # The products of the reserves do not fit into a float.
+        input_supply, output_supply = 3 * 10**17 + 7, 3 * 10**17 + 11
+        matches = self.matcher.match(
+            1, 2, input_supply, output_supply, TOTAL_FEE_SHARE, timestamp=2_000
+        )
+        self.assertTrue(matches)
+        for match in matches:
+            self.assertTrue(
+                is_executable(
+                    match.order, match.fill_amount, input_supply, output_supply
+                )
+            )
+            if match.fill_amount < match.order.remaining_amount:
+                self.assertFalse(
+                    is_executable(
+                        match.order,
+                        match.fill_amount + 1,
+                        input_supply,
+                        output_supply,
+                    )
+                )
+
+    def test_add_orders(self):
+        matcher = TriggerOrderMatcher()
+        matcher.add_orders(self.orders)
+
+        self.assertEqual(matcher.orders, self.matcher.orders)
+        self.assertEqual(
+            {pair: index.entries for pair, index in matcher.indexes.items()},
+            {pair: index.entries for pair, index in self.matcher.indexes.items()},
+        )
+
+    def test_add_remove(self):
+        order = self.orders[0]
+        self.assertIs(self.matcher.remove_order(*order.key), order)
+        self.assertIsNone(self.matcher.remove_order(*order.key))
+        self.assertEqual(len(self.matcher), len(self.orders) - 1)
+        self.assertNotIn(
+            order.key,
+            [
+                match.order.key
+                for match in self.matcher.match(
+                    1, 2, 10**12, 10**13, TOTAL_FEE_SHARE
+                )
+            ],
+        )
+
+        # Replaced on update, filled orders are removed.
+        order.filled_amount = order.amount
+        self.matcher.add_order(order)
+        self.assertNotIn(order.key, self.matcher.orders)
+        self.assertEqual(
+            sum(len(index) for index in self.matcher.indexes.values()),
+            len(self.matcher),
+        )
+
+    def test_from_table(self):
+        orders = []
+        for order in self.orders[:10]:
+            struct = TriggerOrder()
+            for name in TriggerOrder._fields:
+                if hasattr(order, name):
+                    setattr(struct, name, int(getattr(order, name)))
+            orders.append(bytes(struct))
+        table = TriggerOrderTable(
+            TriggerOrder,
+            user_addresses=[None] * 10,
+            columns=parse_order_boxes_into_columns(TriggerOrder, orders),
+        )
+        table.app_ids.extend(order.app_id for order in self.orders[:10])
+        table.order_ids.extend(order.order_id for order in self.orders[:10])
+
+        matcher = TriggerOrderMatcher.from_table(table, timestamp=2_000)
+        self.assertEqual(
+            set(matcher.orders),
+            {
+                order.key
+                for order in self.orders[:10]
+                if order.filled_amount < order.amount
+                and order.expiration_timestamp in (0, 3_000)
+            },
+        )
+        order = next(order for order in self.orders[:10] if order.key in matcher.orders)
+        self.assertEqual(matcher.orders[order.key], order)
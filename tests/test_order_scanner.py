@@ -0,0 +1,110 @@
+import random
+from unittest import TestCase
+
+from algosdk.account import generate_account
+from algosdk.encoding import decode_address
+
+from tests.governance import FakeAlgodClient
+from tinyman.ordering.scanner import OrderScanner, parse_order_boxes_into_columns
+from tinyman.ordering.structs import Entry, RecurringOrder, TriggerOrder
+from tinyman.utils import int_to_bytes
+
+
+class OrderScannerTestCase(TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.algod = FakeAlgodClient()
+        self.registry_app_id = 1
+        self.order_apps = {}
+        for app_id in (10, 20, 30):
+            _, user_address = generate_account()
+            self.order_apps[app_id] = user_address
+            entry = Entry()
+            entry.app_id = app_id
+            self.algod.boxes[
+                (self.registry_app_id, b"e" + decode_address(user_address))
+            ] = bytes(entry)
+        self.algod.boxes[(self.registry_app_id, b"latest_version")] = b"x"
+
+        self.trigger_orders = {}
+        self.recurring_orders = {}
+        for app_id in self.order_apps:
+            for order_id in range(3):
+                order = TriggerOrder()
+                order.asset_id = random.randint(0, 10)
+                order.amount = random.randint(1, 1000)
+                order.target_asset_id = random.randint(0, 10)
+                order.target_amount = random.randint(1, 1000)
+                order.filled_amount = random.choice([0, order.amount])
+                order.expiration_timestamp = random.choice([0, 1_000, 3_000])
+                self.trigger_orders[(app_id, order_id)] = order
+                self.algod.boxes[(app_id, b"o" + int_to_bytes(order_id))] = bytes(order)
+
+            order = RecurringOrder()
+            order.amount = 100
+            order.remaining_recurrences = random.randint(0, 2)
+            order.interval = 100
+            order.last_fill_timestamp = random.choice([1_000, 2_000])
+            self.recurring_orders[(app_id, 7)] = order
+            self.algod.boxes[(app_id, b"r" + int_to_bytes(7))] = bytes(order)
+            self.algod.boxes[(app_id, b"other")] = b"x"
+
+    def test_parse_order_boxes_into_columns(self):
+        orders = [TriggerOrder(random.randbytes(TriggerOrder._size)) for _ in range(5)]
+        columns = parse_order_boxes_into_columns(
+            TriggerOrder, [bytes(order) for order in orders]
+        )
+        self.assertEqual(list(columns), list(TriggerOrder._fields))
+        for name, column in columns.items():
+            self.assertEqual(list(column), [getattr(order, name) for order in orders])
+
+    def test_scan(self):
+        scanner = OrderScanner(self.algod, self.registry_app_id)
+        trigger_orders, recurring_orders = scanner.scan()
+        self.assertEqual(scanner.order_apps, self.order_apps)
+
+        self.assertEqual(len(trigger_orders), len(self.trigger_orders))
+        for i in range(len(trigger_orders)):
+            row = trigger_orders.get_row(i)
+            order = self.trigger_orders[(row["app_id"], row["order_id"])]
+            self.assertEqual(
+                row,
+                {
+                    "user_address": self.order_apps[row["app_id"]],
+                    "app_id": row["app_id"],
+                    "order_id": row["order_id"],
+                    **order.unpack_all(as_dict=True),
+                },
+            )
+            self.assertEqual(bytes(trigger_orders.get_order(i)), bytes(order))
+
+        self.assertEqual(
+            sorted(
+                (trigger_orders.app_ids[i], trigger_orders.order_ids[i])
+                for i in trigger_orders.get_open_indexes(2_000)
+            ),
+            sorted(
+                key
+                for key, order in self.trigger_orders.items()
+                if order.filled_amount < order.amount
+                and order.expiration_timestamp in (0, 3_000)
+            ),
+        )
+        self.assertEqual(
+            sorted(
+                recurring_orders.app_ids[i]
+                for i in recurring_orders.get_due_indexes(1_500)
+            ),
+            sorted(
+                app_id
+                for (app_id, _), order in self.recurring_orders.items()
+                if order.remaining_recurrences and order.last_fill_timestamp == 1_000
+            ),
+        )
+
+        trigger_orders, recurring_orders = scanner.scan(app_ids=[20])
+        self.assertEqual(set(trigger_orders.app_ids), {20})
+        self.assertEqual(
+            list(recurring_orders["remaining_recurrences"]),
+            [self.recurring_orders[(20, 7)].remaining_recurrences],
+        )
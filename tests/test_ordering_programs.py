@@ -0,0 +1,104 @@
+import os
+import tempfile
+from hashlib import sha256
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from tinyman.constants import CACHE_DIR_ENV
+from tinyman.ordering.programs import Program
+
+BYTECODE = b"\x0a\x20\x01\x01"
+URL = "https://example.com/order_approval.teal.tok"
+
+
+class ProgramTestCase(TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.package_dir = Path(temp_dir.name) / "build"
+        self.package_dir.mkdir()
+        self.cache_dir = Path(temp_dir.name) / "cache"
+
+        for patcher in [
+            patch("tinyman.ordering.programs.PACKAGE_PROGRAMS_DIR", self.package_dir),
+            patch.dict(os.environ, {CACHE_DIR_ENV: str(self.cache_dir)}),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        get_patcher = patch("tinyman.ordering.programs.requests.get")
+        self.requests_get = get_patcher.start()
+        self.addCleanup(get_patcher.stop)
+        self.set_response(BYTECODE)
+
+        self.program = Program(
+            "order_approval.teal.tok", URL, sha256(BYTECODE).hexdigest()
+        )
+        self.cache_path = self.program.cache_path
+
+    def set_response(self, content):
+        self.requests_get.return_value = MagicMock(content=content)
+
+    def test_package_data(self):
+        (self.package_dir / "order_approval.teal.tok").write_bytes(BYTECODE)
+
+        self.assertEqual(self.program.bytecode, BYTECODE)
+        self.requests_get.assert_not_called()
+
+    def test_package_data_digest_mismatch(self):
+        (self.package_dir / "order_approval.teal.tok").write_bytes(b"\x00")
+
+        self.assertEqual(self.program.bytecode, BYTECODE)
+        self.requests_get.assert_called_once_with(URL, timeout=30)
+
+    def test_cache(self):
+        self.assertEqual(self.program.load(), BYTECODE)
+        self.assertEqual(self.cache_path.read_bytes(), BYTECODE)
+
+        # The second load is served from the cache.
+        self.assertEqual(self.program.load(), BYTECODE)
+        self.requests_get.assert_called_once_with(URL, timeout=30)
+
+    def test_corrupted_cache(self):
+        self.program.load()
+        self.cache_path.write_bytes(BYTECODE[:-1])
+
+        self.assertEqual(self.program.load(), BYTECODE)
+        self.assertEqual(self.requests_get.call_count, 2)
+        self.assertEqual(self.cache_path.read_bytes(), BYTECODE)
+
+    def test_corrupted_cache_without_pinned_digest(self):
+        program = Program("order_approval.teal.tok", URL, None)
+        program.load()
+        program.cache_path.write_bytes(BYTECODE[:-1])
+
+        # The digest stored with the cached copy does not match.
+        self.assertEqual(program.load(), BYTECODE)
+        self.assertEqual(self.requests_get.call_count, 2)
+
+    def test_cache_is_keyed_by_version(self):
+        self.program.load()
+        new_bytecode = BYTECODE + b"\x01"
+        self.set_response(new_bytecode)
+
+        # A new version of the program is not served from the cache of the previous one.
+        program = Program(
+            "order_approval.teal.tok", URL, sha256(new_bytecode).hexdigest()
+        )
+        self.assertEqual(program.load(), new_bytecode)
+        self.assertNotEqual(program.cache_path, self.cache_path)
+
+        unpinned_program = Program(
+            "order_approval.teal.tok", URL.replace(".com/", ".com/v6/"), None
+        )
+        self.assertEqual(unpinned_program.load(), new_bytecode)
+        self.assertEqual(self.requests_get.call_count, 3)
+        self.assertEqual(self.cache_path.read_bytes(), BYTECODE)
+
+    def test_digest_mismatch(self):
+        self.set_response(BYTECODE + b"\x00")
+
+        with self.assertRaisesRegex(Exception, "Program hash mismatch"):
+            self.program.load()
+        self.assertFalse(self.cache_path.exists())
@@ -0,0 +1,89 @@
+import random
+from unittest import TestCase
+
+from tinyman.ordering.structs import TriggerOrder
+from tinyman.struct import StructRegistry, get_box_costs
+
+STRUCT_DEFINITIONS = {
+    "RewardSlot": {
+        "size": 24,
+        "fields": {
+            "asset_id": {"type": "int", "size": 8, "offset": 0},
+            "amount": {"type": "uint128", "size": 16, "offset": 8},
+        },
+    },
+    "Asset": {
+        "size": 96,
+        "fields": {
+            "id": {"type": "int", "size": 8, "offset": 0},
+            "flags": {"type": "uint16", "size": 2, "offset": 8},
+            "note": {"type": "bytes[6]", "size": 6, "offset": 10},
+            "reward_slots": {"type": "RewardSlot[3]", "size": 72, "offset": 16},
+            "last_slot": {"type": "RewardSlot", "size": 24, "offset": 64},
+        },
+    },
+}
+
+
+class StructTestCase(TestCase):
+    def setUp(self):
+        self.registry = StructRegistry()
+        self.registry.load_from_dict(STRUCT_DEFINITIONS)
+
+    def test_compiled_once(self):
+        self.assertIs(
+            self.registry.get_struct("Asset"), self.registry.get_struct("Asset")
+        )
+        self.assertIs(
+            self.registry.get_type("RewardSlot[3]")._struct,
+            self.registry.get_struct("RewardSlot"),
+        )
+        with self.assertRaises(KeyError):
+            self.registry.get_struct("Unknown")
+
+    def test_read_write(self):
+        Asset = self.registry.get_struct("Asset")
+        asset = Asset()
+        asset.id = 12
+        asset.flags = 3
+        asset.note = b"abcdef"
+        asset.reward_slots[1].asset_id = 7
+        asset.reward_slots[2].amount = 2**100
+        asset.last_slot.asset_id = 9
+
+        asset = Asset(bytes(asset))
+        self.assertEqual(len(asset), 96)
+        self.assertEqual(asset.id, 12)
+        self.assertEqual(asset.flags, 3)
+        self.assertEqual(bytes(asset.note), b"abcdef")
+        self.assertEqual([slot.asset_id for slot in asset.reward_slots], [0, 7, 9])
+        # last_slot overlaps the last reward slot
+        self.assertEqual(asset.reward_slots[2].asset_id, 9)
+        self.assertEqual(asset.last_slot.amount, 2**100)
+        with self.assertRaises(IndexError):
+            asset.reward_slots[3]
+
+    def test_unpack_all(self):
+        RewardSlot = self.registry.get_struct("RewardSlot")
+        slot = RewardSlot(random.randbytes(24))
+        self.assertEqual(slot.unpack_all(), (slot.asset_id, slot.amount))
+        self.assertEqual(
+            slot.unpack_all(as_dict=True),
+            {"asset_id": slot.asset_id, "amount": slot.amount},
+        )
+
+        order = TriggerOrder(random.randbytes(TriggerOrder._size))
+        self.assertEqual(
+            order.unpack_all(as_dict=True),
+            {name: getattr(order, name) for name in TriggerOrder._fields},
+        )
+
+        # Nested structs are read field by field.
+        Asset = self.registry.get_struct("Asset")
+        self.assertIsNone(Asset._unpacker)
+        asset = Asset(random.randbytes(Asset._size))
+        self.assertEqual(asset.unpack_all()[:2], (asset.id, asset.flags))
+
+    def test_get_box_costs(self):
+        RewardSlot = self.registry.get_struct("RewardSlot")
+        self.assertEqual(get_box_costs({b"slot": RewardSlot}), 2_500 + (4 + 24) * 400)
@@ -0,0 +1,199 @@
+from base64 import b64encode
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase
+
+from algosdk.error import AlgodHTTPError
+
+from tinyman.assets import AssetAmount
+from tinyman.exceptions import AsyncClientNotSupported
+from tinyman.v2.async_client import AsyncTinymanV2Client
+from tinyman.v2.constants import TESTNET_VALIDATOR_APP_ID_V2
+from tinyman.v2.contracts import get_pool_logicsig
+from tinyman.v2.pools import Pool
+from tinyman.v2.quotes import SwapQuote
+
+
+class FakeAsyncAlgodClient:
+    def __init__(self, account_infos):
+        self.account_infos = account_infos
+        self.requests = []
+        self.last_round = 100
+        # txid -> the pending transaction info at each round, from the last round on
+        self.pending_transactions = {}
+        self.send_error = None
+
+    async def account_info(self, address):
+        self.requests.append(("account_info", address))
+        return self.account_infos[address]
+
+    async def asset_info(self, asset_id):
+        self.requests.append(("asset_info", asset_id))
+        return {
+            "params": {
+                "name": f"Asset {asset_id}",
+                "unit-name": f"A{asset_id}",
+                "decimals": 6,
+            }
+        }
+
+    async def status(self):
+        self.requests.append(("status",))
+        return {"last-round": self.last_round}
+
+    async def status_after_block(self, block_num):
+        self.requests.append(("status_after_block", block_num))
+        self.last_round = block_num
+        return {"last-round": self.last_round}
+
+    async def pending_transaction_info(self, txid):
+        self.requests.append(("pending_transaction_info", txid))
+        if txid not in self.pending_transactions:
+            raise AlgodHTTPError("txn not found", 404)
+        txn_infos = self.pending_transactions[txid]
+        return txn_infos[min(self.last_round - 100, len(txn_infos) - 1)]
+
+    async def send_transactions(self, txns):
+        self.requests.append(("send_transactions", txns))
+        if self.send_error is not None:
+            raise self.send_error
+        return "TXID"
+
+
+class AsyncTinymanV2ClientTestCase(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.validator_app_id = TESTNET_VALIDATOR_APP_ID_V2
+        self.pool_address = get_pool_logicsig(self.validator_app_id, 10, 8).address()
+        state = {
+            "asset_1_id": 10,
+            "asset_2_id": 8,
+            "pool_token_asset_id": 15,
+            "asset_1_reserves": 10_000_000,
+            "asset_2_reserves": 1_000_000_000,
+            "issued_pool_tokens": 100_000_000,
+            "asset_1_protocol_fees": 0,
+            "asset_2_protocol_fees": 0,
+            "protocol_fee_ratio": 6,
+            "total_fee_share": 30,
+        }
+        self.algod = FakeAsyncAlgodClient(
+            {
+                self.pool_address: {
+                    "address": self.pool_address,
+                    "round": 100,
+                    "apps-local-state": [
+                        {
+                            "id": self.validator_app_id,
+                            "key-value": [
+                                {
+                                    "key": b64encode(key.encode()).decode(),
+                                    "value": {"type": 2, "uint": value},
+                                }
+                                for key, value in state.items()
+                            ],
+                        }
+                    ],
+                }
+            }
+        )
+        self.client = AsyncTinymanV2Client(
+            algod_client=self.algod,
+            validator_app_id=self.validator_app_id,
+        )
+
+    async def test_fetch_pool(self):
+        pool = await self.client.fetch_pool(8, 10)
+
+        self.assertTrue(pool.exists)
+        self.assertEqual(pool.asset_1.unit_name, "A10")
+        self.assertEqual(pool.asset_2.unit_name, "A8")
+        self.assertEqual(pool.pool_token_asset.unit_name, "A15")
+        self.assertEqual(pool.asset_1_reserves, 10_000_000)
+        self.assertEqual(pool.last_refreshed_round, 100)
+
+    async def test_fetch_fixed_input_swap_quote(self):
+        pool = await self.client.fetch_pool(8, 10)
+        request_count = len(self.algod.requests)
+
+        quote = await pool.fetch_fixed_input_swap_quote_async(
+            amount_in=AssetAmount(pool.asset_1, 10_000_000)
+        )
+
+        self.assertEqual(type(quote), SwapQuote)
+        self.assertEqual(quote.amount_out, AssetAmount(pool.asset_2, 499_248_873))
+        # Only the pool account is refreshed, assets are served from the cache.
+        self.assertEqual(
+            self.algod.requests[request_count:],
+            [("account_info", self.pool_address)],
+        )
+
+    async def test_submit(self):
+        transaction_group = SimpleNamespace(signed_transactions=["STXN"])
+
+        result = await self.client.submit(transaction_group)
+
+        self.assertEqual(result, {"txid": "TXID"})
+        self.assertEqual(self.algod.requests, [("send_transactions", ["STXN"])])
+
+    async def test_submit_and_wait_for_confirmation(self):
+        transaction_group = SimpleNamespace(signed_transactions=["STXN"])
+        self.algod.pending_transactions["TXID"] = [
+            {},
+            {"confirmed-round": 0},
+            {"confirmed-round": 102},
+        ]
+
+        result = await self.client.submit(transaction_group, wait=True)
+
+        self.assertEqual(result, {"confirmed-round": 102, "txid": "TXID"})
+        self.assertEqual(
+            self.algod.requests,
+            [
+                ("send_transactions", ["STXN"]),
+                ("status",),
+                ("pending_transaction_info", "TXID"),
+                ("status_after_block", 101),
+                ("pending_transaction_info", "TXID"),
+                ("status_after_block", 102),
+                ("pending_transaction_info", "TXID"),
+            ],
+        )
+
+    async def test_submit_rejected(self):
+        transaction_group = SimpleNamespace(signed_transactions=["STXN"])
+        self.algod.pending_transactions["TXID"] = [{"pool-error": "overspend"}]
+
+        with self.assertRaisesRegex(Exception, "Transaction rejected: overspend"):
+            await self.client.submit(transaction_group, wait=True)
+
+    async def test_submit_error(self):
+        transaction_group = SimpleNamespace(signed_transactions=["STXN"])
+        self.algod.send_error = AlgodHTTPError("fee too small", 400)
+
+        with self.assertRaisesRegex(Exception, "fee too small"):
+            await self.client.submit(transaction_group)
+
+    async def test_sync_pool_methods_are_not_supported(self):
+        self.assertIsNone(self.client.pool_state_cache)
+        with self.assertRaises(AsyncClientNotSupported):
+            Pool(self.client, 8, 10)
+
+        pool = await self.client.fetch_pool(8, 10)
+        request_count = len(self.algod.requests)
+        with self.assertRaises(AsyncClientNotSupported):
+            pool.refresh()
+        with self.assertRaises(AsyncClientNotSupported):
+            pool.fetch_fixed_input_swap_quote(AssetAmount(pool.asset_1, 10_000_000))
+        with self.assertRaises(AsyncClientNotSupported):
+            pool.update_from_info(pool.info())
+        with self.assertRaises(AsyncClientNotSupported):
+            pool.fetch_pool_position(self.pool_address)
+
+        quote = pool.fetch_fixed_input_swap_quote(
+            AssetAmount(pool.asset_1, 10_000_000), refresh=False
+        )
+        with self.assertRaises(AsyncClientNotSupported):
+            pool.prepare_swap_transactions_from_quote(
+                quote, user_address=self.pool_address
+            )
+        # No coroutine is created and left un-awaited.
+        self.assertEqual(len(self.algod.requests), request_count)
@@ -0,0 +1,41 @@
+from base64 import b64decode
+from unittest import TestCase
+
+from tinyman.compat import LogicSigAccount
+from tinyman.v2.constants import POOL_LOGICSIG_TEMPLATE, TESTNET_VALIDATOR_APP_ID_V2
+from tinyman.v2.contracts import (
+    get_pool_address,
+    get_pool_logicsig,
+    get_pool_logicsig_and_address,
+)
+
+
+class PoolLogicsigTestCase(TestCase):
+    def test_pool_address(self):
+        program = bytearray(b64decode(POOL_LOGICSIG_TEMPLATE))
+        program[3:11] = TESTNET_VALIDATOR_APP_ID_V2.to_bytes(8, "big")
+        program[11:19] = (10).to_bytes(8, "big")
+        program[19:27] = (8).to_bytes(8, "big")
+        expected_address = LogicSigAccount(bytes(program)).address()
+
+        self.assertEqual(
+            get_pool_address(TESTNET_VALIDATOR_APP_ID_V2, 8, 10), expected_address
+        )
+        self.assertEqual(
+            get_pool_address(TESTNET_VALIDATOR_APP_ID_V2, 10, 8), expected_address
+        )
+        self.assertEqual(
+            get_pool_logicsig(TESTNET_VALIDATOR_APP_ID_V2, 8, 10).lsig.logic,
+            bytes(program),
+        )
+
+    def test_pool_logicsig_is_cached(self):
+        get_pool_logicsig_and_address.cache_clear()
+
+        logicsig = get_pool_logicsig(TESTNET_VALIDATOR_APP_ID_V2, 10, 8)
+        get_pool_address(TESTNET_VALIDATOR_APP_ID_V2, 8, 10)
+
+        self.assertIs(get_pool_logicsig(TESTNET_VALIDATOR_APP_ID_V2, 8, 10), logicsig)
+        cache_info = get_pool_logicsig_and_address.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 2)
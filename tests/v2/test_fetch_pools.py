@@ -0,0 +1,98 @@
+from base64 import b64encode
+from unittest.mock import patch
+
+from tests.v2 import BaseTestCase
+from tinyman.v2.constants import TESTNET_VALIDATOR_APP_ID_V2
+from tinyman.v2.contracts import get_pool_logicsig
+from tinyman.v2.pools import Pool
+
+
+class FetchPoolsTestCase(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.VALIDATOR_APP_ID = TESTNET_VALIDATOR_APP_ID_V2
+        cls.user_address = None
+        cls.asset_1_id = 10
+        cls.asset_2_id = 8
+        cls.pool_token_asset_id = 15
+        cls.pool_address = get_pool_logicsig(
+            cls.VALIDATOR_APP_ID, cls.asset_1_id, cls.asset_2_id
+        ).address()
+        cls.empty_pool_address = get_pool_logicsig(
+            cls.VALIDATOR_APP_ID, 20, 0
+        ).address()
+
+    @classmethod
+    def get_mock_account_info(cls, address, state=None):
+        account_info = {"address": address, "amount": 0, "round": 100}
+        if state is not None:
+            account_info["apps-local-state"] = [
+                {
+                    "id": cls.VALIDATOR_APP_ID,
+                    "key-value": [
+                        {
+                            "key": b64encode(key.encode()).decode(),
+                            "value": {"type": 2, "uint": value},
+                        }
+                        for key, value in state.items()
+                    ],
+                }
+            ]
+        return account_info
+
+    def mock_account_info(self, address):
+        if address == self.pool_address:
+            return self.get_mock_account_info(
+                address,
+                self.get_pool_state(
+                    asset_1_reserves=1_000_000,
+                    asset_2_reserves=2_000_000,
+                    issued_pool_tokens=1_000_000,
+                ),
+            )
+        return self.get_mock_account_info(address)
+
+    def mock_asset_info(self, asset_id):
+        return {
+            "params": {
+                "name": f"Asset {asset_id}",
+                "unit-name": f"A{asset_id}",
+                "decimals": 6,
+            }
+        }
+
+    def test_fetch_pools(self):
+        client = self.get_tinyman_client()
+
+        with patch(
+            "algosdk.v2client.algod.AlgodClient.account_info",
+            side_effect=self.mock_account_info,
+        ) as account_info, patch(
+            "algosdk.v2client.algod.AlgodClient.asset_info",
+            side_effect=self.mock_asset_info,
+        ) as asset_info:
+            pools = client.fetch_pools(
+                [(self.asset_2_id, self.asset_1_id), (20, 0)], max_workers=2
+            )
+
+        self.assertEqual(account_info.call_count, 2)
+        # ALGO is not fetched from algod.
+        self.assertEqual(asset_info.call_count, 4)
+        self.assertEqual(set(client.assets_cache), {0, 8, 10, 15, 20})
+
+        pool = pools[(self.asset_2_id, self.asset_1_id)]
+        self.assertEqual(type(pool), Pool)
+        self.assertTrue(pool.exists)
+        self.assertEqual(pool.address, self.pool_address)
+        self.assertEqual(pool.asset_1.unit_name, "A10")
+        self.assertEqual(pool.asset_2.unit_name, "A8")
+        self.assertEqual(pool.pool_token_asset.unit_name, "A15")
+        self.assertEqual(pool.asset_1_reserves, 1_000_000)
+        self.assertEqual(pool.asset_2_reserves, 2_000_000)
+        self.assertEqual(pool.last_refreshed_round, 100)
+
+        empty_pool = pools[(20, 0)]
+        self.assertIsNone(empty_pool.exists)
+        self.assertEqual(empty_pool.address, self.empty_pool_address)
+        self.assertEqual(empty_pool.asset_1.unit_name, "A20")
+        self.assertEqual(empty_pool.asset_2.unit_name, "ALGO")
@@ -0,0 +1,140 @@
+from unittest import TestCase, skipUnless
+
+from tinyman.exceptions import InsufficientReserves, LowSwapAmountError
+from tinyman.v2 import integer_formulas
+from tinyman.v2.formulas import (
+    calculate_fixed_input_swap,
+    calculate_fixed_output_swap,
+)
+from tinyman.v2.integer_formulas import (
+    calculate_fixed_input_swap_batch,
+    calculate_fixed_output_swap_batch,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SwapBatchTestCase(TestCase):
+    input_supply = 10_000_000
+    output_supply = 1_000_000_000
+    total_fee_share = 30
+    amounts = [1, 7, 1_000, 123_457, 10_000_000, 99_999_999]
+
+    def test_fixed_input_swap_batch(self):
+        result = calculate_fixed_input_swap_batch(
+            self.input_supply, self.output_supply, self.amounts, self.total_fee_share
+        )
+
+        expected = [
+            calculate_fixed_input_swap(
+                self.input_supply, self.output_supply, amount, self.total_fee_share
+            )
+            for amount in self.amounts
+        ]
+        self.assertEqual(list(zip(*result)), expected)
+
+    def test_fixed_output_swap_batch(self):
+        amounts = [1, 7, 1_000, 123_457, 500_000_000, 999_999_999]
+        result = calculate_fixed_output_swap_batch(
+            self.input_supply, self.output_supply, amounts, self.total_fee_share
+        )
+
+        expected = [
+            calculate_fixed_output_swap(
+                self.input_supply, self.output_supply, amount, self.total_fee_share
+            )
+            for amount in amounts
+        ]
+        self.assertEqual(list(zip(*result)), expected)
+
+    def test_integer_path_is_exact(self):
+        # k does not fit into a float, the integer path must not lose precision.
+        input_supply = 2**60 + 1
+        output_supply = 2**60 + 3
+        amount = 2**40 + 5
+
+        (
+            (swap_output_amount,),
+            (total_fee_amount,),
+            _,
+        ) = calculate_fixed_input_swap_batch(
+            input_supply, output_supply, [amount], self.total_fee_share
+        )
+
+        swap_amount = amount - (amount * self.total_fee_share) // 10_000
+        k = input_supply * output_supply
+        self.assertEqual(
+            swap_output_amount, output_supply - k // (input_supply + swap_amount) - 1
+        )
+
+    def test_batch_matches_integer_formulas(self):
+        input_supply = 2**60 + 1
+        output_supply = 2**60 + 3
+        amounts = [1, 2**20 + 7, 2**40 + 5, 2**59]
+
+        result = calculate_fixed_input_swap_batch(
+            input_supply, output_supply, amounts, self.total_fee_share
+        )
+        expected = [
+            integer_formulas.calculate_fixed_input_swap(
+                input_supply, output_supply, amount, self.total_fee_share
+            )
+            for amount in amounts
+        ]
+        self.assertEqual(list(zip(*result)), expected)
+
+        result = calculate_fixed_output_swap_batch(
+            input_supply, output_supply, amounts, self.total_fee_share
+        )
+        expected = [
+            integer_formulas.calculate_fixed_output_swap(
+                input_supply, output_supply, amount, self.total_fee_share
+            )
+            for amount in amounts
+        ]
+        self.assertEqual(list(zip(*result)), expected)
+
+    def test_invalid_amounts(self):
+        with self.assertRaises(LowSwapAmountError):
+            calculate_fixed_input_swap_batch(
+                self.input_supply, self.output_supply, [10, 0], self.total_fee_share
+            )
+        with self.assertRaises(InsufficientReserves):
+            calculate_fixed_output_swap_batch(
+                self.input_supply,
+                self.output_supply,
+                [10, self.output_supply],
+                self.total_fee_share,
+            )
+
+    @skipUnless(numpy, "numpy is not installed")
+    def test_numpy_batch(self):
+        exact = calculate_fixed_input_swap_batch(
+            self.input_supply, self.output_supply, self.amounts, self.total_fee_share
+        )
+        approximate = calculate_fixed_input_swap_batch(
+            self.input_supply,
+            self.output_supply,
+            self.amounts,
+            self.total_fee_share,
+            use_numpy=True,
+        )
+        for exact_values, approximate_values in zip(exact, approximate):
+            numpy.testing.assert_allclose(approximate_values, exact_values, atol=1)
+
+        amounts = [1, 1_000, 500_000_000]
+        exact = calculate_fixed_output_swap_batch(
+            self.input_supply, self.output_supply, amounts, self.total_fee_share
+        )
+        approximate = calculate_fixed_output_swap_batch(
+            self.input_supply,
+            self.output_supply,
+            amounts,
+            self.total_fee_share,
+            use_numpy=True,
+        )
+        for exact_values, approximate_values in zip(exact, approximate):
+            numpy.testing.assert_allclose(approximate_values, exact_values, atol=1)
@@ -0,0 +1,184 @@
+import math
+import random
+from unittest import TestCase
+
+from tinyman.exceptions import InsufficientReserves, LowSwapAmountError
+from tinyman.v2 import formulas, integer_formulas
+
+FUNCTION_NAMES = [
+    "calculate_initial_add_liquidity",
+    "calculate_remove_liquidity_output_amounts",
+    "calculate_subsequent_add_liquidity",
+    "calculate_fixed_input_swap",
+    "calculate_fixed_output_swap",
+    "calculate_flash_swap_asset_1_payment_amount",
+    "calculate_flash_swap_asset_2_payment_amount",
+]
+
+
+def generate_arguments(rng, max_reserves):
+    asset_1_reserves = rng.randint(10_000, max_reserves)
+    asset_2_reserves = rng.randint(10_000, max_reserves)
+    issued_pool_tokens = rng.randint(10_000, max_reserves)
+    asset_1_amount = rng.randint(1, asset_1_reserves)
+    asset_2_amount = rng.randint(1, asset_2_reserves - 1)
+    total_fee_share = rng.choice([1, 25, 30, 100])
+    protocol_fee_ratio = rng.choice([5, 6, 10])
+
+    return {
+        "calculate_initial_add_liquidity": (asset_1_amount, asset_2_amount),
+        "calculate_remove_liquidity_output_amounts": (
+            rng.randint(1, issued_pool_tokens),
+            asset_1_reserves,
+            asset_2_reserves,
+            issued_pool_tokens,
+        ),
+        "calculate_subsequent_add_liquidity": (
+            asset_1_reserves,
+            asset_2_reserves,
+            issued_pool_tokens,
+            total_fee_share,
+            asset_1_amount,
+            asset_2_amount,
+        ),
+        "calculate_fixed_input_swap": (
+            asset_1_reserves,
+            asset_2_reserves,
+            asset_1_amount,
+            total_fee_share,
+        ),
+        "calculate_fixed_output_swap": (
+            asset_1_reserves,
+            asset_2_reserves,
+            asset_2_amount,
+            total_fee_share,
+        ),
+        "calculate_flash_swap_asset_1_payment_amount": (
+            asset_1_reserves,
+            asset_2_reserves,
+            total_fee_share,
+            protocol_fee_ratio,
+            rng.randint(1, asset_1_reserves - 1),
+            0,
+            rng.randint(0, asset_2_reserves // 10),
+        ),
+        "calculate_flash_swap_asset_2_payment_amount": (
+            asset_1_reserves,
+            asset_2_reserves,
+            total_fee_share,
+            protocol_fee_ratio,
+            0,
+            rng.randint(1, asset_2_reserves - 1),
+            rng.randint(0, asset_1_reserves // 10),
+        ),
+    }
+
+
+def call(function, arguments):
+    try:
+        return function(*arguments)
+    except (InsufficientReserves, LowSwapAmountError) as e:
+        return type(e)
+
+
+class IntegerFormulasDifferentialTestCase(TestCase):
+    def test_matches_float_formulas_in_the_exact_range(self):
+        # Products of reserves stay below 2^53, the float formulas are exact in this range.
+        rng = random.Random(1)
+        for _ in range(2_000):
+            for name, arguments in generate_arguments(rng, 2**26).items():
+                with self.subTest(name=name, arguments=arguments):
+                    self.assertEqual(
+                        call(getattr(integer_formulas, name), arguments),
+                        call(getattr(formulas, name), arguments),
+                    )
+
+    def test_large_reserves(self):
+        rng = random.Random(2)
+        for _ in range(500):
+            arguments = generate_arguments(rng, 2**63)
+
+            asset_1_amount, asset_2_amount = arguments[
+                "calculate_initial_add_liquidity"
+            ]
+            pool_token_asset_amount = (
+                integer_formulas.calculate_initial_add_liquidity(
+                    asset_1_amount, asset_2_amount
+                )
+                + 1000
+            )
+            self.assertLessEqual(
+                pool_token_asset_amount**2, asset_1_amount * asset_2_amount
+            )
+            self.assertGreater(
+                (pool_token_asset_amount + 1) ** 2, asset_1_amount * asset_2_amount
+            )
+
+            input_supply, output_supply, swap_input_amount, total_fee_share = arguments[
+                "calculate_fixed_input_swap"
+            ]
+            (
+                swap_output_amount,
+                total_fee_amount,
+                _,
+            ) = integer_formulas.calculate_fixed_input_swap(
+                input_supply, output_supply, swap_input_amount, total_fee_share
+            )
+            # The pool invariant must hold after the swap.
+            self.assertGreaterEqual(
+                (input_supply + swap_input_amount - total_fee_amount)
+                * (output_supply - swap_output_amount),
+                input_supply * output_supply,
+            )
+
+            (
+                asset_1_reserves,
+                asset_2_reserves,
+                total_fee_share,
+                protocol_fee_ratio,
+                _,
+                asset_2_loan_amount,
+                asset_1_payment_amount,
+            ) = arguments["calculate_flash_swap_asset_2_payment_amount"]
+            asset_2_payment_amount = (
+                integer_formulas.calculate_flash_swap_asset_2_payment_amount(
+                    *arguments["calculate_flash_swap_asset_2_payment_amount"]
+                )
+            )
+            asset_1_total_fee_amount = formulas.calculate_fixed_input_fee_amount(
+                asset_1_payment_amount, total_fee_share
+            )
+            final_asset_1_reserves_without_poolers_fee = (
+                asset_1_reserves + asset_1_payment_amount - asset_1_total_fee_amount
+            )
+
+            def is_enough(payment_amount):
+                # final_asset_1 * (remaining_asset_2 + payment_amount * (1 - fee)) >= k
+                return final_asset_1_reserves_without_poolers_fee * (
+                    (asset_2_reserves - asset_2_loan_amount) * 10_000
+                    + payment_amount * (10_000 - total_fee_share)
+                ) >= (asset_1_reserves * asset_2_reserves * 10_000)
+
+            # The payment amount is the minimum amount that keeps the pool invariant.
+            self.assertTrue(is_enough(asset_2_payment_amount))
+            self.assertFalse(is_enough(asset_2_payment_amount - 1))
+
+    def test_initial_add_liquidity_around_the_exact_sqrt_limit(self):
+        limit = integer_formulas.MAX_EXACT_SQRT_INPUT
+        for root in [math.isqrt(limit - 1), math.isqrt(limit - 1) + 1]:
+            for asset_1_amount, asset_2_amount in [
+                (root, root),
+                (root - 1, root + 1),
+                (root + 1, root + 1),
+                (1, limit - 1),
+                (1, limit),
+            ]:
+                with self.subTest(
+                    asset_1_amount=asset_1_amount, asset_2_amount=asset_2_amount
+                ):
+                    self.assertEqual(
+                        integer_formulas.calculate_initial_add_liquidity(
+                            asset_1_amount, asset_2_amount
+                        ),
+                        math.isqrt(asset_1_amount * asset_2_amount) - 1000,
+                    )
@@ -0,0 +1,198 @@
+import threading
+from base64 import b64encode
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import patch
+
+from tests.v2 import BaseTestCase
+from tinyman.assets import Asset
+from tinyman.v2.constants import TESTNET_VALIDATOR_APP_ID_V2
+from tinyman.v2.contracts import get_pool_address
+from tinyman.v2.pools import Pool
+
+
+class PoolStateCacheTestCase(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.VALIDATOR_APP_ID = TESTNET_VALIDATOR_APP_ID_V2
+        cls.user_address = None
+        cls.asset_1_id = 10
+        cls.asset_2_id = 8
+        cls.pool_token_asset_id = 15
+        cls.pool_address = get_pool_address(
+            cls.VALIDATOR_APP_ID, cls.asset_1_id, cls.asset_2_id
+        )
+
+    def setUp(self):
+        self.round = 100
+        self.client = self.get_tinyman_client()
+        self.client.assets_cache[self.pool_token_asset_id] = Asset(
+            id=self.pool_token_asset_id, name="TM", unit_name="TMPOOL2", decimals=6
+        )
+        self.pool = Pool(
+            self.client,
+            Asset(id=self.asset_1_id),
+            Asset(id=self.asset_2_id),
+            fetch=False,
+        )
+
+    def mock_account_info(self, address):
+        self.round += 1
+        state = self.get_pool_state(
+            asset_1_reserves=1_000_000,
+            asset_2_reserves=2_000_000,
+            issued_pool_tokens=1_000_000,
+        )
+        return {
+            "address": address,
+            "round": self.round,
+            "apps-local-state": [
+                {
+                    "id": self.VALIDATOR_APP_ID,
+                    "key-value": [
+                        {
+                            "key": b64encode(key.encode()).decode(),
+                            "value": {"type": 2, "uint": value},
+                        }
+                        for key, value in state.items()
+                    ],
+                }
+            ],
+        }
+
+    def test_refresh_without_cache(self):
+        with patch(
+            "algosdk.v2client.algod.AlgodClient.account_info",
+            side_effect=self.mock_account_info,
+        ) as account_info:
+            self.pool.refresh()
+            self.pool.refresh()
+
+        self.assertEqual(account_info.call_count, 2)
+        self.assertEqual(self.pool.last_refreshed_round, 102)
+
+    def test_max_age(self):
+        with patch(
+            "algosdk.v2client.algod.AlgodClient.account_info",
+            side_effect=self.mock_account_info,
+        ) as account_info:
+            self.pool.refresh(max_age_ms=60_000)
+            self.pool.refresh(max_age_ms=60_000)
+            self.assertEqual(account_info.call_count, 1)
+
+            self.pool.refresh(max_age_ms=0)
+            self.assertEqual(account_info.call_count, 2)
+
+            self.client.pool_state_cache.max_age_ms = 60_000
+            self.pool.fetch_fixed_input_swap_quote(amount_in=self.pool.asset_1(1_000))
+            self.assertEqual(account_info.call_count, 2)
+
+            self.client.pool_state_cache.invalidate(self.pool_address)
+            self.pool.refresh()
+            self.assertEqual(account_info.call_count, 3)
+
+        self.assertEqual(self.pool.last_refreshed_round, 103)
+
+    def test_min_round(self):
+        with patch(
+            "algosdk.v2client.algod.AlgodClient.account_info",
+            side_effect=self.mock_account_info,
+        ) as account_info:
+            self.pool.refresh(min_round=101)
+            self.pool.refresh(min_round=101)
+            self.assertEqual(account_info.call_count, 1)
+
+            self.pool.refresh(min_round=102)
+            self.assertEqual(account_info.call_count, 2)
+
+        self.assertEqual(self.pool.last_refreshed_round, 102)
+
+    def test_concurrent_refreshes_are_coalesced(self):
+        started = threading.Event()
+        release = threading.Event()
+        waiters = threading.Semaphore(0)
+
+        def slow_account_info(address):
+            started.set()
+            release.wait(5)
+            return self.mock_account_info(address)
+
+        class WaitedFuture(Future):
+            def result(self, timeout=None):
+                waiters.release()
+                return super().result(timeout)
+
+        pools = [
+            Pool(
+                self.client,
+                Asset(id=self.asset_1_id),
+                Asset(id=self.asset_2_id),
+                fetch=False,
+            )
+            for _ in range(5)
+        ]
+        with patch(
+            "algosdk.v2client.algod.AlgodClient.account_info",
+            side_effect=slow_account_info,
+        ) as account_info, patch(
+            "tinyman.v2.pool_cache.Future", WaitedFuture
+        ), ThreadPoolExecutor(
+            max_workers=5
+        ) as executor:
+            first = executor.submit(pools[0].refresh)
+            self.assertTrue(started.wait(5))
+            others = [executor.submit(pool.refresh) for pool in pools[1:]]
+            # Wait until all of the other refreshes are waiting for the pending request.
+            for _ in others:
+                self.assertTrue(waiters.acquire(timeout=5))
+            release.set()
+            for future in [first, *others]:
+                future.result()
+
+        self.assertEqual(account_info.call_count, 1)
+        self.assertEqual([pool.last_refreshed_round for pool in pools], [101] * 5)
+
+    def test_pending_refresh_older_than_min_round(self):
+        started = threading.Event()
+        release = threading.Event()
+        waiting = threading.Event()
+
+        def slow_account_info(address):
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+            return self.mock_account_info(address)
+
+        class WaitedFuture(Future):
+            def result(self, timeout=None):
+                waiting.set()
+                return super().result(timeout)
+
+        pools = [
+            Pool(
+                self.client,
+                Asset(id=self.asset_1_id),
+                Asset(id=self.asset_2_id),
+                fetch=False,
+            )
+            for _ in range(2)
+        ]
+        with patch(
+            "algosdk.v2client.algod.AlgodClient.account_info",
+            side_effect=slow_account_info,
+        ) as account_info, patch(
+            "tinyman.v2.pool_cache.Future", WaitedFuture
+        ), ThreadPoolExecutor(
+            max_workers=2
+        ) as executor:
+            first = executor.submit(pools[0].refresh)
+            self.assertTrue(started.wait(5))
+            # The pending request returns round 101.
+            second = executor.submit(pools[1].refresh, min_round=102)
+            self.assertTrue(waiting.wait(5))
+            release.set()
+            first.result()
+            second.result()
+
+        self.assertEqual(account_info.call_count, 2)
+        self.assertEqual(pools[0].last_refreshed_round, 101)
+        self.assertEqual(pools[1].last_refreshed_round, 102)
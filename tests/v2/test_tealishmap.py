@@ -0,0 +1,33 @@
+from array import array
+from unittest import TestCase
+
+from tinyman.v2.constants import TESTNET_VALIDATOR_APP_ID, MAINNET_VALIDATOR_APP_ID
+from tinyman.v2.utils import get_tealishmap, lookup_error, load_tealishmap
+
+
+class TealishMapTestCase(TestCase):
+    def test_get_tealishmap_is_memoized(self):
+        tealishmap = get_tealishmap(TESTNET_VALIDATOR_APP_ID)
+
+        self.assertIs(tealishmap, get_tealishmap(MAINNET_VALIDATOR_APP_ID))
+        self.assertIs(tealishmap, load_tealishmap("amm_approval.map.json"))
+        self.assertIsInstance(tealishmap.pc_teal, array)
+        self.assertIsInstance(tealishmap.teal_tealish, array)
+
+    def test_get_tealishmap_unknown_app(self):
+        self.assertIsNone(get_tealishmap(1))
+
+    def test_lookup_error(self):
+        tealishmap = get_tealishmap(TESTNET_VALIDATOR_APP_ID)
+        pc = next(
+            pc
+            for pc in range(len(tealishmap.pc_teal))
+            if tealishmap.get_error_for_pc(pc)
+        )
+
+        error_message = lookup_error(pc, "assert failed", tealishmap)
+
+        self.assertEqual(
+            error_message,
+            f"{tealishmap.get_error_for_pc(pc)} @ line {tealishmap.get_tealish_line_for_pc(pc)}",
+        )
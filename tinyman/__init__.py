@@ -0,0 +1,23 @@
+import importlib
+
+# Subpackages are imported on first attribute access, e.g. `tinyman.v2.TinymanV2MainnetClient`.
+SUBPACKAGES = {
+    "folks_lending",
+    "governance",
+    "liquid_staking",
+    "ordering",
+    "staking",
+    "swap_router",
+    "v1",
+    "v2",
+}
+
+
+def __getattr__(name):
+    if name in SUBPACKAGES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | SUBPACKAGES)
@@ -2,6 +2,12 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
 
+ALGO_ASSET_PARAMS = {
+    "name": "Algo",
+    "unit-name": "ALGO",
+    "decimals": 6,
+}
+
 
 @dataclass
 class Asset:
@@ -26,11 +32,10 @@ class Asset:
         if self.id > 0:
             params = algod.asset_info(self.id)["params"]
         else:
-            params = {
-                "name": "Algo",
-                "unit-name": "ALGO",
-                "decimals": 6,
-            }
+            params = ALGO_ASSET_PARAMS
+        return self.update_from_params(params)
+
+    def update_from_params(self, params: dict):
         self.name = params.get("name")
         self.unit_name = params.get("unit-name")
         self.decimals = params["decimals"]
@@ -0,0 +1,186 @@
+import json
+from base64 import b64decode, b64encode
+from typing import Optional
+from urllib.parse import quote
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+
+from tinyman.compat import SuggestedParams, Transaction
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncAlgodClient:
+    """
+    Minimal asyncio algod client on a pooled aiohttp session. Only the endpoints used by the SDK are implemented.
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: Optional[dict] = None,
+        connection_limit: int = 100,
+        timeout: int = 30,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncAlgodClient. Install it with `pip install tinyman-py-sdk[async]`."
+            )
+
+        self.algod_token = algod_token
+        self.algod_address = algod_address.rstrip("/")
+        self.headers = headers
+        self.connection_limit = connection_limit
+        self.timeout = timeout
+        self._session = session
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        # The session must be created inside the running event loop.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connection_limit),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def algod_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        data: Optional[bytes] = None,
+        headers: Optional[dict] = None,
+    ) -> dict:
+        request_headers = {
+            "User-Agent": "tinyman-py-sdk",
+            "X-Algo-API-Token": self.algod_token,
+        }
+        if self.headers:
+            request_headers.update(self.headers)
+        if headers:
+            request_headers.update(headers)
+
+        async with self.session.request(
+            method,
+            self.algod_address + "/v2" + path,
+            params=params,
+            data=data,
+            headers=request_headers,
+        ) as response:
+            body = await response.read()
+
+        if response.status >= 400:
+            message = body.decode("utf-8")
+            try:
+                message = json.loads(message)["message"]
+            except (ValueError, KeyError):
+                pass
+            raise AlgodHTTPError(message, response.status)
+
+        if not body:
+            return {}
+        return json.loads(body)
+
+    async def status(self) -> dict:
+        return await self.algod_request("GET", "/status")
+
+    async def status_after_block(self, block_num: int) -> dict:
+        return await self.algod_request(
+            "GET", f"/status/wait-for-block-after/{block_num}"
+        )
+
+    async def account_info(self, address: str) -> dict:
+        return await self.algod_request("GET", f"/accounts/{address}")
+
+    async def asset_info(self, asset_id: int) -> dict:
+        return await self.algod_request("GET", f"/assets/{asset_id}")
+
+    async def application_info(self, application_id: int) -> dict:
+        return await self.algod_request("GET", f"/applications/{application_id}")
+
+    async def application_box_by_name(
+        self, application_id: int, box_name: bytes
+    ) -> dict:
+        params = {"name": "b64:" + b64encode(box_name).decode()}
+        return await self.algod_request(
+            "GET", f"/applications/{application_id}/box", params=params
+        )
+
+    async def pending_transaction_info(self, transaction_id: str) -> dict:
+        return await self.algod_request(
+            "GET", f"/transactions/pending/{quote(transaction_id)}"
+        )
+
+    async def suggested_params(self) -> SuggestedParams:
+        response = await self.algod_request("GET", "/transactions/params")
+        return SuggestedParams(
+            fee=response["fee"],
+            first=response["last-round"],
+            last=response["last-round"] + 1000,
+            gh=response["genesis-hash"],
+            gen=response["genesis-id"],
+            flat_fee=False,
+            consensus_version=response["consensus-version"],
+            min_fee=response["min-fee"],
+        )
+
+    async def send_raw_transaction(self, txn: bytes) -> str:
+        response = await self.algod_request(
+            "POST",
+            "/transactions",
+            data=txn,
+            headers={"Content-Type": "application/x-binary"},
+        )
+        return response["txId"]
+
+    async def send_transactions(self, txns: list) -> str:
+        serialized = []
+        for txn in txns:
+            assert not isinstance(
+                txn, Transaction
+            ), f"Attempt to send UNSIGNED transaction {txn}"
+            serialized.append(b64decode(encoding.msgpack_encode(txn)))
+        return await self.send_raw_transaction(b"".join(serialized))
+
+
+async def wait_for_confirmation(
+    algod: AsyncAlgodClient, txid: str, wait_rounds: int = 1000
+) -> dict:
+    last_round = (await algod.status())["last-round"]
+    current_round = last_round + 1
+
+    while current_round <= last_round + wait_rounds:
+        try:
+            txn_info = await algod.pending_transaction_info(txid)
+        except AlgodHTTPError:
+            # The pending transaction may not be visible yet if algod is behind a load balancer.
+            txn_info = {}
+
+        if txn_info.get("pool-error"):
+            raise Exception(f"Transaction rejected: {txn_info['pool-error']}")
+
+        if txn_info.get("confirmed-round"):
+            return txn_info
+
+        await algod.status_after_block(current_round)
+        current_round += 1
+
+    raise Exception(f"Wait for transaction id {txid} timed out")
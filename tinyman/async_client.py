@@ -0,0 +1,88 @@
+import asyncio
+
+from tinyman.assets import Asset, ALGO_ASSET_PARAMS
+from tinyman.async_algod import wait_for_confirmation
+from tinyman.client import BaseTinymanClient
+from tinyman.optin import prepare_asset_optin_transactions
+
+
+class AsyncBaseTinymanClient(BaseTinymanClient):
+    """
+    asyncio counterpart of BaseTinymanClient. `algod_client` must be an `tinyman.async_algod.AsyncAlgodClient`.
+    """
+
+    is_async = True
+
+    async def fetch_asset(self, asset_id: int):
+        asset_id = int(asset_id)
+
+        if asset_id not in self.assets_cache:
+            if asset_id > 0:
+                params = (await self.algod.asset_info(asset_id))["params"]
+            else:
+                params = ALGO_ASSET_PARAMS
+            self.assets_cache[asset_id] = Asset(asset_id).update_from_params(params)
+        return self.assets_cache[asset_id]
+
+    async def fetch_assets(self, asset_ids: "list[int]") -> dict:
+        asset_ids = {int(asset_id) for asset_id in asset_ids}
+        assets = await asyncio.gather(
+            *[self.fetch_asset(asset_id) for asset_id in asset_ids]
+        )
+        return {asset.id: asset for asset in assets}
+
+    async def submit(self, transaction_group, wait=False):
+        try:
+            txid = await self.algod.send_transactions(
+                transaction_group.signed_transactions
+            )
+        except Exception as e:
+            self.handle_error(e, transaction_group)
+        if wait:
+            txn_info = await wait_for_confirmation(self.algod, txid)
+            txn_info["txid"] = txid
+            return txn_info
+        return {"txid": txid}
+
+    async def prepare_asset_optin_transactions(
+        self, asset_id, user_address=None, suggested_params=None
+    ):
+        user_address = user_address or self.user_address
+        if suggested_params is None:
+            suggested_params = await self.algod.suggested_params()
+        txn_group = prepare_asset_optin_transactions(
+            asset_id=asset_id,
+            sender=user_address,
+            suggested_params=suggested_params,
+        )
+        return txn_group
+
+    async def is_opted_in(self, user_address=None):
+        user_address = user_address or self.user_address
+        account_info = await self.algod.account_info(user_address)
+        for a in account_info.get("apps-local-state", []):
+            if a["id"] == self.validator_app_id:
+                return True
+        return False
+
+    async def asset_is_opted_in(self, asset_id, user_address=None):
+        user_address = user_address or self.user_address
+
+        if asset_id == 0:
+            # ALGO
+            return True
+
+        account_info = await self.algod.account_info(user_address)
+        for a in account_info.get("assets", []):
+            if a["asset-id"] == asset_id:
+                return True
+        return False
+
+    async def close(self):
+        await self.algod.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
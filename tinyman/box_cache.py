@@ -0,0 +1,140 @@
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+from tinyman.constants import CACHE_DIR_ENV
+
+
+class BoxCache:
+    """
+    Storage of box values keyed by (app_id, box_name). Only immutable boxes should be cached.
+    """
+
+    def get(self, app_id: int, box_name: bytes) -> Optional[bytes]:
+        raise NotImplementedError()
+
+    def set(self, app_id: int, box_name: bytes, value: bytes) -> None:
+        raise NotImplementedError()
+
+    def delete(self, app_id: int, box_name: bytes) -> None:
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        raise NotImplementedError()
+
+
+class InMemoryBoxCache(BoxCache):
+    def __init__(self, max_size: Optional[int] = 100_000):
+        self.max_size = max_size
+        self.values = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, app_id: int, box_name: bytes) -> Optional[bytes]:
+        key = (app_id, box_name)
+        with self.lock:
+            value = self.values.get(key)
+            if value is not None:
+                self.values.move_to_end(key)
+            return value
+
+    def set(self, app_id: int, box_name: bytes, value: bytes) -> None:
+        key = (app_id, box_name)
+        with self.lock:
+            self.values[key] = value
+            self.values.move_to_end(key)
+            if self.max_size is not None:
+                while len(self.values) > self.max_size:
+                    self.values.popitem(last=False)
+
+    def delete(self, app_id: int, box_name: bytes) -> None:
+        with self.lock:
+            self.values.pop((app_id, box_name), None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.values.clear()
+
+
+class SQLiteBoxCache(BoxCache):
+    """
+    Persistent box cache in a SQLite database.
+
+    Every write is a transaction, the database can be shared by multiple threads and processes (WAL mode).
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 30):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS boxes (app_id INTEGER NOT NULL, name BLOB NOT NULL, value BLOB NOT NULL, PRIMARY KEY (app_id, name))")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can not be shared between threads.
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self.local.connection = connection
+        return connection
+
+    def get(self, app_id: int, box_name: bytes) -> Optional[bytes]:
+        row = self.connection.execute("SELECT value FROM boxes WHERE app_id = ? AND name = ?", (app_id, box_name)).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def set(self, app_id: int, box_name: bytes, value: bytes) -> None:
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO boxes (app_id, name, value) VALUES (?, ?, ?)", (app_id, box_name, value))
+
+    def delete(self, app_id: int, box_name: bytes) -> None:
+        with self.connection:
+            self.connection.execute("DELETE FROM boxes WHERE app_id = ? AND name = ?", (app_id, box_name))
+
+    def clear(self) -> None:
+        with self.connection:
+            self.connection.execute("DELETE FROM boxes")
+
+    def close(self) -> None:
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+
+
+_default_box_cache = None
+_default_box_cache_lock = threading.Lock()
+
+
+def get_default_box_cache() -> BoxCache:
+    """
+    Returns the process-wide box cache. It is kept in memory unless $TINYMAN_CACHE_DIR is set, then it is a SQLite database in that directory.
+    Use `set_default_box_cache(SQLiteBoxCache(path))` to persist the cache elsewhere.
+    """
+    global _default_box_cache
+
+    with _default_box_cache_lock:
+        if _default_box_cache is None:
+            cache_dir = os.environ.get(CACHE_DIR_ENV)
+            if cache_dir:
+                _default_box_cache = SQLiteBoxCache(Path(cache_dir) / "governance-box-cache.sqlite3")
+            else:
+                _default_box_cache = InMemoryBoxCache()
+        return _default_box_cache
+
+
+def set_default_box_cache(box_cache: Optional[BoxCache]) -> None:
+    global _default_box_cache
+
+    with _default_box_cache_lock:
+        _default_box_cache = box_cache
@@ -0,0 +1,186 @@
+import threading
+import time
+from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Union
+
+from algosdk.error import AlgodHTTPError
+
+from tinyman.box_cache import BoxCache, get_default_box_cache
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def _get_cache(cache: Union[bool, BoxCache, None]) -> Optional[BoxCache]:
+    # `cache` is a BoxCache or True for the process-wide default cache.
+    if cache is True:
+        return get_default_box_cache()
+    if cache is False:
+        return None
+    return cache
+
+
+def get_box_value(
+    algod, app_id: int, box_name: bytes, cache: Union[bool, BoxCache] = False
+) -> Optional[bytes]:
+    """
+    Returns the value of the box or None if the box does not exist. Only immutable boxes should be cached.
+    """
+    cache = _get_cache(cache)
+    if cache is not None and (value := cache.get(app_id, box_name)) is not None:
+        return value
+
+    try:
+        response = algod.application_box_by_name(app_id, box_name)
+    except AlgodHTTPError as e:
+        if str(e) != "box not found":
+            raise e
+        return None
+
+    value = b64decode(response["value"])
+    if cache is not None:
+        cache.set(app_id, box_name, value)
+    return value
+
+
+def get_box_values(
+    algod,
+    app_id: int,
+    box_names: Iterable[bytes],
+    cache: Union[bool, BoxCache] = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> "list[Optional[bytes]]":
+    """
+    Returns the values of the boxes in the given order, the boxes are fetched concurrently.
+    """
+    box_names = list(box_names)
+    cache = _get_cache(cache)
+    if len(box_names) <= 1 or max_workers <= 1:
+        return [
+            get_box_value(algod, app_id, box_name, cache=cache)
+            for box_name in box_names
+        ]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(box_names))) as executor:
+        return list(
+            executor.map(
+                lambda box_name: get_box_value(algod, app_id, box_name, cache=cache),
+                box_names,
+            )
+        )
+
+
+def get_app_box_values(
+    algod,
+    boxes: Iterable["tuple[int, bytes]"],
+    cache: Union[bool, BoxCache] = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> "list[Optional[bytes]]":
+    """
+    Returns the values of (app_id, box_name) pairs of many apps in the given order, the boxes are fetched concurrently.
+    """
+    boxes = list(boxes)
+    cache = _get_cache(cache)
+    if not boxes:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(boxes))) as executor:
+        return list(
+            executor.map(
+                lambda box: get_box_value(algod, box[0], box[1], cache=cache),
+                boxes,
+            )
+        )
+
+
+def get_box_names(algod, app_id: int) -> "list[bytes]":
+    response = algod.application_boxes(app_id, limit=0)
+    return [b64decode(box["name"]) for box in response["boxes"]]
+
+
+class BoxReader:
+    """
+    Box access shared by the clients of an algod client.
+
+    Existence checks are a single box lookup by default, the response includes the box value.
+    With `cache_box_names=True` they use a listing of the box names of the app instead,
+    which is cached for `box_names_max_age` seconds and should be invalidated after a transaction that creates or deletes boxes.
+    The listing downloads all the box names of the app. The apps of the clients keep a box per account or order,
+    a listing grows with their usage while a lookup stays one small box, so the clients keep the default.
+    The listing suits repeated checks on apps with few boxes.
+    """
+
+    def __init__(
+        self,
+        algod,
+        cache: Optional[BoxCache] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_box_names: bool = False,
+        box_names_max_age: Optional[float] = 60,
+    ):
+        self.algod = algod
+        # Used for the calls with cache=True, the process-wide default cache if None.
+        self.cache = cache
+        self.max_workers = max_workers
+        self.cache_box_names = cache_box_names
+        # None never expires.
+        self.box_names_max_age = box_names_max_age
+        self.box_names = {}
+        self.lock = threading.Lock()
+
+    def _get_cache(self, cache: Union[bool, BoxCache]) -> Optional[BoxCache]:
+        if cache is True and self.cache is not None:
+            return self.cache
+        return _get_cache(cache)
+
+    def get_box(
+        self, app_id: int, box_name: bytes, cache: Union[bool, BoxCache] = False
+    ) -> Optional[bytes]:
+        return get_box_value(self.algod, app_id, box_name, cache=self._get_cache(cache))
+
+    def get_boxes(
+        self,
+        app_id: int,
+        box_names: Iterable[bytes],
+        cache: Union[bool, BoxCache] = False,
+    ) -> "dict[bytes, Optional[bytes]]":
+        box_names = list(dict.fromkeys(box_names))
+        values = get_box_values(
+            self.algod,
+            app_id,
+            box_names,
+            cache=self._get_cache(cache),
+            max_workers=self.max_workers,
+        )
+        return dict(zip(box_names, values))
+
+    def get_box_names(self, app_id: int, refresh: bool = False) -> "frozenset[bytes]":
+        with self.lock:
+            entry = self.box_names.get(app_id)
+        if entry is not None and not refresh:
+            fetched_at, box_names = entry
+            if (
+                self.box_names_max_age is None
+                or time.monotonic() - fetched_at < self.box_names_max_age
+            ):
+                return box_names
+
+        box_names = frozenset(get_box_names(self.algod, app_id))
+        with self.lock:
+            self.box_names[app_id] = (time.monotonic(), box_names)
+        return box_names
+
+    def box_exists(self, app_id: int, box_name: bytes, refresh: bool = False) -> bool:
+        """
+        Returns whether the box exists, errors other than "box not found" are raised.
+        """
+        if not self.cache_box_names:
+            return self.get_box(app_id, box_name) is not None
+        return box_name in self.get_box_names(app_id, refresh=refresh)
+
+    def invalidate_box_names(self, app_id: Optional[int] = None) -> None:
+        with self.lock:
+            if app_id is None:
+                self.box_names.clear()
+            else:
+                self.box_names.pop(app_id, None)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from tinyman.compat import wait_for_confirmation
@@ -9,6 +10,8 @@ from tinyman.utils import get_version, generate_app_call_note
 
 
 class BaseTinymanClient:
+    is_async = False
+
     def __init__(
         self,
         algod_client: AlgodClient,
@@ -38,6 +41,23 @@ class BaseTinymanClient:
             self.assets_cache[asset_id] = asset
         return self.assets_cache[asset_id]
 
+    def fetch_assets(self, asset_ids: "list[int]", max_workers: int = 10) -> dict:
+        asset_ids = {int(asset_id) for asset_id in asset_ids}
+        missing_asset_ids = [
+            asset_id for asset_id in asset_ids if asset_id not in self.assets_cache
+        ]
+
+        if missing_asset_ids:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                assets = executor.map(
+                    lambda asset_id: Asset(asset_id).fetch(self.algod),
+                    missing_asset_ids,
+                )
+                for asset in assets:
+                    self.assets_cache[asset.id] = asset
+
+        return {asset_id: self.assets_cache[asset_id] for asset_id in asset_ids}
+
     def submit(self, transaction_group, wait=False):
         try:
             txid = self.algod.send_transactions(transaction_group.signed_transactions)
@@ -15,3 +15,6 @@ DAY = 24 * HOUR
 WEEK = 7 * DAY
 YEAR = 365 * DAY
 HOURS_PER_YEAR = 365 * 24
+
+# Directory of the optional on-disk caches (compiled programs, immutable boxes).
+CACHE_DIR_ENV = "TINYMAN_CACHE_DIR"
@@ -0,0 +1,317 @@
+from base64 import b32encode, b64decode
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from Cryptodome.Hash import SHA512
+from algosdk import abi
+from algosdk.abi.base_type import ABI_LENGTH_SIZE
+from algosdk.encoding import encode_address, msgpack_encode
+
+SELECTOR_SIZE = 4
+BOOL_VALUES = {b"\x80": True, b"\x00": False}
+
+
+def _get_arg_decoder(arg_type: abi.ABIType) -> Callable[[bytes], object]:
+    # Fast paths for the common types, the results are the same as arg_type.decode.
+    if isinstance(arg_type, abi.UintType):
+        return lambda value: int.from_bytes(value, "big")
+    if isinstance(arg_type, abi.BoolType):
+        return lambda value: BOOL_VALUES[value] if value in BOOL_VALUES else arg_type.decode(value)
+    if isinstance(arg_type, abi.AddressType):
+        return encode_address
+    if isinstance(arg_type, abi.ArrayStaticType) and isinstance(arg_type.child_type, abi.ByteType):
+        return bytes
+    return arg_type.decode
+
+
+@dataclass
+class EventArgDecoder:
+    name: str
+    decode: Callable[[bytes], object]
+    # Size of a static argument
+    size: Optional[int] = None
+    # Dynamic arguments are prefixed with their length, in elements of `element_size` bytes.
+    element_size: Optional[int] = None
+
+
+class EventDecoderPlan:
+    """
+    Precomputed decoding steps of an event.
+
+    If all arguments are static the offsets of the arguments in the log are fixed and computed once.
+    """
+
+    def __init__(self, event: "Event"):
+        self.event_name = event.name
+        self.arg_decoders = []
+        for arg in event.args:
+            if arg.type.is_dynamic():
+                if isinstance(arg.type, abi.StringType):
+                    element_size = 1
+                elif isinstance(arg.type, abi.ArrayDynamicType):
+                    element_size = arg.type.child_type.byte_len()
+                else:
+                    raise NotImplementedError()
+                self.arg_decoders.append(EventArgDecoder(name=arg.name, decode=_get_arg_decoder(arg.type), element_size=element_size))
+            else:
+                self.arg_decoders.append(EventArgDecoder(name=arg.name, decode=_get_arg_decoder(arg.type), size=arg.type.byte_len()))
+
+        self.is_static = all(arg_decoder.element_size is None for arg_decoder in self.arg_decoders)
+        self.static_fields = []
+        if self.is_static:
+            start = SELECTOR_SIZE
+            for arg_decoder in self.arg_decoders:
+                self.static_fields.append((arg_decoder.name, start, start + arg_decoder.size, arg_decoder.decode))
+                start += arg_decoder.size
+
+    def decode(self, log: bytes) -> dict:
+        data = {
+            "event_name": self.event_name
+        }
+        if self.is_static:
+            for name, start, end, decode in self.static_fields:
+                data[name] = decode(log[start:end])
+            return data
+
+        start = SELECTOR_SIZE
+        for arg_decoder in self.arg_decoders:
+            if arg_decoder.element_size is None:
+                end = start + arg_decoder.size
+            else:
+                end = start + ABI_LENGTH_SIZE + int.from_bytes(log[start:start + ABI_LENGTH_SIZE], "big") * arg_decoder.element_size
+            data[arg_decoder.name] = arg_decoder.decode(log[start:end])
+            start = end
+        return data
+
+
+@dataclass
+class Event:
+    name: str
+    args: [abi.Argument]
+
+    @property
+    def signature(self):
+        arg_string = ",".join(str(arg.type) for arg in self.args)
+        event_signature = "{}({})".format(self.name, arg_string)
+        return event_signature
+
+    @cached_property
+    def selector(self):
+        # Events are not expected to change, the hash is computed once.
+        sha_512_256_hash = SHA512.new(truncate="256")
+        sha_512_256_hash.update(self.signature.encode("utf-8"))
+        selector = sha_512_256_hash.digest()[:SELECTOR_SIZE]
+        return selector
+
+    @cached_property
+    def decoder_plan(self) -> EventDecoderPlan:
+        return EventDecoderPlan(self)
+
+    def decode(self, log):
+        selector = log[:SELECTOR_SIZE]
+        assert self.selector == selector
+        return self.decoder_plan.decode(log)
+
+    def encode(self, parameters: Optional[list] = None):
+        log = self.selector
+        if parameters is None:
+            parameters = []
+
+        assert len(parameters) == len(self.args)
+        for parameter, arg in zip(parameters, self.args):
+            log += arg.type.encode(parameter)
+        return log
+
+
+class EventRegistry:
+    """
+    Events keyed by selector, a log is dispatched to its event with a single dict lookup.
+    """
+
+    def __init__(self, events: Iterable[Event] = ()):
+        self.events_by_selector = {}
+        for event in events:
+            self.add(event)
+
+    def __len__(self):
+        return len(self.events_by_selector)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self.events_by_selector.values())
+
+    def __contains__(self, event: Event) -> bool:
+        return event.selector in self.events_by_selector
+
+    def add(self, event: Event):
+        current_event = self.events_by_selector.get(event.selector)
+        if current_event is not None and current_event.signature != event.signature:
+            raise ValueError(f"Selector collision: {current_event.signature}, {event.signature}")
+        self.events_by_selector[event.selector] = event
+
+    def get_event(self, log: bytes) -> Optional[Event]:
+        return self.events_by_selector.get(log[:SELECTOR_SIZE])
+
+    def decode(self, log: bytes) -> Optional[dict]:
+        event = self.events_by_selector.get(log[:SELECTOR_SIZE])
+        if event is None:
+            return None
+        return event.decoder_plan.decode(log)
+
+    def iter_decode(self, logs: Iterable[bytes], skip_unknown: bool = True) -> Iterator[dict]:
+        """
+        Decodes the logs one by one, the logs can be a generator of any length.
+        Logs of unknown events are skipped, or raise a ValueError if `skip_unknown` is False.
+        """
+        events_by_selector = self.events_by_selector
+        for log in logs:
+            event = events_by_selector.get(log[:SELECTOR_SIZE])
+            if event is None:
+                if skip_unknown:
+                    continue
+                raise ValueError(f"Unknown event selector: {log[:SELECTOR_SIZE].hex()}")
+            yield event.decoder_plan.decode(log)
+
+
+def get_event_registry(events: Union[EventRegistry, Iterable[Event]]) -> EventRegistry:
+    # Lists of events are indexed on every call, pass the module level registries (e.g. `vault_event_registry`) instead.
+    if isinstance(events, EventRegistry):
+        return events
+    return EventRegistry(events)
+
+
+def get_event_by_log(log: bytes, events: Union[EventRegistry, list[Event]]) -> Optional[Event]:
+    return get_event_registry(events).get_event(log)
+
+
+def decode_logs(logs: list[bytes], events: Union[EventRegistry, list[Event]]) -> list[dict]:
+    return list(get_event_registry(events).iter_decode(logs))
+
+
+@dataclass
+class EventRecord:
+    round: int
+    txid: str
+    # Position of the transaction in its group, None if it is not known (grouped indexer transactions)
+    group_index: Optional[int]
+    # Indexes of the inner transactions leading to the app call, empty for the top level app call.
+    inner_path: tuple
+    # Position of the log in the logs of the app call
+    log_index: int
+    app_id: int
+    event_name: str
+    # The decoded event, as returned by Event.decode
+    data: dict
+
+
+def _get_log_selector(log: Union[bytes, str]) -> bytes:
+    # Logs are base64 encoded in the JSON responses, only the first 8 characters (6 bytes) are decoded to find the event.
+    if isinstance(log, str):
+        return b64decode(log[:8])[:SELECTOR_SIZE]
+    return log[:SELECTOR_SIZE]
+
+
+def iter_app_call_logs(transaction: dict, inner_path: tuple = ()) -> Iterator[tuple[int, tuple, list]]:
+    """
+    Yields (app_id, inner_path, logs) of the app calls with logs in a transaction and its inner transactions, in execution order.
+
+    Both indexer transactions and block transactions (SignedTxnInBlock with the apply data in `dt`) are supported. The logs are not decoded.
+    """
+    if "txn" in transaction:
+        # Block format
+        apply_data = transaction.get("dt", {})
+        app_id = transaction["txn"].get("apid") or transaction.get("apid")
+        logs = apply_data.get("lg")
+        inner_transactions = apply_data.get("itx", [])
+    else:
+        # Indexer format
+        app_id = transaction.get("application-transaction", {}).get("application-id") or transaction.get("created-application-index")
+        logs = transaction.get("logs")
+        inner_transactions = transaction.get("inner-txns", [])
+
+    if app_id and logs:
+        yield app_id, inner_path, logs
+    for index, inner_transaction in enumerate(inner_transactions):
+        yield from iter_app_call_logs(inner_transaction, inner_path + (index,))
+
+
+def _iter_transaction_events(transaction: dict, round: int, txid: str, group_index: Optional[int], registries: dict, skip_unknown: bool) -> Iterator[EventRecord]:
+    for app_id, inner_path, logs in iter_app_call_logs(transaction):
+        registry = registries.get(app_id)
+        if registry is None:
+            continue
+
+        events_by_selector = registry.events_by_selector
+        for log_index, log in enumerate(logs):
+            event = events_by_selector.get(_get_log_selector(log))
+            if event is None:
+                if skip_unknown:
+                    continue
+                raise ValueError(f"Unknown event log of app {app_id} in round {round}")
+
+            data = event.decoder_plan.decode(b64decode(log) if isinstance(log, str) else log)
+            yield EventRecord(
+                round=round,
+                txid=txid,
+                group_index=group_index,
+                inner_path=inner_path,
+                log_index=log_index,
+                app_id=app_id,
+                event_name=event.name,
+                data=data,
+            )
+
+
+def iter_transaction_events(transactions: Iterable[dict], registries: dict, skip_unknown: bool = True) -> Iterator[EventRecord]:
+    """
+    Decodes the events of a stream of confirmed indexer transactions.
+
+    `registries` maps app ids to an EventRegistry (or a list of events), the logs of the other apps are not decoded.
+    Transactions are consumed one by one, memory use does not depend on the length of the stream.
+
+    Indexer transactions do not include their group position and searches (e.g. by application id) do not return the whole groups,
+    so the group index is None for grouped transactions and 0 for the others. Use `iter_block_events` for the group positions.
+    """
+    registries = {app_id: get_event_registry(registry) for app_id, registry in registries.items()}
+    for transaction in transactions:
+        group_index = None if transaction.get("group") else 0
+        yield from _iter_transaction_events(transaction, transaction["confirmed-round"], transaction["id"], group_index, registries, skip_unknown)
+
+
+def get_block_transaction_id(transaction: dict, genesis_id: str, genesis_hash: bytes) -> str:
+    """
+    Returns the id of a transaction in a msgpack decoded block, the genesis fields are omitted in the block.
+    """
+    txn = dict(transaction["txn"])
+    if transaction.get("hgi"):
+        txn["gen"] = genesis_id
+    txn["gh"] = genesis_hash
+    sha_512_256_hash = SHA512.new(truncate="256")
+    sha_512_256_hash.update(b"TX" + b64decode(msgpack_encode(txn)))
+    return b32encode(sha_512_256_hash.digest()).decode().strip("=")
+
+
+def iter_block_events(blocks: Iterable[dict], registries: dict, skip_unknown: bool = True) -> Iterator[EventRecord]:
+    """
+    Decodes the events of a stream of msgpack decoded blocks, e.g. the `block` field of `algod.block_info(round, response_format="msgpack")`.
+
+    Transaction ids are only computed for the transactions with events.
+    """
+    registries = {app_id: get_event_registry(registry) for app_id, registry in registries.items()}
+    for block in blocks:
+        block = block.get("block", block)
+        round = block.get("rnd", 0)
+        previous_group = None
+        group_index = 0
+        for transaction in block.get("txns", []):
+            group = transaction["txn"].get("grp")
+            group_index = group_index + 1 if group is not None and group == previous_group else 0
+            previous_group = group
+
+            records = _iter_transaction_events(transaction, round, None, group_index, registries, skip_unknown)
+            txid = None
+            for record in records:
+                if txid is None:
+                    txid = get_block_transaction_id(transaction, block.get("gen"), block.get("gh"))
+                record.txid = txid
+                yield record
@@ -1,3 +1,6 @@
+from algosdk.error import AlgodHTTPError
+
+
 class PoolIsNotBootstrapped(Exception):
     pass
 
@@ -20,3 +23,18 @@ class InsufficientReserves(Exception):
 
 class LowSwapAmountError(Exception):
     pass
+
+
+class AsyncClientNotSupported(Exception):
+    pass
+
+
+class BoxNotFound(AlgodHTTPError):
+    """
+    Raised by the `get_box` methods of the clients. It is an AlgodHTTPError like the error of `application_box_by_name`.
+    """
+
+    def __init__(self, app_id: int, box_name: bytes):
+        super().__init__("box not found", code=404)
+        self.app_id = app_id
+        self.box_name = box_name
@@ -0,0 +1,139 @@
+from typing import Iterable, Iterator, Optional
+
+# Offsets (from the left) of the set bits of each byte value.
+BYTE_SET_BIT_OFFSETS = tuple(
+    tuple(offset for offset in range(8) if value & (0x80 >> offset))
+    for value in range(256)
+)
+
+
+class Bitset:
+    """
+    Immutable bit array backed by bytes, as stored in the claim sheet and attendance sheet boxes.
+
+    Bits are indexed from the left, bit 0 is the most significant bit of the first byte.
+    It behaves like a set of the indexes of the set bits; `test` and indexing check a single bit.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value: bytes = b""):
+        self.value = bytes(value)
+
+    @classmethod
+    def from_indexes(cls, indexes: Iterable[int], size: int) -> "Bitset":
+        # size is the number of bits, it is rounded up to a whole byte.
+        value = bytearray((size + 7) // 8)
+        for n in indexes:
+            if not 0 <= n < len(value) * 8:
+                raise ValueError(f"n should be less than {len(value) * 8}")
+            value[n >> 3] |= 0x80 >> (n & 7)
+        return cls(value)
+
+    @property
+    def size(self) -> int:
+        return len(self.value) * 8
+
+    def test(self, n: int) -> bool:
+        if not 0 <= n < self.size:
+            raise ValueError(f"n should be less than {self.size}")
+        return bool(self.value[n >> 3] & (0x80 >> (n & 7)))
+
+    def __getitem__(self, n: int) -> bool:
+        # Indexing raises IndexError like a sequence, `test` keeps the ValueError of check_nth_bit_from_left.
+        if not 0 <= n < self.size:
+            raise IndexError(f"n should be less than {self.size}")
+        return bool(self.value[n >> 3] & (0x80 >> (n & 7)))
+
+    def __contains__(self, n: int) -> bool:
+        return 0 <= n < self.size and bool(self.value[n >> 3] & (0x80 >> (n & 7)))
+
+    def __iter__(self) -> Iterator[int]:
+        return self.iter_set()
+
+    def __len__(self) -> int:
+        # Number of set bits, like a set.
+        return sum(len(BYTE_SET_BIT_OFFSETS[byte]) for byte in self.value if byte)
+
+    def __bool__(self) -> bool:
+        return any(self.value)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Bitset):
+            return NotImplemented
+        return self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        return f"Bitset({list(self.iter_set())}, size={self.size})"
+
+    def __bytes__(self) -> bytes:
+        return self.value
+
+    def iter_set(self, start: int = 0, stop: Optional[int] = None) -> Iterator[int]:
+        """
+        Yields the indexes of the set bits in [start, stop) in ascending order.
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        for byte_index in range(max(start, 0) >> 3, (stop + 7) >> 3):
+            byte = self.value[byte_index]
+            if not byte:
+                continue
+            for offset in BYTE_SET_BIT_OFFSETS[byte]:
+                n = (byte_index << 3) + offset
+                if start <= n < stop:
+                    yield n
+
+    def iter_unset(self, start: int = 0, stop: Optional[int] = None) -> Iterator[int]:
+        """
+        Yields the indexes of the unset bits in [start, stop) in ascending order.
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        for byte_index in range(max(start, 0) >> 3, (stop + 7) >> 3):
+            byte = self.value[byte_index] ^ 0xFF
+            if not byte:
+                continue
+            for offset in BYTE_SET_BIT_OFFSETS[byte]:
+                n = (byte_index << 3) + offset
+                if start <= n < stop:
+                    yield n
+
+    def to_bools(self) -> list[bool]:
+        return [bool(byte & (0x80 >> offset)) for byte in self.value for offset in range(8)]
+
+    def _combine(self, other: "Bitset", operator) -> "Bitset":
+        if not isinstance(other, Bitset):
+            return NotImplemented
+        # The shorter bitset is padded with unset bits on the right.
+        length = max(len(self.value), len(other.value))
+        a = int.from_bytes(self.value.ljust(length, b"\x00"), "big")
+        b = int.from_bytes(other.value.ljust(length, b"\x00"), "big")
+        return Bitset(operator(a, b).to_bytes(length, "big"))
+
+    def __or__(self, other: "Bitset") -> "Bitset":
+        return self._combine(other, lambda a, b: a | b)
+
+    def __and__(self, other: "Bitset") -> "Bitset":
+        return self._combine(other, lambda a, b: a & b)
+
+    def __xor__(self, other: "Bitset") -> "Bitset":
+        return self._combine(other, lambda a, b: a ^ b)
+
+    def __sub__(self, other: "Bitset") -> "Bitset":
+        return self._combine(other, lambda a, b: a & ~b)
+
+    def union(self, other: "Bitset") -> "Bitset":
+        return self | other
+
+    def intersection(self, other: "Bitset") -> "Bitset":
+        return self & other
+
+    def difference(self, other: "Bitset") -> "Bitset":
+        return self - other
+
+    def symmetric_difference(self, other: "Bitset") -> "Bitset":
+        return self ^ other
+
+    def issubset(self, other: "Bitset") -> bool:
+        return not (self - other)
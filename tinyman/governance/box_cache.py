@@ -0,0 +1,8 @@
+# The box cache is shared by all clients, it is kept here for backwards compatibility.
+from tinyman.box_cache import (  # noqa: F401
+    BoxCache,
+    InMemoryBoxCache,
+    SQLiteBoxCache,
+    get_default_box_cache,
+    set_default_box_cache,
+)
@@ -2,27 +2,31 @@ import time
 from typing import Optional
 
 import requests
-from algosdk.encoding import encode_address, decode_address
+from algosdk.encoding import decode_address
 from algosdk.v2client.algod import AlgodClient
 
+from tinyman.boxes import BoxReader
 from tinyman.compat import SuggestedParams
 from tinyman.compat import wait_for_confirmation
+from tinyman.governance.bitset import Bitset
 from tinyman.governance.constants import TESTNET_TINY_ASSET_ID, TESTNET_VAULT_APP_ID, WEEK, TESTNET_REWARDS_APP_ID, TESTNET_STAKING_VOTING_APP_ID, TESTNET_PROPOSAL_VOTING_APP_ID, \
     MAINNET_TINY_ASSET_ID, MAINNET_VAULT_APP_ID, MAINNET_REWARDS_APP_ID, MAINNET_STAKING_VOTING_APP_ID, MAINNET_PROPOSAL_VOTING_APP_ID
 from tinyman.governance.proposal_voting.constants import ACCOUNT_ATTENDANCE_SHEET_BOX_SIZE, EXECUTION_HASH_SIZE
 from tinyman.governance.proposal_voting.exceptions import InsufficientTinyPower
 from tinyman.governance.proposal_voting.storage import get_proposal, ProposalVotingAppGlobalState
 from tinyman.governance.proposal_voting.transactions import prepare_create_proposal_transactions, prepare_cast_vote_transactions
+from tinyman.governance.rewards.calculator import RewardsCalculator, PendingReward
 from tinyman.governance.rewards.constants import REWARD_CLAIM_SHEET_BOX_SIZE
-from tinyman.governance.rewards.storage import get_reward_histories, RewardsAppGlobalState, get_reward_history_index_at, get_reward_claim_sheet
+from tinyman.governance.rewards.storage import get_reward_histories, RewardsAppGlobalState, get_reward_history_index_at, get_reward_claim_sheet, get_rewards_app_global_state
 from tinyman.governance.rewards.transactions import prepare_claim_reward_transactions, prepare_create_reward_period_transactions
 from tinyman.governance.staking_voting.storage import get_staking_distribution_proposal, get_staking_attendance_sheet_box_name, StakingVotingAppGlobalState
 from tinyman.governance.staking_voting.transactions import prepare_cast_vote_for_staking_distribution_proposal_transactions
-from tinyman.governance.utils import get_global_state, get_all_box_names, box_exists
+from tinyman.governance.utils import get_global_state
 from tinyman.governance.vault.constants import MAX_LOCK_TIME, MIN_LOCK_TIME
 from tinyman.governance.vault.exceptions import ShortLockEndTime, TooLongLockEndTime
-from tinyman.governance.vault.storage import get_last_total_powers_indexes, get_power_index_at, get_account_state, get_slope_change, get_account_powers, get_all_total_powers, \
-    VaultAppGlobalState
+from tinyman.governance.vault.storage import get_last_total_powers_indexes, get_power_index_at, get_account_state, get_slope_change, get_account_powers, \
+    VaultAppGlobalState, TotalPowerHistory, SlopeChangeIndex, get_power_indexes_at, cumulative_powers_at
+from tinyman.governance.vault.snapshot import VaultSnapshot, fetch_vault_snapshot
 from tinyman.governance.vault.transactions import prepare_create_lock_transactions, prepare_increase_lock_amount_transactions, prepare_extend_lock_end_time_transactions, \
     prepare_create_checkpoints_transactions, prepare_withdraw_transactions
 from tinyman.governance.vault.utils import get_bias, get_cumulative_power_delta, get_start_timestamp_of_week
@@ -52,6 +56,10 @@ class TinymanGovernanceClient:
         self.api_base_url = api_base_url
         self.user_address = user_address
         self.client_name = client_name
+        self.total_power_history = TotalPowerHistory(algod=algod_client, app_id=vault_app_id)
+        self.slope_change_index = SlopeChangeIndex(algod=algod_client, app_id=vault_app_id)
+        self.rewards_calculator = RewardsCalculator(algod=algod_client, rewards_app_id=rewards_app_id, vault_app_id=vault_app_id)
+        self.boxes = BoxReader(algod_client)
 
     def submit(self, transaction_group, wait=False):
         try:
@@ -60,6 +68,9 @@ class TinymanGovernanceClient:
             self.handle_error(e, transaction_group)
         if wait:
             txn_info = wait_for_confirmation(self.algod, txid)
+            # The transactions may have created boxes and changed the slope changes.
+            self.boxes.invalidate_box_names()
+            self.slope_change_index.invalidate()
             txn_info["txid"] = txid
             return txn_info
         return {"txid": txid}
@@ -170,11 +181,7 @@ class TinymanGovernanceClient:
             timestamp = int(time.time())
 
         vault_app_global_state = self.fetch_vault_app_global_state()
-        total_powers = get_all_total_powers(
-            algod=self.algod,
-            app_id=self.vault_app_id,
-            total_power_count=vault_app_global_state.total_power_count
-        )
+        total_powers = self.total_power_history.refresh(vault_app_global_state.total_power_count)
         total_power_index = get_power_index_at(total_powers, timestamp)
         if total_power_index is None:
             return 0
@@ -189,11 +196,14 @@ class TinymanGovernanceClient:
         tiny_power = total_power.bias
         slope = total_power.slope
 
+        if week_timestamps:
+            self.slope_change_index.refresh_range(start_timestamp=week_timestamps[0], end_timestamp=week_timestamps[-1])
+
         for time_range in time_ranges:
             time_delta = time_range[1] - time_range[0]
             bias_delta = get_bias(slope, time_delta)
             tiny_power = max(tiny_power - bias_delta, 0)
-            slope_delta = get_slope_change(algod=self.algod, app_id=self.vault_app_id, timestamp=time_range[1]) or 0
+            slope_delta = self.slope_change_index.get_slope_delta(time_range[1])
             slope = max(slope - slope_delta, 0)
             if tiny_power == 0 or slope == 0:
                 tiny_power = 0
@@ -218,14 +228,18 @@ class TinymanGovernanceClient:
         )
         return VaultAppGlobalState(**data)
 
+    def fetch_vault_snapshot(self, max_workers: int = 8) -> VaultSnapshot:
+        return fetch_vault_snapshot(
+            algod=self.algod,
+            app_id=self.vault_app_id,
+            max_workers=max_workers
+        )
+
     def fetch_rewards_app_global_state(self) -> RewardsAppGlobalState:
-        data = get_global_state(
+        return get_rewards_app_global_state(
             algod=self.algod,
             app_id=self.rewards_app_id
         )
-        data["manager"] = encode_address(data["manager"])
-        data["rewards_manager"] = encode_address(data["rewards_manager"])
-        return RewardsAppGlobalState(**data)
 
     def fetch_staking_voting_app_global_state(self) -> StakingVotingAppGlobalState:
         data = get_global_state(
@@ -445,11 +459,7 @@ class TinymanGovernanceClient:
         vault_app_global_state = self.fetch_vault_app_global_state()
         rewards_app_global_state = self.fetch_rewards_app_global_state()
 
-        total_powers = get_all_total_powers(
-            algod=self.algod,
-            app_id=self.vault_app_id,
-            total_power_count=vault_app_global_state.total_power_count
-        )
+        total_powers = self.total_power_history.refresh(vault_app_global_state.total_power_count)
 
         period_start_timestamp = rewards_app_global_state.first_period_timestamp + (rewards_app_global_state.reward_period_count * WEEK)
         period_end_timestamp = period_start_timestamp + WEEK
@@ -499,10 +509,8 @@ class TinymanGovernanceClient:
         claim_period_start_timestamp = rewards_app_global_state.first_period_timestamp + (period_index_start * WEEK)
         claim_period_end_timestamp = rewards_app_global_state.first_period_timestamp + (period_index_start + period_count) * WEEK
 
-        account_power_indexes = []
-        for timestamp in range(claim_period_start_timestamp, claim_period_end_timestamp + 1, WEEK):
-            account_power_index = (get_power_index_at(account_powers, timestamp) or 0)
-            account_power_indexes.append(account_power_index)
+        timestamps = list(range(claim_period_start_timestamp, claim_period_end_timestamp + 1, WEEK))
+        account_power_indexes = [(account_power_index or 0) for account_power_index in get_power_indexes_at(account_powers, timestamps)]
 
         create_reward_claim_sheet = False
         account_reward_claim_sheet_box_indexes = {
@@ -547,9 +555,9 @@ class TinymanGovernanceClient:
             account_reward_claim_sheet_box_index=0
         )
         if reward_claim_sheet is not None:
-            claimed_reward_period_indexes = [index for index, value in enumerate(reward_claim_sheet.claim_sheet) if value]
+            claimed_reward_period_indexes = reward_claim_sheet.bitset
         else:
-            claimed_reward_period_indexes = []
+            claimed_reward_period_indexes = Bitset()
 
         rewards_app_global_state = self.fetch_rewards_app_global_state()
         account_state = self.fetch_account_state(self.user_address)
@@ -565,17 +573,13 @@ class TinymanGovernanceClient:
         period_timestamp_min = max([account_powers[0].timestamp, rewards_app_global_state.first_period_timestamp])
         period_timestamp_max = get_start_timestamp_of_week(min([account_powers[-1].lock_end_timestamp, int(time.time())]))
 
-        for timestamp in range(period_timestamp_min, period_timestamp_max + WEEK, WEEK):
-            timestamp_start = timestamp
-            timestamp_end = timestamp_start + WEEK
-            if timestamp_end > int(time.time()):
-                break
-
-            index_start = get_power_index_at(account_powers, timestamp_start)
-            cumulative_power_start = account_powers[index_start].cumulative_power_at(timestamp_start)
+        now = int(time.time())
+        timestamps = [timestamp for timestamp in range(period_timestamp_min, period_timestamp_max + WEEK, WEEK) if timestamp + WEEK <= now]
+        cumulative_powers = cumulative_powers_at(account_powers, timestamps + [timestamp + WEEK for timestamp in timestamps])
 
-            index_end = get_power_index_at(account_powers, timestamp_end)
-            cumulative_power_end = account_powers[index_end].cumulative_power_at(timestamp_end)
+        for i, timestamp_start in enumerate(timestamps):
+            cumulative_power_start = cumulative_powers[i]
+            cumulative_power_end = cumulative_powers[len(timestamps) + i]
 
             cumulative_power_delta = cumulative_power_end - cumulative_power_start
             if cumulative_power_delta:
@@ -585,6 +589,27 @@ class TinymanGovernanceClient:
         pending_period_indexes = [pi for pi in reward_period_indexes if pi not in claimed_reward_period_indexes]
         return pending_period_indexes
 
+    def get_pending_rewards(self, user_address: Optional[str] = None) -> list[PendingReward]:
+        user_address = user_address or self.user_address
+
+        account_state = self.fetch_account_state(user_address)
+        if account_state is None:
+            return []
+
+        account_powers = get_account_powers(
+            algod=self.algod,
+            app_id=self.vault_app_id,
+            address=user_address,
+            power_count=account_state.power_count,
+            deleted_power_count=account_state.deleted_power_count,
+        )
+        self.rewards_calculator.refresh()
+        return self.rewards_calculator.get_pending_rewards(
+            account_powers=account_powers,
+            claimed_period_indexes=self.rewards_calculator.fetch_claimed_period_indexes(user_address),
+            has_deleted_powers=account_state.deleted_power_count > 0,
+        )
+
     def prepare_create_proposal_transactions(
             self,
             proposal_id: str,
@@ -656,7 +681,7 @@ class TinymanGovernanceClient:
 
         account_attendance_sheet_box_index = proposal.index // (ACCOUNT_ATTENDANCE_SHEET_BOX_SIZE * 8)
         account_attendance_sheet_box_name = get_staking_attendance_sheet_box_name(address=user_address, box_index=account_attendance_sheet_box_index)
-        create_attendance_sheet_box = not box_exists(self.algod, self.proposal_voting_app_id, account_attendance_sheet_box_name)
+        create_attendance_sheet_box = not self.boxes.box_exists(self.proposal_voting_app_id, account_attendance_sheet_box_name)
 
         txn_group = prepare_cast_vote_transactions(
             proposal_voting_app_id=self.proposal_voting_app_id,
@@ -687,7 +712,7 @@ class TinymanGovernanceClient:
 
         account_state = self.fetch_account_state(user_address)
         staking_distribution_proposal = self.fetch_staking_distribution_proposal(proposal_id)
-        app_box_names = get_all_box_names(self.algod, self.staking_voting_app_id)
+        app_box_names = self.boxes.get_box_names(self.staking_voting_app_id)
 
         account_powers = get_account_powers(
             algod=self.algod,
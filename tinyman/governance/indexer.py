@@ -0,0 +1,227 @@
+import json
+from base64 import b64decode
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from tinyman.event import iter_app_call_logs
+from tinyman.governance.proposal_voting.events import proposal_voting_event_registry
+from tinyman.governance.proposal_voting.storage import Proposal
+from tinyman.governance.staking_voting.events import staking_voting_event_registry
+from tinyman.governance.staking_voting.storage import StakingDistributionProposal
+
+
+@dataclass
+class IndexedVote:
+    app_id: int
+    proposal_id: str
+    user_address: str
+    voting_power: int
+    round: int
+    txid: str
+    # Proposal voting app
+    vote: Optional[int] = None
+    # Staking voting app, (asset_id, voting_power, vote_percentage)
+    asset_votes: list[tuple] = field(default_factory=list)
+
+
+@dataclass
+class GovernanceIndexStore:
+    """
+    Proposals and votes replayed from the app call logs of the governance apps.
+
+    `last_round` and `last_round_txids` make the replay resumable, transactions are skipped if they are already processed.
+    """
+    last_round: int = 0
+    last_round_txids: set = field(default_factory=set)
+    # app_id -> proposal_id -> latest state of the proposal
+    proposals: dict = field(default_factory=dict)
+    votes: list[IndexedVote] = field(default_factory=list)
+
+    def get_proposals(self, app_id: int) -> dict:
+        return dict(self.proposals.get(app_id, {}))
+
+    def get_proposal(self, app_id: int, proposal_id: str) -> Optional[Union[Proposal, StakingDistributionProposal]]:
+        return self.proposals.get(app_id, {}).get(proposal_id)
+
+    def get_votes(self, app_id: Optional[int] = None, proposal_id: Optional[str] = None, user_address: Optional[str] = None) -> list[IndexedVote]:
+        return [
+            vote for vote in self.votes
+            if (app_id is None or vote.app_id == app_id) and (proposal_id is None or vote.proposal_id == proposal_id) and (user_address is None or vote.user_address == user_address)
+        ]
+
+    def is_processed(self, round: int, txid: str) -> bool:
+        return round < self.last_round or (round == self.last_round and txid in self.last_round_txids)
+
+    def mark_processed(self, round: int, txid: str):
+        if round > self.last_round:
+            self.last_round = round
+            self.last_round_txids = set()
+        self.last_round_txids.add(txid)
+
+    def save(self, path: Union[str, Path]):
+        data = {
+            "last_round": self.last_round,
+            "last_round_txids": sorted(self.last_round_txids),
+            "proposals": {
+                str(app_id): {
+                    proposal_id: {"type": type(proposal).__name__, **_encode_bytes(asdict(proposal))}
+                    for proposal_id, proposal in proposals.items()
+                }
+                for app_id, proposals in self.proposals.items()
+            },
+            "votes": [asdict(vote) for vote in self.votes],
+        }
+        Path(path).write_text(json.dumps(data))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "GovernanceIndexStore":
+        data = json.loads(Path(path).read_text())
+        proposal_classes = {Proposal.__name__: Proposal, StakingDistributionProposal.__name__: StakingDistributionProposal}
+        proposals = {}
+        for app_id, app_proposals in data["proposals"].items():
+            proposals[int(app_id)] = {}
+            for proposal_id, proposal in app_proposals.items():
+                proposal_class = proposal_classes[proposal.pop("type")]
+                proposals[int(app_id)][proposal_id] = proposal_class(**_decode_bytes(proposal))
+        votes = [IndexedVote(**{**vote, "asset_votes": [tuple(asset_vote) for asset_vote in vote["asset_votes"]]}) for vote in data["votes"]]
+        return cls(last_round=data["last_round"], last_round_txids=set(data["last_round_txids"]), proposals=proposals, votes=votes)
+
+
+def _encode_bytes(data: dict) -> dict:
+    return {key: {"bytes": value.hex()} if isinstance(value, bytes) else value for key, value in data.items()}
+
+
+def _decode_bytes(data: dict) -> dict:
+    return {key: bytes.fromhex(value["bytes"]) if isinstance(value, dict) else value for key, value in data.items()}
+
+
+def _decode_proposal_id(proposal_id: bytes) -> str:
+    return proposal_id.decode()
+
+
+def iter_app_calls(transaction: dict, app_ids: set) -> Iterator[tuple[int, list[bytes]]]:
+    """
+    Yields (app_id, logs) of the app calls to the given apps in an indexer transaction and its inner transactions, in execution order.
+    """
+    for app_id, _, logs in iter_app_call_logs(transaction):
+        if app_id in app_ids:
+            yield app_id, [b64decode(log) if isinstance(log, str) else log for log in logs]
+
+
+class GovernanceIndexer:
+    """
+    Replays the app calls of the proposal voting and staking voting apps into a GovernanceIndexStore.
+
+    Transactions are read from indexer responses, from the indexer client (`catch_up`) or from a JSON dump of indexer pages (`load_dump`).
+    """
+
+    def __init__(self, proposal_voting_app_id: int, staking_voting_app_id: int, store: Optional[GovernanceIndexStore] = None):
+        self.proposal_voting_app_id = proposal_voting_app_id
+        self.staking_voting_app_id = staking_voting_app_id
+        self.store = store or GovernanceIndexStore()
+
+    @property
+    def app_ids(self) -> set:
+        return {self.proposal_voting_app_id, self.staking_voting_app_id}
+
+    def process_transaction(self, transaction: dict):
+        round = transaction["confirmed-round"]
+        txid = transaction["id"]
+        if self.store.is_processed(round, txid):
+            return
+
+        for app_id, logs in iter_app_calls(transaction, self.app_ids):
+            if app_id == self.proposal_voting_app_id:
+                self.process_proposal_voting_logs(logs, round, txid)
+            else:
+                self.process_staking_voting_logs(logs, round, txid)
+        self.store.mark_processed(round, txid)
+
+    def process_proposal_voting_logs(self, logs: list[bytes], round: int, txid: str):
+        app_id = self.proposal_voting_app_id
+        for event in proposal_voting_event_registry.iter_decode(logs, skip_unknown=False):
+            if event["event_name"] == "proposal":
+                proposal_id = _decode_proposal_id(event["proposal_id"])
+                self.store.proposals.setdefault(app_id, {})[proposal_id] = Proposal(
+                    **{name: event[name] for name in Proposal.__dataclass_fields__}
+                )
+            elif event["event_name"] == "cast_vote":
+                self.store.votes.append(
+                    IndexedVote(
+                        app_id=app_id,
+                        proposal_id=_decode_proposal_id(event["proposal_id"]),
+                        user_address=event["user_address"],
+                        voting_power=event["voting_power"],
+                        round=round,
+                        txid=txid,
+                        vote=event["vote"],
+                    )
+                )
+
+    def process_staking_voting_logs(self, logs: list[bytes], round: int, txid: str):
+        app_id = self.staking_voting_app_id
+        asset_votes = []
+        cast_vote = None
+        for event in staking_voting_event_registry.iter_decode(logs, skip_unknown=False):
+            if event["event_name"] == "proposal":
+                proposal_id = _decode_proposal_id(event["proposal_id"])
+                self.store.proposals.setdefault(app_id, {})[proposal_id] = StakingDistributionProposal(
+                    **{name: event[name] for name in StakingDistributionProposal.__dataclass_fields__}
+                )
+            elif event["event_name"] == "vote":
+                asset_votes.append((event["asset_id"], event["voting_power"], event["vote_percentage"]))
+            elif event["event_name"] == "cast_vote":
+                cast_vote = event
+
+        # An app call casts a single vote, the vote events of the call are its asset votes.
+        if cast_vote is not None:
+            self.store.votes.append(
+                IndexedVote(
+                    app_id=app_id,
+                    proposal_id=_decode_proposal_id(cast_vote["proposal_id"]),
+                    user_address=cast_vote["user_address"],
+                    voting_power=cast_vote["voting_power"],
+                    round=round,
+                    txid=txid,
+                    asset_votes=asset_votes,
+                )
+            )
+
+    def process_transactions(self, transactions: Iterable[dict]):
+        # Transactions must be in confirmation order.
+        for transaction in transactions:
+            self.process_transaction(transaction)
+
+    def process_pages(self, pages: Iterable[dict]):
+        for page in pages:
+            self.process_transactions(page.get("transactions", []))
+
+    def load_dump(self, path: Union[str, Path]):
+        """
+        Processes a JSON file of indexer transaction search responses, either a single page or a list of pages.
+        """
+        data = json.loads(Path(path).read_text())
+        pages = data if isinstance(data, list) else [data]
+        self.process_pages(pages)
+
+    def catch_up(self, indexer_client, page_size: int = 1000):
+        """
+        Processes the transactions of the apps since the last processed round.
+        """
+        min_round = self.store.last_round
+        pages = {app_id: list(fetch_indexer_pages(indexer_client, app_id, min_round, page_size)) for app_id in sorted(self.app_ids)}
+        transactions = [transaction for app_pages in pages.values() for page in app_pages for transaction in page.get("transactions", [])]
+        # Merge the transactions of both apps in confirmation order. Indexer returns the transactions of a round in group order.
+        transactions.sort(key=lambda transaction: (transaction["confirmed-round"], transaction.get("intra-round-offset", 0)))
+        self.process_transactions(transactions)
+
+
+def fetch_indexer_pages(indexer_client, app_id: int, min_round: int = 0, page_size: int = 1000) -> Iterator[dict]:
+    next_page = None
+    while True:
+        page = indexer_client.search_transactions(application_id=app_id, min_round=min_round or None, limit=page_size, next_page=next_page)
+        yield page
+        next_page = page.get("next-token")
+        if not next_page or not page.get("transactions"):
+            break
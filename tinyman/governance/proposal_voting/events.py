@@ -1,6 +1,6 @@
 from algosdk import abi
 
-from tinyman.governance.event import Event
+from tinyman.governance.event import Event, EventRegistry
 
 
 event_proposal = Event(
@@ -145,3 +145,4 @@ proposal_voting_events = [
     # boxes
     event_proposal,
 ]
+proposal_voting_event_registry = EventRegistry(proposal_voting_events)
@@ -1,9 +1,11 @@
 import time
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 from algosdk.encoding import decode_address, encode_address
 
 from tinyman.governance.proposal_voting.constants import PROPOSAL_BOX_PREFIX, ATTENDANCE_SHEET_BOX_PREFIX, PROPOSAL_STATE_CANCELLED, PROPOSAL_STATE_EXECUTED, PROPOSAL_STATE_WAITING_FOR_APPROVAL, PROPOSAL_STATE_PENDING, PROPOSAL_STATE_ACTIVE, PROPOSAL_STATE_DEFEATED, PROPOSAL_STATE_SUCCEEDED
+from tinyman.governance.bitset import Bitset
 from tinyman.governance.utils import get_raw_box_value
 from tinyman.utils import int_to_bytes, bytes_to_int
 
@@ -70,6 +72,22 @@ class Proposal:
             return PROPOSAL_STATE_SUCCEEDED
 
 
+@dataclass
+class AttendanceSheet:
+    value: bytes
+
+    @cached_property
+    def bitset(self) -> Bitset:
+        return Bitset(self.value)
+
+    @property
+    def attendance_sheet(self) -> list[bool]:
+        return self.bitset.to_bools()
+
+    def is_vote_casted_for_proposal(self, proposal_index) -> bool:
+        return self.bitset.test(proposal_index)
+
+
 def get_proposal_box_name(proposal_id: str) -> bytes:
     return PROPOSAL_BOX_PREFIX + proposal_id.encode()
 
@@ -107,3 +125,11 @@ def get_proposal(algod, app_id: int, proposal_id: str) -> Optional[Proposal]:
     if not raw_box:
         return None
     return parse_box_proposal(raw_box)
+
+
+def get_attendance_sheet(algod, app_id: int, address: str, box_index: int) -> Optional[AttendanceSheet]:
+    box_name = get_attendance_sheet_box_name(address=address, box_index=box_index)
+    raw_box = get_raw_box_value(algod, app_id, box_name)
+    if raw_box is None:
+        return None
+    return AttendanceSheet(value=raw_box)
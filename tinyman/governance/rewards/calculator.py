@@ -0,0 +1,148 @@
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from tinyman.boxes import get_box_values
+from tinyman.governance.bitset import Bitset
+from tinyman.governance.constants import WEEK
+from tinyman.governance.rewards.constants import REWARD_PERIOD_BOX_ARRAY_LEN, REWARD_CLAIM_SHEET_BOX_SIZE
+from tinyman.governance.rewards.storage import RewardPeriod, RewardsAppGlobalState, get_reward_period_box_name, parse_box_reward_period, get_account_reward_claim_sheet_box_name, \
+    get_rewards_app_global_state
+from tinyman.governance.rewards.utils import calculate_reward_amount
+from tinyman.governance.vault.snapshot import VaultSnapshot, fetch_vault_snapshot
+from tinyman.governance.vault.storage import AccountPower, cumulative_powers_at
+
+
+@dataclass
+class PendingReward:
+    period_index: int
+    account_cumulative_power_delta: int
+    reward_amount: int
+
+
+class RewardsCalculator:
+    """
+    Computes the claimable rewards of accounts locally.
+
+    Reward periods are fetched in bulk and kept in memory, only the last (partially filled) box and the new boxes are fetched on refresh.
+    If a reward period box is missing, `reward_periods` ends before it and can be shorter than `reward_period_count`.
+    """
+
+    def __init__(self, algod, rewards_app_id: int, vault_app_id: int, max_workers: int = 8):
+        self.algod = algod
+        self.rewards_app_id = rewards_app_id
+        self.vault_app_id = vault_app_id
+        self.max_workers = max_workers
+        self.rewards_app_global_state: Optional[RewardsAppGlobalState] = None
+        self.reward_periods: list[RewardPeriod] = []
+        self.lock = threading.Lock()
+
+    def refresh(self, rewards_app_global_state: Optional[RewardsAppGlobalState] = None) -> list[RewardPeriod]:
+        if rewards_app_global_state is None:
+            rewards_app_global_state = get_rewards_app_global_state(self.algod, self.rewards_app_id)
+
+        with self.lock:
+            reward_period_count = rewards_app_global_state.reward_period_count
+            if reward_period_count < len(self.reward_periods):
+                self.reward_periods = []
+
+            first_box_index = len(self.reward_periods) // REWARD_PERIOD_BOX_ARRAY_LEN
+            box_count = math.ceil(reward_period_count / REWARD_PERIOD_BOX_ARRAY_LEN)
+            immutable_box_count = reward_period_count // REWARD_PERIOD_BOX_ARRAY_LEN
+
+            # Full boxes can not change, they are cached.
+            box_names = [get_reward_period_box_name(box_index=box_index) for box_index in range(first_box_index, box_count)]
+            immutable_box_name_count = max(immutable_box_count - first_box_index, 0)
+            raw_boxes = get_box_values(self.algod, self.rewards_app_id, box_names[:immutable_box_name_count], cache=True, max_workers=self.max_workers) + \
+                get_box_values(self.algod, self.rewards_app_id, box_names[immutable_box_name_count:], max_workers=self.max_workers)
+
+            reward_periods = self.reward_periods[:first_box_index * REWARD_PERIOD_BOX_ARRAY_LEN]
+            for raw_box in raw_boxes:
+                if raw_box is None:
+                    # The box is not visible to the node yet (e.g. it lags behind the global state).
+                    # The periods are kept contiguous, the missing box and the following ones are fetched again on the next refresh.
+                    break
+                reward_periods.extend(parse_box_reward_period(raw_box))
+
+            self.reward_periods = reward_periods[:reward_period_count]
+            self.rewards_app_global_state = rewards_app_global_state
+            return self.reward_periods
+
+    def get_period_start_timestamp(self, period_index: int) -> int:
+        return self.rewards_app_global_state.first_period_timestamp + period_index * WEEK
+
+    def get_pending_rewards(self, account_powers: list[AccountPower], claimed_period_indexes: Optional[Bitset] = None, has_deleted_powers: bool = False) -> list[PendingReward]:
+        """
+        Returns the rewards of the periods that are not claimed yet, in a single pass over the account powers.
+
+        If the first powers of the account are deleted (`has_deleted_powers`), periods starting before the first known power are skipped since their cumulative power is unknown.
+        """
+        if self.rewards_app_global_state is None:
+            self.refresh()
+        if claimed_period_indexes is None:
+            claimed_period_indexes = Bitset()
+        if not account_powers:
+            return []
+
+        period_count = len(self.reward_periods)
+        timestamps = [self.get_period_start_timestamp(period_index) for period_index in range(period_count + 1)]
+        cumulative_powers = cumulative_powers_at(account_powers, timestamps)
+
+        pending_rewards = []
+        for period_index, reward_period in enumerate(self.reward_periods):
+            if period_index in claimed_period_indexes or not reward_period.total_cumulative_power_delta:
+                continue
+            if has_deleted_powers and timestamps[period_index] < account_powers[0].timestamp:
+                continue
+
+            account_cumulative_power_delta = cumulative_powers[period_index + 1] - cumulative_powers[period_index]
+            if not account_cumulative_power_delta:
+                continue
+
+            pending_rewards.append(
+                PendingReward(
+                    period_index=period_index,
+                    account_cumulative_power_delta=account_cumulative_power_delta,
+                    reward_amount=calculate_reward_amount(account_cumulative_power_delta, reward_period),
+                )
+            )
+        return pending_rewards
+
+    def fetch_claimed_period_indexes(self, address: str) -> Bitset:
+        """
+        Returns the claimed period indexes of the account, the claim sheet boxes are concatenated in a single bitset.
+        """
+        if self.rewards_app_global_state is None:
+            self.refresh()
+
+        box_count = math.ceil(self.rewards_app_global_state.reward_period_count / (REWARD_CLAIM_SHEET_BOX_SIZE * 8))
+        box_names = [get_account_reward_claim_sheet_box_name(address=address, box_index=box_index) for box_index in range(box_count)]
+        raw_boxes = get_box_values(self.algod, self.rewards_app_id, box_names, max_workers=self.max_workers)
+        return Bitset(b"".join((raw_box or b"").ljust(REWARD_CLAIM_SHEET_BOX_SIZE, b"\x00") for raw_box in raw_boxes))
+
+    def get_pending_rewards_of(self, addresses: list[str], vault_snapshot: Optional[VaultSnapshot] = None) -> dict[str, list[PendingReward]]:
+        """
+        Returns the pending rewards of many accounts. Claim sheets are fetched concurrently, account powers are read from the snapshot.
+        """
+        self.refresh()
+        if vault_snapshot is None:
+            vault_snapshot = fetch_vault_snapshot(self.algod, self.vault_app_id, max_workers=self.max_workers)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            claimed_period_indexes = list(executor.map(self.fetch_claimed_period_indexes, addresses))
+
+        pending_rewards = {}
+        for address, claimed in zip(addresses, claimed_period_indexes):
+            account_state = vault_snapshot.get_account_state(address)
+            if account_state is None:
+                pending_rewards[address] = []
+                continue
+
+            pending_rewards[address] = self.get_pending_rewards(
+                account_powers=vault_snapshot.get_account_powers(address),
+                claimed_period_indexes=claimed,
+                has_deleted_powers=account_state.deleted_power_count > 0,
+            )
+        return pending_rewards
@@ -1,6 +1,6 @@
 from algosdk import abi
 
-from tinyman.governance.event import Event
+from tinyman.governance.event import Event, EventRegistry
 
 
 event_init = Event(
@@ -84,3 +84,4 @@ rewards_events = [
     event_reward_period,
     event_reward_history,
 ]
+rewards_event_registry = EventRegistry(rewards_events)
@@ -1,12 +1,14 @@
 import math
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 from tinyman.governance.constants import WEEK
 from tinyman.governance.rewards.constants import REWARD_HISTORY_BOX_PREFIX, REWARD_HISTORY_BOX_ARRAY_LEN, REWARD_HISTORY_SIZE, REWARD_CLAIM_SHEET_BOX_PREFIX, REWARD_PERIOD_BOX_PREFIX, REWARD_PERIOD_BOX_ARRAY_LEN, REWARD_PERIOD_SIZE
-from tinyman.governance.utils import get_raw_box_value, check_nth_bit_from_left
+from tinyman.governance.bitset import Bitset
+from tinyman.governance.utils import get_raw_box_value, get_global_state
 from tinyman.utils import int_to_bytes, bytes_to_int
-from algosdk.encoding import decode_address
+from algosdk.encoding import decode_address, encode_address
 
 
 @dataclass
@@ -45,12 +47,16 @@ class RewardHistory:
 class RewardClaimSheet:
     value: bytes
 
+    @cached_property
+    def bitset(self) -> Bitset:
+        return Bitset(self.value)
+
     @property
     def claim_sheet(self) -> list[bool]:
-        return [check_nth_bit_from_left(self.value, index) for index in range(0, (len(self.value) * 8))]
+        return self.bitset.to_bools()
 
     def is_reward_claimed_for_period(self, period_index) -> bool:
-        return check_nth_bit_from_left(self.value, period_index)
+        return self.bitset.test(period_index)
 
 
 def get_reward_history_box_name(box_index) -> bytes:
@@ -140,3 +146,10 @@ def get_reward_claim_sheet(algod, app_id: int, address: str, account_reward_clai
     if raw_box is None:
         return None
     return RewardClaimSheet(value=raw_box)
+
+
+def get_rewards_app_global_state(algod, app_id: int) -> RewardsAppGlobalState:
+    data = get_global_state(algod, app_id)
+    data["manager"] = encode_address(data["manager"])
+    data["rewards_manager"] = encode_address(data["rewards_manager"])
+    return RewardsAppGlobalState(**data)
@@ -1,6 +1,6 @@
 from algosdk import abi
 
-from tinyman.governance.event import Event
+from tinyman.governance.event import Event, EventRegistry
 
 
 event_proposal = Event(
@@ -92,3 +92,4 @@ staking_voting_events = [
     event_vote,
     event_proposal,
 ]
+staking_voting_event_registry = EventRegistry(staking_voting_events)
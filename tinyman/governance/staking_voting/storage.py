@@ -1,11 +1,13 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 from algosdk.encoding import decode_address
 
 from tinyman.governance.proposal_voting.storage import get_proposal_box_name
 from tinyman.governance.staking_voting.constants import PROPOSAL_BOX_PREFIX, STAKING_VOTE_BOX_PREFIX, STAKING_ATTENDANCE_BOX_PREFIX
-from tinyman.governance.utils import check_nth_bit_from_left, get_raw_box_value
+from tinyman.governance.bitset import Bitset
+from tinyman.governance.utils import get_raw_box_value
 from tinyman.utils import int_to_bytes, bytes_to_int
 
 
@@ -38,12 +40,16 @@ class StakingDistributionProposal:
 class StakingVotingAttendanceSheet:
     value: bytes
 
+    @cached_property
+    def bitset(self) -> Bitset:
+        return Bitset(self.value)
+
     @property
     def attendance_sheet(self) -> list[bool]:
-        return [check_nth_bit_from_left(self.value, index) for index in range(0, (len(self.value) * 8))]
+        return self.bitset.to_bools()
 
     def is_vote_casted_for_proposal(self, proposal_index) -> bool:
-        return check_nth_bit_from_left(self.value, proposal_index)
+        return self.bitset.test(proposal_index)
 
 
 def get_staking_distribution_proposal_box_name(proposal_id: str) -> bytes:
@@ -77,3 +83,11 @@ def get_staking_distribution_proposal(algod, app_id: int, proposal_id: str) -> O
     if not raw_box:
         return None
     return parse_box_staking_distribution_proposal(raw_box)
+
+
+def get_staking_attendance_sheet(algod, app_id: int, address: str, box_index: int) -> Optional[StakingVotingAttendanceSheet]:
+    box_name = get_staking_attendance_sheet_box_name(address=address, box_index=box_index)
+    raw_box = get_raw_box_value(algod, app_id, box_name)
+    if raw_box is None:
+        return None
+    return StakingVotingAttendanceSheet(value=raw_box)
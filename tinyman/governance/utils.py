@@ -1,12 +1,12 @@
 import json
-import pickle
 from base64 import b64decode
 from hashlib import sha256
-from typing import Optional
+from typing import Optional, Union
 
-from algosdk.error import AlgodHTTPError
 from multiformats import CID
 
+from tinyman.box_cache import BoxCache
+from tinyman.boxes import get_box_names, get_box_value, get_box_values
 from tinyman.constants import MINIMUM_BALANCE_REQUIREMENT_PER_BOX, MINIMUM_BALANCE_REQUIREMENT_PER_BOX_BYTE
 
 
@@ -14,42 +14,23 @@ def get_raw_box_value(
         algod,
         app_id: int,
         box_name: bytes,
-        cache: bool = False
+        cache: Union[bool, BoxCache] = False
 ) -> Optional[bytes]:
-    cache_filename = f"tinyman-governance-box-cache-{app_id}"
-
-    cache_data = {}
-    if cache:
-        try:
-            with open(cache_filename, 'rb') as cache_file:
-                cache_data = pickle.load(cache_file)
-        except FileNotFoundError:
-            pass
-
-    if box_name in cache_data:
-        raw_box = cache_data[box_name]
-    else:
-        try:
-            response = algod.application_box_by_name(app_id, box_name)
-        except AlgodHTTPError as e:
-            if str(e) != 'box not found':
-                raise e
-            return None
-
-        value = response["value"]
-        raw_box = b64decode(value)
-
-        if cache:
-            cache_data[box_name] = raw_box
-            with open(cache_filename, 'wb') as cache_file:
-                pickle.dump(cache_data, cache_file)
-    return raw_box
+    # `cache` is a BoxCache or True for the process-wide default cache. Only immutable boxes should be cached.
+    return get_box_value(algod, app_id, box_name, cache=cache)
+
+
+def get_raw_box_values(
+        algod,
+        app_id: int,
+        box_names: list[bytes],
+        cache: Union[bool, BoxCache] = False
+) -> list[Optional[bytes]]:
+    return get_box_values(algod, app_id, box_names, cache=cache)
 
 
 def get_all_box_names(algod, app_id: int) -> list[bytes]:
-    response = algod.application_boxes(app_id, limit=0)
-    box_names = [b64decode(box["name"]) for box in response["boxes"]]
-    return box_names
+    return get_box_names(algod, app_id)
 
 
 def box_exists(algod, app_id: int, box_name: bytes) -> bool:
@@ -82,20 +63,8 @@ def check_nth_bit_from_left(value_bytes: bytes, n: int) -> int:
     if n >= len(value_bytes) * 8:
         raise ValueError(f"n should be less than {len(value_bytes) * 8}")
 
-    # convert bytes to int
-    num = int.from_bytes(value_bytes, 'big')
-
-    # calculate which bit to check from the left
-    bit_to_check = (len(value_bytes) * 8 - 1) - n
-
-    # create a number with nth bit set
-    nth_bit = 1 << bit_to_check
-
-    # if the nth bit is set in the given number, return 1. Otherwise, return 0
-    if num & nth_bit:
-        return 1
-    else:
-        return 0
+    # check the bit in its byte, without converting the whole value to an int
+    return (value_bytes[n // 8] >> (7 - n % 8)) & 1
 
 
 def get_required_minimum_balance_of_box(box_name: bytes, box_size: int):
@@ -1,6 +1,6 @@
 from algosdk import abi
 
-from tinyman.governance.event import Event
+from tinyman.governance.event import Event, EventRegistry
 
 event_init = Event(
     name="init",
@@ -121,3 +121,4 @@ vault_events = [
     event_total_power,
     event_slope_change,
 ]
+vault_event_registry = EventRegistry(vault_events)
@@ -0,0 +1,161 @@
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from algosdk.encoding import encode_address
+
+from tinyman.boxes import get_box_values
+from tinyman.governance.utils import get_all_box_names
+from tinyman.governance.vault.storage import AccountPower, AccountState, PowerColumns, parse_box_account_state, parse_box_powers_into_columns
+from tinyman.governance.vault.utils import get_bias, get_cumulative_power_delta
+from tinyman.utils import bytes_to_int
+
+ACCOUNT_STATE_BOX_NAME_LENGTH = 32
+ACCOUNT_POWER_BOX_NAME_LENGTH = 32 + 8
+
+
+@dataclass
+class VaultSnapshot:
+    """
+    Account states and account powers of all lockers, stored column by column.
+
+    The powers of the account at `address_index` i are the rows in [power_offsets[i], power_offsets[i + 1]) of `powers`,
+    sorted by timestamp.
+    """
+    addresses: list[str] = field(default_factory=list)
+    locked_amounts: array = field(default_factory=lambda: array("Q"))
+    lock_end_times: array = field(default_factory=lambda: array("Q"))
+    power_counts: array = field(default_factory=lambda: array("Q"))
+    deleted_power_counts: array = field(default_factory=lambda: array("Q"))
+    power_offsets: array = field(default_factory=lambda: array("Q", [0]))
+    powers: PowerColumns = field(default_factory=PowerColumns)
+
+    def __post_init__(self):
+        self.address_indexes = {address: i for i, address in enumerate(self.addresses)}
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def add_account(self, address: str, account_state: AccountState, account_power_boxes: Iterable[bytes]):
+        # account_power_boxes are the raw account power boxes of the account, sorted by box index.
+        assert address not in self.address_indexes
+        self.address_indexes[address] = len(self.addresses)
+        self.addresses.append(address)
+        self.locked_amounts.append(account_state.locked_amount)
+        self.lock_end_times.append(account_state.lock_end_time)
+        self.power_counts.append(account_state.power_count)
+        self.deleted_power_counts.append(account_state.deleted_power_count)
+        for raw_box in account_power_boxes:
+            parse_box_powers_into_columns(raw_box, self.powers)
+        self.power_offsets.append(len(self.powers))
+
+    def get_account_state(self, address: str) -> Optional[AccountState]:
+        address_index = self.address_indexes.get(address)
+        if address_index is None:
+            return None
+        return AccountState(
+            locked_amount=self.locked_amounts[address_index],
+            lock_end_time=self.lock_end_times[address_index],
+            power_count=self.power_counts[address_index],
+            deleted_power_count=self.deleted_power_counts[address_index],
+        )
+
+    def get_account_powers(self, address: str) -> list[AccountPower]:
+        address_index = self.address_indexes.get(address)
+        if address_index is None:
+            return []
+        return [
+            AccountPower(
+                bias=self.powers.biases[i],
+                timestamp=self.powers.timestamps[i],
+                slope=self.powers.slopes[i],
+                cumulative_power=self.powers.cumulative_powers[i],
+            )
+            for i in range(self.power_offsets[address_index], self.power_offsets[address_index + 1])
+        ]
+
+    def get_power_row_at(self, address: str, timestamp: int) -> Optional[int]:
+        """
+        Returns the row of the last power of the account at or before the timestamp.
+        """
+        address_index = self.address_indexes.get(address)
+        if address_index is None:
+            return None
+
+        start = self.power_offsets[address_index]
+        row = bisect_right(self.powers.timestamps, timestamp, start, self.power_offsets[address_index + 1]) - 1
+        if row < start:
+            return None
+        return row
+
+    def get_tiny_powers_at(self, addresses: list[str], timestamps: list[int]) -> list[list[int]]:
+        """
+        Returns the tiny power of each address at each timestamp, result[i][j] is the power of addresses[i] at timestamps[j].
+        """
+        powers = self.powers
+        result = []
+        for address in addresses:
+            tiny_powers = []
+            for timestamp in timestamps:
+                row = self.get_power_row_at(address, timestamp)
+                if row is None:
+                    tiny_powers.append(0)
+                else:
+                    tiny_powers.append(max(powers.biases[row] - get_bias(powers.slopes[row], timestamp - powers.timestamps[row]), 0))
+            result.append(tiny_powers)
+        return result
+
+    def get_cumulative_tiny_powers_at(self, addresses: list[str], timestamps: list[int]) -> list[list[int]]:
+        """
+        Returns the cumulative tiny power of each address at each timestamp, result[i][j] is the cumulative power of addresses[i] at timestamps[j].
+        """
+        powers = self.powers
+        result = []
+        for address in addresses:
+            cumulative_powers = []
+            for timestamp in timestamps:
+                row = self.get_power_row_at(address, timestamp)
+                if row is None:
+                    cumulative_powers.append(0)
+                else:
+                    cumulative_power_delta = get_cumulative_power_delta(powers.biases[row], powers.slopes[row], timestamp - powers.timestamps[row])
+                    cumulative_powers.append(powers.cumulative_powers[row] + cumulative_power_delta)
+            result.append(cumulative_powers)
+        return result
+
+
+def fetch_vault_snapshot(algod, app_id: int, max_workers: int = 8) -> VaultSnapshot:
+    """
+    Fetches the account state and account power boxes of all lockers concurrently.
+    """
+    account_state_box_names = []
+    account_power_box_names = []
+    for box_name in get_all_box_names(algod, app_id):
+        if len(box_name) == ACCOUNT_STATE_BOX_NAME_LENGTH:
+            account_state_box_names.append(box_name)
+        elif len(box_name) == ACCOUNT_POWER_BOX_NAME_LENGTH:
+            account_power_box_names.append(box_name)
+
+    # Account power boxes are sorted by (address, box index), the powers of an account are in chronological order.
+    account_power_box_names.sort(key=lambda box_name: (box_name[:32], bytes_to_int(box_name[32:])))
+    box_names = account_state_box_names + account_power_box_names
+
+    raw_boxes = dict(zip(box_names, get_box_values(algod, app_id, box_names, max_workers=max_workers)))
+
+    account_power_boxes = {}
+    for box_name in account_power_box_names:
+        if (raw_box := raw_boxes[box_name]) is not None:
+            account_power_boxes.setdefault(box_name[:32], []).append(raw_box)
+
+    snapshot = VaultSnapshot()
+    for box_name in sorted(account_state_box_names):
+        if (raw_box := raw_boxes[box_name]) is None:
+            # The account state is deleted after the listing.
+            continue
+        snapshot.add_account(
+            address=encode_address(box_name),
+            account_state=parse_box_account_state(raw_box),
+            account_power_boxes=account_power_boxes.get(box_name, []),
+        )
+    return snapshot
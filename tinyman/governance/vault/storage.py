@@ -1,10 +1,18 @@
 import math
-from dataclasses import dataclass
-from typing import Optional, Tuple, Union
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Tuple, Union
 
 from algosdk.encoding import decode_address
 
-from tinyman.governance.utils import get_raw_box_value
+from tinyman.box_cache import BoxCache
+from tinyman.boxes import get_box_values
+from tinyman.governance.utils import get_raw_box_value, get_global_state, get_all_box_names
 from tinyman.governance.vault.constants import TOTAL_POWERS, SLOPE_CHANGES, ACCOUNT_POWER_BOX_ARRAY_LEN, TOTAL_POWER_BOX_ARRAY_LEN, ACCOUNT_POWER_SIZE, TOTAL_POWER_SIZE, TWO_TO_THE_64
 from tinyman.utils import int_to_bytes, bytes_to_int
 
@@ -80,6 +88,32 @@ class TotalPower:
     cumulative_power: int
 
 
+class PowerList(list):
+    """
+    Account powers or total powers sorted by timestamp, with their timestamps for `get_power_index_at`.
+    """
+
+    def __init__(self, powers=(), timestamps: Optional[list[int]] = None):
+        super().__init__(powers)
+        self.timestamps = timestamps if timestamps is not None else get_power_timestamps(self)
+
+
+@dataclass
+class PowerColumns:
+    """
+    Account powers or total powers stored column by column.
+
+    Slopes and cumulative powers are 128 bit integers, they are kept in lists.
+    """
+    biases: array = field(default_factory=lambda: array("Q"))
+    timestamps: array = field(default_factory=lambda: array("Q"))
+    slopes: list[int] = field(default_factory=list)
+    cumulative_powers: list[int] = field(default_factory=list)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+
 @dataclass
 class SlopeChange:
     slope_delta: Optional[int]
@@ -110,42 +144,60 @@ def parse_box_account_state(raw_box: bytes) -> AccountState:
     )
 
 
-def parse_box_account_power(raw_box: bytes) -> list[AccountPower]:
-    box_size = ACCOUNT_POWER_SIZE
-    rows = [raw_box[i:i + box_size] for i in range(0, len(raw_box), box_size)]
-    powers = []
-    for row in rows:
-        if row == (b'\x00' * box_size):
+# bias (uint64), timestamp (uint64), slope (uint128), cumulative_power (uint128), uint128 values are read as two uint64.
+POWER_STRUCT = struct.Struct(">QQQQQQ")
+POWER_FIELD_COUNT = 6
+assert POWER_STRUCT.size == ACCOUNT_POWER_SIZE == TOTAL_POWER_SIZE
+
+
+def iter_box_powers(raw_box: bytes) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Yields (bias, timestamp, slope, cumulative_power) of the powers in an account power or total power box.
+    The box is read in place, rows are not copied. The first empty row ends the array.
+    """
+    view = memoryview(raw_box)
+    view = view[:len(view) - len(view) % POWER_STRUCT.size]
+    for bias, timestamp, slope_high, slope_low, cumulative_power_high, cumulative_power_low in POWER_STRUCT.iter_unpack(view):
+        if not (bias or timestamp or slope_high or slope_low or cumulative_power_high or cumulative_power_low):
+            break
+        yield bias, timestamp, (slope_high << 64) | slope_low, (cumulative_power_high << 64) | cumulative_power_low
+
+
+def parse_box_powers_into_columns(raw_box: bytes, columns: Optional[PowerColumns] = None) -> PowerColumns:
+    """
+    Appends the powers in an account power or total power box to the columns without creating an object per power.
+    """
+    if columns is None:
+        columns = PowerColumns()
+
+    view = memoryview(raw_box)
+    values = array("Q")
+    values.frombytes(view[:len(view) - len(view) % POWER_STRUCT.size])
+    if sys.byteorder == "little":
+        values.byteswap()
+
+    field_count = POWER_FIELD_COUNT
+    timestamps = values[1::field_count]
+    row_count = len(timestamps)
+    for i, timestamp in enumerate(timestamps):
+        if timestamp == 0 and not any(values[i * field_count:(i + 1) * field_count]):
+            row_count = i
             break
 
-        powers.append(
-            AccountPower(
-                bias=bytes_to_int(row[:8]),
-                timestamp=bytes_to_int(row[8:16]),
-                slope=bytes_to_int(row[16:32]),
-                cumulative_power=bytes_to_int(row[32:48]),
-            )
-        )
-    return powers
+    end = row_count * field_count
+    columns.biases.extend(values[0:end:field_count])
+    columns.timestamps.extend(timestamps[:row_count])
+    columns.slopes.extend([(high << 64) | low for high, low in zip(values[2:end:field_count], values[3:end:field_count])])
+    columns.cumulative_powers.extend([(high << 64) | low for high, low in zip(values[4:end:field_count], values[5:end:field_count])])
+    return columns
 
 
-def parse_box_total_power(raw_box: bytes) -> list[TotalPower]:
-    box_size = TOTAL_POWER_SIZE
-    rows = [raw_box[i:i + box_size] for i in range(0, len(raw_box), box_size)]
-    powers = []
-    for row in rows:
-        if row == (b'\x00' * box_size):
-            break
+def parse_box_account_power(raw_box: bytes) -> list[AccountPower]:
+    return [AccountPower(*row) for row in iter_box_powers(raw_box)]
 
-        powers.append(
-            TotalPower(
-                bias=bytes_to_int(row[:8]),
-                timestamp=bytes_to_int(row[8:16]),
-                slope=bytes_to_int(row[16:32]),
-                cumulative_power=bytes_to_int(row[32:48]),
-            )
-        )
-    return powers
+
+def parse_box_total_power(raw_box: bytes) -> list[TotalPower]:
+    return [TotalPower(*row) for row in iter_box_powers(raw_box)]
 
 
 def parse_box_slope_change(raw_box: bytes) -> SlopeChange:
@@ -171,7 +223,7 @@ def get_account_powers(algod, app_id, address: str, power_count: int, deleted_po
         box_name = get_account_power_box_name(address=address, box_index=box_index)
         raw_box = get_raw_box_value(algod, app_id, box_name)
         account_powers.extend(parse_box_account_power(raw_box))
-    return account_powers
+    return PowerList(account_powers)
 
 
 def get_total_powers(algod, app_id: int, box_index: int) -> list[TotalPower]:
@@ -191,7 +243,57 @@ def get_all_total_powers(algod, app_id: int, total_power_count: int) -> list[Tot
         is_box_immutable = box_index < immutable_box_count
         raw_box = get_raw_box_value(algod, app_id, box_name, cache=is_box_immutable)
         total_powers.extend(parse_box_total_power(raw_box))
-    return total_powers
+    return PowerList(total_powers)
+
+
+class TotalPowerHistory:
+    """
+    Parsed total powers of the vault app, kept in memory and refreshed incrementally.
+
+    Only the box of the last total power, which can be updated in place, and the new boxes are fetched on refresh.
+    The timestamps of the total powers are kept with them (`PowerList.timestamps`) and updated on refresh.
+    """
+
+    def __init__(self, algod, app_id: int):
+        self.algod = algod
+        self.app_id = app_id
+        self.total_powers = PowerList()
+        self.total_power_count = 0
+        self.lock = threading.Lock()
+
+    @property
+    def timestamps(self) -> list[int]:
+        return self.total_powers.timestamps
+
+    def refresh(self, total_power_count: Optional[int] = None) -> PowerList:
+        if total_power_count is None:
+            total_power_count = VaultAppGlobalState(**get_global_state(self.algod, self.app_id)).total_power_count
+
+        with self.lock:
+            if total_power_count < self.total_power_count:
+                # The app is not expected to delete total powers, start over.
+                self.total_powers = PowerList()
+                self.total_power_count = 0
+
+            first_box_index = max(self.total_power_count - 1, 0) // TOTAL_POWER_BOX_ARRAY_LEN
+            box_count = math.ceil(total_power_count / TOTAL_POWER_BOX_ARRAY_LEN)
+            immutable_box_count = total_power_count // TOTAL_POWER_BOX_ARRAY_LEN
+
+            kept_count = first_box_index * TOTAL_POWER_BOX_ARRAY_LEN
+            total_powers = self.total_powers[:kept_count]
+            timestamps = self.total_powers.timestamps[:kept_count]
+            for box_index in range(first_box_index, box_count):
+                box_name = get_total_power_box_name(box_index=box_index)
+                is_box_immutable = box_index < immutable_box_count
+                raw_box = get_raw_box_value(self.algod, self.app_id, box_name, cache=is_box_immutable)
+                new_total_powers = parse_box_total_power(raw_box)
+                total_powers.extend(new_total_powers)
+                timestamps.extend(get_power_timestamps(new_total_powers))
+
+            # A new list, the lists returned by the previous refreshes are not modified.
+            self.total_powers = PowerList(total_powers, timestamps)
+            self.total_power_count = total_power_count
+            return self.total_powers
 
 
 def get_slope_change(algod, app_id: int, timestamp: int) -> Optional[SlopeChange]:
@@ -202,6 +304,96 @@ def get_slope_change(algod, app_id: int, timestamp: int) -> Optional[SlopeChange
     return parse_box_slope_change(raw_box)
 
 
+class SlopeChangeIndex:
+    """
+    Slope changes of the vault app, sorted by timestamp (week start).
+
+    Box names are listed with a single request and the slope change boxes are fetched concurrently,
+    so total powers can be projected to future timestamps without a request per week.
+    `refresh_range` refreshes only if the range was not covered by the last refresh or the refresh is older than `max_age` seconds.
+    By default every call refreshes, the slope changes of future weeks change with every lock of any account.
+    Slope changes of past weeks can not change, they are stored in `cache` (see `tinyman.boxes.get_box_values`) if it is given.
+    """
+
+    def __init__(self, algod, app_id: int, max_workers: int = 8, max_age: Optional[float] = 0, cache: Union[bool, BoxCache] = False):
+        self.algod = algod
+        self.app_id = app_id
+        self.max_workers = max_workers
+        # 0 always refreshes, None never expires.
+        self.max_age = max_age
+        self.cache = cache
+        self.timestamps: list[int] = []
+        self.slope_deltas: dict[int, int] = {}
+        # (start_timestamp, end_timestamp, refreshed_at) of the last refresh, None bounds are unbounded.
+        self.refreshed_range: Optional[Tuple[Optional[int], Optional[int], float]] = None
+        self.lock = threading.Lock()
+
+    def is_fresh(self, start_timestamp: int, end_timestamp: int) -> bool:
+        if self.refreshed_range is None:
+            return False
+
+        refreshed_start_timestamp, refreshed_end_timestamp, refreshed_at = self.refreshed_range
+        if self.max_age is not None and time.time() - refreshed_at >= self.max_age:
+            return False
+        return (refreshed_start_timestamp is None or refreshed_start_timestamp <= start_timestamp) and \
+            (refreshed_end_timestamp is None or end_timestamp <= refreshed_end_timestamp)
+
+    def refresh_range(self, start_timestamp: int, end_timestamp: int) -> dict[int, int]:
+        if not self.is_fresh(start_timestamp, end_timestamp):
+            self.refresh(start_timestamp=start_timestamp, end_timestamp=end_timestamp)
+        return self.slope_deltas
+
+    def invalidate(self) -> None:
+        self.refreshed_range = None
+
+    def refresh(self, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None) -> dict[int, int]:
+        # Only the slope changes in [start_timestamp, end_timestamp] are fetched, the others are kept as is.
+        refreshed_at = time.time()
+        box_names = get_all_box_names(self.algod, self.app_id)
+        timestamps = []
+        for box_name in box_names:
+            if len(box_name) != len(SLOPE_CHANGES) + 8 or not box_name.startswith(SLOPE_CHANGES):
+                continue
+            timestamp = bytes_to_int(box_name[len(SLOPE_CHANGES):])
+            if start_timestamp is not None and timestamp < start_timestamp:
+                continue
+            if end_timestamp is not None and timestamp > end_timestamp:
+                continue
+            timestamps.append(timestamp)
+
+        timestamps.sort()
+        past_timestamp_count = bisect_left(timestamps, int(time.time()))
+        box_names = [get_slope_change_box_name(timestamp=timestamp) for timestamp in timestamps]
+        raw_boxes = get_box_values(self.algod, self.app_id, box_names[:past_timestamp_count], cache=self.cache, max_workers=self.max_workers) + \
+            get_box_values(self.algod, self.app_id, box_names[past_timestamp_count:], max_workers=self.max_workers)
+
+        with self.lock:
+            slope_deltas = {
+                timestamp: slope_delta
+                for timestamp, slope_delta in self.slope_deltas.items()
+                if (start_timestamp is not None and timestamp < start_timestamp) or (end_timestamp is not None and timestamp > end_timestamp)
+            }
+            for timestamp, raw_box in zip(timestamps, raw_boxes):
+                if raw_box is not None:
+                    slope_deltas[timestamp] = parse_box_slope_change(raw_box).slope_delta
+
+            self.slope_deltas = slope_deltas
+            self.timestamps = sorted(slope_deltas)
+            self.refreshed_range = (start_timestamp, end_timestamp, refreshed_at)
+            return self.slope_deltas
+
+    def get_slope_delta(self, timestamp: int) -> int:
+        return self.slope_deltas.get(timestamp, 0)
+
+    def get_slope_changes_between(self, start_timestamp: int, end_timestamp: int) -> list[Tuple[int, int]]:
+        """
+        Returns (timestamp, slope_delta) pairs in (start_timestamp, end_timestamp].
+        """
+        start = bisect_right(self.timestamps, start_timestamp)
+        end = bisect_right(self.timestamps, end_timestamp)
+        return [(timestamp, self.slope_deltas[timestamp]) for timestamp in self.timestamps[start:end]]
+
+
 def get_last_total_powers_indexes(total_power_count: int) -> Tuple[int, int]:
     last_index = total_power_count - 1
     box_index = last_index // TOTAL_POWER_BOX_ARRAY_LEN
@@ -224,13 +416,70 @@ def is_account_power_box_full(account_power_count: int) -> bool:
     return (account_power_count % TOTAL_POWER_BOX_ARRAY_LEN) == 0
 
 
-def get_power_index_at(powers: Union[list[AccountPower], list[TotalPower]], timestamp: int) -> Optional[int]:
-    power_index = None
+def get_power_timestamps(powers: Union[list[AccountPower], list[TotalPower]]) -> list[int]:
+    return [power.timestamp for power in powers]
 
-    for index, power in enumerate(powers):
-        if timestamp >= power.timestamp:
-            power_index = index
-        else:
-            break
 
+def get_power_index_at(powers: Union[list[AccountPower], list[TotalPower]], timestamp: int, timestamps: Optional[list[int]] = None) -> Optional[int]:
+    # Powers are sorted by timestamp. The timestamps of a PowerList are used by default, otherwise pass `timestamps`
+    # (get_power_timestamps) to avoid rebuilding it for each call.
+    if timestamps is None:
+        timestamps = getattr(powers, "timestamps", None)
+        if timestamps is None or len(timestamps) != len(powers):
+            timestamps = get_power_timestamps(powers)
+
+    power_index = bisect_right(timestamps, timestamp) - 1
+    if power_index < 0:
+        return None
     return power_index
+
+
+def get_power_indexes_at(powers: Union[list[AccountPower], list[TotalPower]], timestamps: list[int]) -> list[Optional[int]]:
+    """
+    Returns get_power_index_at for each timestamp with a single merge pass over the powers.
+    """
+    order = sorted(range(len(timestamps)), key=lambda i: timestamps[i])
+    power_indexes = [None] * len(timestamps)
+
+    power_index = -1
+    for i in order:
+        while power_index + 1 < len(powers) and powers[power_index + 1].timestamp <= timestamps[i]:
+            power_index += 1
+        if power_index >= 0:
+            power_indexes[i] = power_index
+    return power_indexes
+
+
+def get_powers_at(powers: Union[list[AccountPower], list[TotalPower]], timestamps: list[int]) -> list[int]:
+    """
+    Returns the power at each timestamp. Slope changes after the last total power are not applied.
+    """
+    from tinyman.governance.vault.utils import get_bias
+
+    result = []
+    for timestamp, power_index in zip(timestamps, get_power_indexes_at(powers, timestamps)):
+        if power_index is None:
+            result.append(0)
+            continue
+
+        power = powers[power_index]
+        result.append(max(power.bias - get_bias(power.slope, timestamp - power.timestamp), 0))
+    return result
+
+
+def cumulative_powers_at(powers: Union[list[AccountPower], list[TotalPower]], timestamps: list[int]) -> list[int]:
+    """
+    Returns the cumulative power at each timestamp. Slope changes after the last total power are not applied.
+    """
+    from tinyman.governance.vault.utils import get_cumulative_power_delta
+
+    result = []
+    for timestamp, power_index in zip(timestamps, get_power_indexes_at(powers, timestamps)):
+        if power_index is None:
+            result.append(0)
+            continue
+
+        power = powers[power_index]
+        cumulative_power_delta = get_cumulative_power_delta(power.bias, power.slope, timestamp - power.timestamp)
+        result.append(power.cumulative_power + cumulative_power_delta)
+    return result
@@ -1,6 +1,6 @@
 from algosdk import abi
 
-from tinyman.event import Event
+from tinyman.event import Event, EventRegistry
 
 
 user_state_event = Event(
@@ -135,6 +135,7 @@ restaking_events = [
     decrease_stake_event,
     claim_rewards_event
 ]
+restaking_event_registry = EventRegistry(restaking_events)
 
 
 rate_update_event = Event(
@@ -247,3 +248,4 @@ talgo_events = [
     set_max_account_balance_event,
     change_online_status_event,
 ]
+talgo_event_registry = EventRegistry(talgo_events)
@@ -4,6 +4,7 @@ from algosdk import transaction
 from algosdk.encoding import decode_address
 from algosdk.logic import get_application_address
 
+from tinyman.boxes import BoxReader
 from .base_client import BaseClient
 from .constants import *
 from .struct import get_struct
@@ -26,6 +27,7 @@ class TAlgoStakingClient(BaseClient):
         self.add_key(user_address, user_sk)
         self.current_timestamp = None
         self.simulate = False
+        self.boxes = BoxReader(algod)
 
     def set_reward_rate(self, total_reward_amount: int, end_timestamp: int):
         sp = self.get_suggested_params()
@@ -1,5 +1,7 @@
 from base64 import b64decode, b64encode
 import time
+from tinyman.boxes import BoxReader
+from tinyman.exceptions import BoxNotFound
 from tinyman.utils import TransactionGroup
 from algosdk import transaction
 from algosdk.logic import get_application_address
@@ -17,6 +19,7 @@ class BaseClient():
         self.add_key(user_address, user_sk)
         self.current_timestamp = None
         self.simulate = False
+        self.boxes = BoxReader(algod)
 
     def get_suggested_params(self):
         return self.algod.suggested_params()
@@ -43,6 +46,8 @@ class BaseClient():
             txn_info = self.algod.simulate_raw_transactions(txn_group.signed_transactions)
         else:
             txn_info = txn_group.submit(self.algod, wait=True)
+            # The transactions may have created or deleted boxes.
+            self.boxes.invalidate_box_names()
         return txn_info
 
     def flatten_transactions(self, txns):
@@ -79,16 +84,25 @@ class BaseClient():
 
     def get_box(self, box_name, struct_name, app_id=None):
         app_id = app_id or self.app_id
-        box_value = b64decode(self.algod.application_box_by_name(app_id, box_name)["value"])
+        box_value = self.boxes.get_box(app_id, box_name)
+        if box_value is None:
+            raise BoxNotFound(app_id, box_name)
         struct_class = get_struct(struct_name)
         struct = struct_class(box_value)
         return struct
 
+    def get_boxes(self, box_names, struct_name, app_id=None):
+        # Missing boxes are None.
+        app_id = app_id or self.app_id
+        struct_class = get_struct(struct_name)
+        box_values = self.boxes.get_boxes(app_id, box_names)
+        return {box_name: struct_class(box_value) if box_value is not None else None for box_name, box_value in box_values.items()}
+
     def box_exists(self, box_name, app_id=None):
         app_id = app_id or self.app_id
+        # Any error is treated as a missing box, BoxReader.box_exists raises the errors other than "box not found".
         try:
-            self.algod.application_box_by_name(app_id, box_name)
-            return True
+            return self.boxes.box_exists(app_id, box_name)
         except Exception:
             return False
 
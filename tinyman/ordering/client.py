@@ -3,6 +3,7 @@ from typing import List
 from algosdk import transaction
 from algosdk.encoding import decode_address, encode_address
 from algosdk.logic import get_application_address
+from tinyman.boxes import BoxReader
 from tinyman.utils import int_to_bytes
 
 from .base_client import BaseClient
@@ -29,6 +30,7 @@ class OrderingClient(BaseClient):
         self.add_key(user_address, user_sk)
         self.current_timestamp = None
         self.simulate = False
+        self.boxes = BoxReader(algod)
 
     def get_registry_entry_box_name(self, user_address: str) -> bytes:
         return b"e" + decode_address(user_address)
@@ -500,6 +502,7 @@ class RegistryClient(BaseClient):
         self.add_key(user_address, user_sk)
         self.current_timestamp = None
         self.simulate = False
+        self.boxes = BoxReader(algod)
 
     def get_registry_entry_box_name(self, user_address: str) -> bytes:
         return b"e" + decode_address(user_address)
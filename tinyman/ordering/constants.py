@@ -1,6 +1,7 @@
-import requests
 from algosdk import transaction
 
+from .programs import Program
+
 # Order App Globals & Commons with Registry
 REGISTRY_APP_ID_KEY = b"registry_app_id"
 REGISTRY_APP_ACCOUNT_ADDRESS_KEY = b"registry_app_account_address"
@@ -23,8 +24,14 @@ ENTRY_COUNT_KEY = b"entry_count"
 IS_ENDORSED_KEY = b"is_endorsed"
 
 # App Creation Config
-order_approval_program = requests.get("https://raw.githubusercontent.com/tinymanorg/tinyman-order-protocol/refs/tags/v5/contracts/order/build/order_approval.teal.tok").content
-order_clear_state_program = requests.get("https://raw.githubusercontent.com/tinymanorg/tinyman-order-protocol/refs/tags/v5/contracts/order/build/order_clear_state.teal.tok").content
+# sha256 digests of the v5 build artifacts (`sha256sum contracts/order/build/*.teal.tok`), they are pinned together with the
+# artifacts under tinyman/ordering/build. Without a pinned digest a program is only checked against the digest stored with its cached copy.
+ORDER_APPROVAL_PROGRAM_SHA256 = None
+ORDER_CLEAR_STATE_PROGRAM_SHA256 = None
+
+# Programs are loaded on first use of `.bytecode`, importing this module does not touch the network.
+order_approval_program = Program("order_approval.teal.tok", "https://raw.githubusercontent.com/tinymanorg/tinyman-order-protocol/refs/tags/v5/contracts/order/build/order_approval.teal.tok", ORDER_APPROVAL_PROGRAM_SHA256)
+order_clear_state_program = Program("order_clear_state.teal.tok", "https://raw.githubusercontent.com/tinymanorg/tinyman-order-protocol/refs/tags/v5/contracts/order/build/order_clear_state.teal.tok", ORDER_CLEAR_STATE_PROGRAM_SHA256)
 order_app_global_schema = transaction.StateSchema(num_uints=16, num_byte_slices=16)
 order_app_local_schema = transaction.StateSchema(num_uints=0, num_byte_slices=0)
 order_app_extra_pages = 3
@@ -1,6 +1,6 @@
 from algosdk import abi
 
-from .event import Event
+from .event import Event, EventRegistry
 
 
 # Registry Events
@@ -297,6 +297,7 @@ registry_events = [
     registry_update_recurring_order_event,
     registry_cancel_recurring_order_event,
 ]
+registry_event_registry = EventRegistry(registry_events)
 
 
 ordering_events = [
@@ -312,3 +313,4 @@ ordering_events = [
     cancel_recurring_order_event,
     execute_recurring_order_event,
 ]
+ordering_event_registry = EventRegistry(ordering_events)
@@ -0,0 +1,237 @@
+import math
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Iterable, Optional
+
+from tinyman.v2.integer_formulas import calculate_fixed_input_swap
+
+from .scanner import TriggerOrderTable
+
+
+@dataclass
+class OpenTriggerOrder:
+    app_id: int
+    order_id: int
+    user_address: Optional[str]
+    asset_id: int
+    amount: int
+    target_asset_id: int
+    target_amount: int
+    filled_amount: int
+    is_partial_allowed: bool
+    expiration_timestamp: int
+
+    @property
+    def key(self) -> tuple[int, int]:
+        return self.app_id, self.order_id
+
+    @property
+    def limit_price(self) -> Fraction:
+        # Minimum target asset amount per unit of the asset
+        return Fraction(self.target_amount, self.amount)
+
+    @property
+    def remaining_amount(self) -> int:
+        return self.amount - self.filled_amount
+
+    def get_required_target_amount(self, fill_amount: int) -> int:
+        # The limit price applies to partial fills pro rata, rounded up.
+        return -(-fill_amount * self.target_amount // self.amount)
+
+
+@dataclass
+class TriggerOrderMatch:
+    order: OpenTriggerOrder
+    fill_amount: int
+    # Quote of a fixed input swap of `fill_amount` against the pool reserves
+    swap_output_amount: int
+    total_fee_amount: int
+    required_target_amount: int
+
+
+class TriggerOrderIndex:
+    """
+    Open trigger orders of an asset pair, sorted by limit price.
+    """
+
+    def __init__(self):
+        # (limit_price, app_id, order_id)
+        self.entries: list[tuple] = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, order: OpenTriggerOrder):
+        insort(self.entries, (order.limit_price, *order.key))
+
+    def add_many(self, orders: Iterable[OpenTriggerOrder]):
+        # A single sort instead of an insertion per order, e.g. when loading a table.
+        self.entries.extend((order.limit_price, *order.key) for order in orders)
+        self.entries.sort()
+
+    def remove(self, order: OpenTriggerOrder):
+        entry = (order.limit_price, *order.key)
+        index = bisect_left(self.entries, entry)
+        if index < len(self.entries) and self.entries[index] == entry:
+            del self.entries[index]
+
+    def get_crossing_keys(self, price: Fraction) -> list[tuple[int, int]]:
+        # Orders with a limit price at or below the price, the lowest limit price first.
+        # (price, inf) sorts after all the entries with the same limit price.
+        return [entry[1:] for entry in self.entries[:bisect_right(self.entries, (price, math.inf))]]
+
+
+class TriggerOrderMatcher:
+    """
+    Finds the executable trigger orders when pool reserves change.
+
+    Orders are indexed by (asset_id, target_asset_id) and limit price. A price update selects the orders whose limit price is
+    at or below the pool price with a binary search, then sizes their fills with the V2 fixed input swap quote (`tinyman.v2.integer_formulas`).
+    An update costs O(log n + k) for k crossing orders.
+
+    Fills are quoted independently against the given reserves; after executing an order, the caller should update the order and the reserves.
+    """
+
+    def __init__(self):
+        # (asset_id, target_asset_id) -> TriggerOrderIndex
+        self.indexes: dict[tuple[int, int], TriggerOrderIndex] = {}
+        # (app_id, order_id) -> OpenTriggerOrder
+        self.orders: dict[tuple[int, int], OpenTriggerOrder] = {}
+
+    def __len__(self):
+        return len(self.orders)
+
+    @classmethod
+    def from_table(cls, table: TriggerOrderTable, timestamp: int) -> "TriggerOrderMatcher":
+        """
+        Creates a matcher of the open orders of an OrderScanner table.
+        """
+        orders = []
+        for i in table.get_open_indexes(timestamp):
+            row = table.get_row(i)
+            orders.append(
+                OpenTriggerOrder(
+                    app_id=row["app_id"],
+                    order_id=row["order_id"],
+                    user_address=row["user_address"],
+                    asset_id=row["asset_id"],
+                    amount=row["amount"],
+                    target_asset_id=row["target_asset_id"],
+                    target_amount=row["target_amount"],
+                    filled_amount=row["filled_amount"],
+                    is_partial_allowed=bool(row["is_partial_allowed"]),
+                    expiration_timestamp=row["expiration_timestamp"],
+                )
+            )
+
+        matcher = cls()
+        matcher.add_orders(orders)
+        return matcher
+
+    def add_orders(self, orders: Iterable[OpenTriggerOrder]):
+        orders_by_pair = {}
+        for order in orders:
+            self.remove_order(order.app_id, order.order_id)
+            if not order.amount or order.remaining_amount <= 0:
+                continue
+
+            self.orders[order.key] = order
+            orders_by_pair.setdefault((order.asset_id, order.target_asset_id), []).append(order)
+
+        for pair, pair_orders in orders_by_pair.items():
+            if pair not in self.indexes:
+                self.indexes[pair] = TriggerOrderIndex()
+            self.indexes[pair].add_many(pair_orders)
+
+    def add_order(self, order: OpenTriggerOrder):
+        # An order with the same key is replaced, e.g. after a partial fill.
+        self.remove_order(order.app_id, order.order_id)
+        if not order.amount or order.remaining_amount <= 0:
+            return
+
+        self.orders[order.key] = order
+        pair = (order.asset_id, order.target_asset_id)
+        if pair not in self.indexes:
+            self.indexes[pair] = TriggerOrderIndex()
+        self.indexes[pair].add(order)
+
+    def remove_order(self, app_id: int, order_id: int) -> Optional[OpenTriggerOrder]:
+        order = self.orders.pop((app_id, order_id), None)
+        if order is not None:
+            self.indexes[(order.asset_id, order.target_asset_id)].remove(order)
+        return order
+
+    def get_fill_amount(self, order: OpenTriggerOrder, input_supply: int, output_supply: int, total_fee_share: int) -> int:
+        """
+        Returns the largest fill amount whose swap output meets the limit price, 0 if the order is not executable.
+        """
+        def is_executable(fill_amount):
+            swap_output_amount, _, _ = calculate_fixed_input_swap(input_supply, output_supply, fill_amount, total_fee_share)
+            return swap_output_amount >= order.get_required_target_amount(fill_amount)
+
+        remaining_amount = order.remaining_amount
+        if is_executable(remaining_amount):
+            return remaining_amount
+        if not order.is_partial_allowed:
+            return 0
+
+        # The surplus of the swap output over the required amount is concave in the fill amount; it is negative for the smallest fills
+        # due to rounding and for the largest fills due to the price impact. The search starts at the fill with the largest surplus,
+        # beyond it the surplus decreases.
+        # peak = (sqrt(output_supply * input_supply * swap_ratio * amount / target_amount) - input_supply) / swap_ratio,
+        # with swap_ratio = (10_000 - total_fee_share) / 10_000.
+        swap_ratio_numerator = 10_000 - total_fee_share
+        root = math.isqrt(output_supply * input_supply * swap_ratio_numerator * order.amount // (10_000 * order.target_amount))
+        peak_fill_amount = (root - input_supply) * 10_000 // swap_ratio_numerator
+        low = min(max(peak_fill_amount, 1), remaining_amount - 1)
+        if low < 1 or not is_executable(low):
+            return 0
+
+        high = remaining_amount - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if is_executable(middle):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def match(self, input_asset_id: int, output_asset_id: int, input_supply: int, output_supply: int, total_fee_share: int, timestamp: Optional[int] = None) -> list[TriggerOrderMatch]:
+        """
+        Returns the executable orders selling `input_asset_id` for `output_asset_id` at the given pool reserves, the lowest limit price first.
+        """
+        index = self.indexes.get((input_asset_id, output_asset_id))
+        if index is None or not input_supply or not output_supply:
+            return []
+
+        matches = []
+        # The spot price is an upper bound of the price of any swap.
+        for key in index.get_crossing_keys(Fraction(output_supply, input_supply)):
+            order = self.orders[key]
+            if timestamp is not None and order.expiration_timestamp and order.expiration_timestamp <= timestamp:
+                continue
+
+            fill_amount = self.get_fill_amount(order, input_supply, output_supply, total_fee_share)
+            if not fill_amount:
+                continue
+
+            swap_output_amount, total_fee_amount, _ = calculate_fixed_input_swap(input_supply, output_supply, fill_amount, total_fee_share)
+            matches.append(
+                TriggerOrderMatch(
+                    order=order,
+                    fill_amount=fill_amount,
+                    swap_output_amount=swap_output_amount,
+                    total_fee_amount=total_fee_amount,
+                    required_target_amount=order.get_required_target_amount(fill_amount),
+                )
+            )
+        return matches
+
+    def match_pool(self, pool, timestamp: Optional[int] = None) -> list[TriggerOrderMatch]:
+        """
+        Returns the executable orders of both directions of a V2 pool with fetched reserves.
+        """
+        asset_1_id, asset_2_id = pool.asset_1.id, pool.asset_2.id
+        return self.match(asset_1_id, asset_2_id, pool.asset_1_reserves, pool.asset_2_reserves, pool.total_fee_share, timestamp=timestamp) + \
+            self.match(asset_2_id, asset_1_id, pool.asset_2_reserves, pool.asset_1_reserves, pool.total_fee_share, timestamp=timestamp)
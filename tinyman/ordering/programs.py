@@ -0,0 +1,112 @@
+import os
+from hashlib import sha256
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from tinyman.constants import CACHE_DIR_ENV
+
+SDK_DIR = Path(__file__).parent
+PACKAGE_PROGRAMS_DIR = SDK_DIR / "build"
+
+
+class Program:
+    """
+    Compiled TEAL program that is loaded on first access to `bytecode`.
+
+    Lookup order: the copy shipped as package data, the on-disk cache and finally the given URL.
+    Every copy is checked against the pinned `sha256_digest`; cached files are also stored with their digest and discarded if the content does not match.
+    """
+
+    def __init__(self, filename: str, url: str, sha256_digest: Optional[str]):
+        self.filename = filename
+        self.url = url
+        self.sha256_digest = sha256_digest
+        self._bytecode = None
+
+    def __repr__(self):
+        return f"Program({self.filename})"
+
+    @property
+    def bytecode(self) -> bytes:
+        if self._bytecode is None:
+            self._bytecode = self.load()
+        return self._bytecode
+
+    @property
+    def cache_dir(self) -> Optional[Path]:
+        if cache_dir := os.environ.get(CACHE_DIR_ENV):
+            return Path(cache_dir) / "ordering"
+        return None
+
+    @property
+    def cache_path(self) -> Optional[Path]:
+        # Keyed by the pinned digest, or by the URL if there is none, so that a new program version does not read an old cached copy.
+        if self.cache_dir is None:
+            return None
+        cache_key = self.sha256_digest or sha256(self.url.encode()).hexdigest()
+        return self.cache_dir / f"{cache_key[:16]}-{self.filename}"
+
+    def is_valid(self, bytecode: bytes, digest: Optional[str] = None) -> bool:
+        actual_digest = sha256(bytecode).hexdigest()
+        if self.sha256_digest is not None and actual_digest != self.sha256_digest:
+            return False
+        if digest is not None and actual_digest != digest:
+            return False
+        return True
+
+    def load(self) -> bytes:
+        package_path = PACKAGE_PROGRAMS_DIR / self.filename
+        if package_path.exists():
+            bytecode = package_path.read_bytes()
+            if self.is_valid(bytecode):
+                return bytecode
+
+        if (bytecode := self.read_cache()) is not None:
+            return bytecode
+
+        bytecode = self.fetch()
+        self.write_cache(bytecode)
+        return bytecode
+
+    def fetch(self) -> bytes:
+        response = requests.get(self.url, timeout=30)
+        response.raise_for_status()
+        bytecode = response.content
+        if not self.is_valid(bytecode):
+            raise Exception(f"Program hash mismatch: {self.url}")
+        return bytecode
+
+    def read_cache(self) -> Optional[bytes]:
+        path = self.cache_path
+        if path is None:
+            return None
+
+        digest_path = path.with_name(path.name + ".sha256")
+        try:
+            bytecode = path.read_bytes()
+            digest = digest_path.read_text().strip()
+        except OSError:
+            return None
+
+        if not self.is_valid(bytecode, digest):
+            return None
+        return bytecode
+
+    def write_cache(self, bytecode: bytes):
+        path = self.cache_path
+        if path is None:
+            return
+
+        digest_path = path.with_name(path.name + ".sha256")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that readers never see a partial program.
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(bytecode)
+            os.replace(tmp_path, path)
+            digest_path.write_text(sha256(bytecode).hexdigest())
+        except OSError:
+            # The cache is an optimization, failing to write it is not an error.
+            pass
@@ -0,0 +1,183 @@
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from algosdk.encoding import encode_address
+
+from tinyman.boxes import DEFAULT_MAX_WORKERS, get_app_box_values, get_box_names, get_box_values
+from tinyman.utils import bytes_to_int
+
+from .structs import Entry, RecurringOrder, TriggerOrder
+
+ENTRY_BOX_PREFIX = b"e"
+TRIGGER_ORDER_BOX_PREFIX = b"o"
+RECURRING_ORDER_BOX_PREFIX = b"r"
+# prefix + address
+ENTRY_BOX_NAME_SIZE = 33
+# prefix + order id
+ORDER_BOX_NAME_SIZE = 9
+
+
+def parse_order_boxes_into_columns(struct_class, raw_boxes: Iterable[bytes]) -> dict[str, array]:
+    """
+    Decodes order boxes into a column (array of uint64) per field.
+
+    The boxes are joined and unpacked at once; the fields of the order structs are consecutive uint64s, a column is a strided slice.
+    """
+    field_count = struct_class._size // 8
+    for name, struct_field in struct_class._fields.items():
+        if struct_field["size"] != 8 or struct_field["offset"] % 8 or struct_field["type"] not in ("int", "uint64"):
+            raise ValueError(f"{struct_class._name}.{name} is not a uint64 field")
+
+    values = array("Q", b"".join(bytes(raw_box[:struct_class._size]).ljust(struct_class._size, b"\x00") for raw_box in raw_boxes))
+    if sys.byteorder == "little":
+        values.byteswap()
+    return {name: values[struct_field["offset"] // 8::field_count] for name, struct_field in struct_class._fields.items()}
+
+
+@dataclass
+class OrderTable:
+    """
+    Orders of many order apps in columns, row i is the order `order_ids[i]` of the order app `app_ids[i]` owned by `user_addresses[i]`.
+    """
+    struct_class: type
+    user_addresses: list[str] = field(default_factory=list)
+    app_ids: array = field(default_factory=lambda: array("Q"))
+    order_ids: array = field(default_factory=lambda: array("Q"))
+    # field name -> column
+    columns: dict[str, array] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.order_ids)
+
+    def __getitem__(self, field_name: str) -> array:
+        return self.columns[field_name]
+
+    def get_row(self, index: int) -> dict:
+        row = {
+            "user_address": self.user_addresses[index],
+            "app_id": self.app_ids[index],
+            "order_id": self.order_ids[index],
+        }
+        for name, column in self.columns.items():
+            row[name] = column[index]
+        return row
+
+    def get_order(self, index: int):
+        # The order struct of the row, e.g. to prepare an execution transaction without fetching the box again.
+        return self.struct_class(b"".join(column[index].to_bytes(8, "big") for column in self.columns.values()))
+
+
+class TriggerOrderTable(OrderTable):
+    def get_open_indexes(self, timestamp: int) -> list[int]:
+        """
+        Returns the rows of the orders which are not filled and not expired. Orders with a zero expiration timestamp do not expire.
+        """
+        amounts = self.columns["amount"]
+        filled_amounts = self.columns["filled_amount"]
+        expiration_timestamps = self.columns["expiration_timestamp"]
+        return [
+            i for i in range(len(self))
+            if filled_amounts[i] < amounts[i] and (not expiration_timestamps[i] or expiration_timestamps[i] > timestamp)
+        ]
+
+
+class RecurringOrderTable(OrderTable):
+    def get_due_indexes(self, timestamp: int) -> list[int]:
+        """
+        Returns the rows of the orders which have remaining recurrences and whose interval has passed since the last fill.
+        """
+        remaining_recurrences = self.columns["remaining_recurrences"]
+        last_fill_timestamps = self.columns["last_fill_timestamp"]
+        intervals = self.columns["interval"]
+        return [
+            i for i in range(len(self))
+            if remaining_recurrences[i] and last_fill_timestamps[i] + intervals[i] <= timestamp
+        ]
+
+
+def fetch_order_apps(algod, registry_app_id: int, max_workers: int = DEFAULT_MAX_WORKERS) -> dict[int, str]:
+    """
+    Returns the order apps of the registry (app_id -> user_address) from the entry boxes.
+    """
+    entry_box_names = [
+        box_name for box_name in get_box_names(algod, registry_app_id)
+        if len(box_name) == ENTRY_BOX_NAME_SIZE and box_name.startswith(ENTRY_BOX_PREFIX)
+    ]
+    raw_boxes = get_box_values(algod, registry_app_id, entry_box_names, max_workers=max_workers)
+
+    order_apps = {}
+    for box_name, raw_box in zip(entry_box_names, raw_boxes):
+        if raw_box is None:
+            continue
+        order_apps[Entry(raw_box).app_id] = encode_address(box_name[1:])
+    return order_apps
+
+
+class OrderScanner:
+    """
+    Reads the trigger and recurring orders of all the order apps of a registry into columnar tables.
+
+    The order apps are read from the registry once (`refresh_order_apps`), each scan lists the boxes of the order apps and fetches the order boxes concurrently.
+    """
+
+    def __init__(self, algod, registry_app_id: int, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.algod = algod
+        self.registry_app_id = registry_app_id
+        self.max_workers = max_workers
+        # app_id -> user_address
+        self.order_apps: Optional[dict[int, str]] = None
+
+    def refresh_order_apps(self) -> dict[int, str]:
+        self.order_apps = fetch_order_apps(self.algod, self.registry_app_id, max_workers=self.max_workers)
+        return self.order_apps
+
+    def list_order_boxes(self, app_ids: Iterable[int]) -> list[tuple[int, bytes]]:
+        app_ids = list(app_ids)
+        if not app_ids:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(app_ids))) as executor:
+            box_names = executor.map(lambda app_id: get_box_names(self.algod, app_id), app_ids)
+            return [
+                (app_id, box_name)
+                for app_id, app_box_names in zip(app_ids, box_names)
+                for box_name in sorted(app_box_names)
+                if len(box_name) == ORDER_BOX_NAME_SIZE and box_name[:1] in (TRIGGER_ORDER_BOX_PREFIX, RECURRING_ORDER_BOX_PREFIX)
+            ]
+
+    def scan(self, app_ids: Optional[Iterable[int]] = None) -> tuple[TriggerOrderTable, RecurringOrderTable]:
+        """
+        Returns the trigger orders and the recurring orders of the given order apps, all the order apps of the registry by default.
+        """
+        if self.order_apps is None:
+            self.refresh_order_apps()
+        if app_ids is None:
+            app_ids = self.order_apps.keys()
+
+        boxes = self.list_order_boxes(app_ids)
+        raw_boxes = get_app_box_values(self.algod, boxes, max_workers=self.max_workers)
+
+        trigger_orders = TriggerOrderTable(TriggerOrder)
+        recurring_orders = RecurringOrderTable(RecurringOrder)
+        trigger_order_boxes = []
+        recurring_order_boxes = []
+        for (app_id, box_name), raw_box in zip(boxes, raw_boxes):
+            # Deleted after the listing
+            if raw_box is None:
+                continue
+
+            if box_name.startswith(TRIGGER_ORDER_BOX_PREFIX):
+                table, table_boxes = trigger_orders, trigger_order_boxes
+            else:
+                table, table_boxes = recurring_orders, recurring_order_boxes
+            table.user_addresses.append(self.order_apps.get(app_id))
+            table.app_ids.append(app_id)
+            table.order_ids.append(bytes_to_int(box_name[1:]))
+            table_boxes.append(raw_box)
+
+        trigger_orders.columns = parse_order_boxes_into_columns(TriggerOrder, trigger_order_boxes)
+        recurring_orders.columns = parse_order_boxes_into_columns(RecurringOrder, recurring_order_boxes)
+        return trigger_orders, recurring_orders
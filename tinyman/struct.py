@@ -0,0 +1,277 @@
+import json
+import re
+import struct
+from typing import Any, Dict, Optional
+
+MINIMUM_BALANCE_REQUIREMENT_PER_BOX = 2_500
+MINIMUM_BALANCE_REQUIREMENT_PER_BOX_BYTE = 400
+
+# struct module formats of the big endian integers with a native size
+INT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+
+class StructRegistry:
+    """
+    Struct definitions (as in the structs JSON files of the apps) and the classes compiled from them.
+
+    A definition is compiled once into a Struct subclass, field reads are a slice and a conversion.
+    """
+
+    def __init__(self):
+        self.struct_definitions: Dict[str, Dict] = {}
+        self.types: Dict[str, Any] = {}
+
+    def load_from_file(self, filepath: str) -> None:
+        """Load struct definitions from a JSON file."""
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+            self.load_from_dict(data.get('structs', {}))
+
+    def load_from_dict(self, struct_dict: Dict) -> None:
+        """Load struct definitions from a dictionary."""
+        self.struct_definitions.update(struct_dict)
+        # The compiled structs may refer to the updated definitions.
+        self.types.clear()
+
+    def get_type(self, name: str) -> Any:
+        """Get the appropriate type handler for a given type name."""
+        type_handler = self.types.get(name)
+        if type_handler is None:
+            type_handler = self._compile_type(name)
+            self.types[name] = type_handler
+        return type_handler
+
+    def _compile_type(self, name: str) -> Any:
+        if name == "int":
+            return TealishInt()
+        elif name.startswith("uint"):
+            return TealishInt()
+        elif name.startswith("bytes"):
+            return TealishBytes()
+        elif name in self.struct_definitions:
+            return compile_struct(name, registry=self, **self.struct_definitions[name])
+        elif "[" in name:
+            name, length = re.match(r"([A-Za-z_0-9]+)\[(\d+)\]", name).groups()
+            return ArrayType(self.get_type(name), int(length))
+        else:
+            raise KeyError(f"Unknown type: {name}")
+
+    def get_struct(self, name: str) -> type:
+        """Get the Struct class by name."""
+        if name not in self.struct_definitions:
+            raise KeyError(f"Struct '{name}' not found")
+        return self.get_type(name)
+
+
+class TealishInt():
+    def __call__(self, value) -> Any:
+        return int.from_bytes(value, "big")
+
+
+class TealishBytes():
+    def __call__(self, value) -> Any:
+        return value
+
+
+class Struct():
+    """
+    A view over the bytes of a box. Subclasses are created by `compile_struct`, one per struct definition.
+
+    Fields are read and written in place, nested structs and arrays are views over the same bytes.
+    """
+    __slots__ = ("_data",)
+
+    _name: str = ""
+    _size: int = 0
+    _fields: dict = {}
+    _field_names: tuple = ()
+    # Unpacks all the fields at once, None if the struct has nested structs.
+    _unpacker: Optional[struct.Struct] = None
+    # (index, converter) of the unpacked values which are not final, e.g. ints with a non-native size.
+    _unpack_converters: tuple = ()
+
+    def __init__(self, data=None):
+        if data is None:
+            data = bytearray(self._size)
+        self._data = memoryview(data)
+
+    def __setitem__(self, index, value):
+        if isinstance(value, (Struct, ArrayData)):
+            value = value._data
+        self._data[:] = value
+
+    def unpack_all(self, as_dict: bool = False):
+        """
+        Returns the values of all the fields in definition order, as a tuple or as a dict.
+        """
+        if self._unpacker is not None:
+            values = self._unpacker.unpack_from(self._data)
+            if self._unpack_converters:
+                values = list(values)
+                for index, converter in self._unpack_converters:
+                    values[index] = converter(values[index])
+                values = tuple(values)
+        else:
+            values = tuple(getattr(self, name) for name in self._field_names)
+
+        if as_dict:
+            return dict(zip(self._field_names, values))
+        return values
+
+    def __str__(self) -> str:
+        return repr(bytes(self._data))
+
+    def __repr__(self) -> str:
+        fields = {f: getattr(self, f) for f in self._field_names}
+        return f"{self._name}({fields})"
+
+    def __len__(self):
+        return len(self._data)
+
+    def __conform__(self, protocol):
+        return bytes(self._data)
+
+    def __bytes__(self):
+        return bytes(self._data.tobytes())
+
+
+class ArrayType():
+    def __init__(self, struct_class, length):
+        self._struct = struct_class
+        self._length = length
+        self._size = struct_class._size * length
+
+    def __call__(self, data=None) -> "ArrayData":
+        return ArrayData(self._struct, self._length, data)
+
+
+class ArrayData():
+    __slots__ = ("_struct", "_length", "_data")
+
+    def __init__(self, struct_class, length, data=None):
+        self._struct = struct_class
+        self._length = length
+        if data is None:
+            data = bytearray(struct_class._size * length)
+        self._data = memoryview(data)
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        offset = self._struct._size * index
+        end = offset + self._struct._size
+        return self._struct(self._data[offset:end])
+
+    def __setitem__(self, index, value):
+        offset = self._struct._size * index
+        end = offset + self._struct._size
+        if isinstance(value, Struct):
+            value = value._data
+        self._data[offset:end] = value
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return (self[i] for i in range(self._length))
+
+    def __repr__(self) -> str:
+        return ", ".join(repr(self[i]) for i in range(self._length))
+
+
+def _int_field(start: int, end: int) -> property:
+    size = end - start
+    from_bytes = int.from_bytes
+
+    def get(self):
+        return from_bytes(self._data[start:end], "big")
+
+    def set(self, value):
+        self._data[start:end] = value.to_bytes(size, "big")
+
+    return property(get, set)
+
+
+def _bytes_field(start: int, end: int) -> property:
+    def get(self):
+        return self._data[start:end]
+
+    def set(self, value):
+        if isinstance(value, (Struct, ArrayData)):
+            value = value._data
+        self._data[start:end] = value
+
+    return property(get, set)
+
+
+def _view_field(start: int, end: int, type_handler) -> property:
+    # Nested struct or array, a view over the bytes of the field.
+    def get(self):
+        return type_handler(self._data[start:end])
+
+    def set(self, value):
+        if isinstance(value, (Struct, ArrayData)):
+            value = value._data
+        self._data[start:end] = value
+
+    return property(get, set)
+
+
+def _get_unpacker(fields: dict, types: dict):
+    # A struct.Struct format of all the fields if they are ints or bytes, fields are padded to their offsets.
+    unpacker_format = ">"
+    converters = []
+    position = 0
+    for index, (name, field) in enumerate(fields.items()):
+        if field["offset"] < position:
+            return None, ()
+        if field["offset"] > position:
+            unpacker_format += f"{field['offset'] - position}x"
+
+        type_handler = types[name]
+        if isinstance(type_handler, TealishInt) and field["size"] in INT_FORMATS:
+            unpacker_format += INT_FORMATS[field["size"]]
+        elif isinstance(type_handler, TealishInt):
+            unpacker_format += f"{field['size']}s"
+            converters.append((index, type_handler))
+        elif isinstance(type_handler, TealishBytes):
+            unpacker_format += f"{field['size']}s"
+        else:
+            return None, ()
+        position = field["offset"] + field["size"]
+    return struct.Struct(unpacker_format), tuple(converters)
+
+
+def compile_struct(name: str, size: int, fields: dict, registry: StructRegistry) -> type:
+    """
+    Creates the Struct subclass of a struct definition, with a property per field at a precomputed offset.
+    """
+    types = {field_name: registry.get_type(field["type"]) for field_name, field in fields.items()}
+    namespace = {
+        "__slots__": (),
+        "_name": name,
+        "_size": size,
+        "_fields": fields,
+        "_field_names": tuple(fields),
+    }
+    namespace["_unpacker"], namespace["_unpack_converters"] = _get_unpacker(fields, types)
+
+    for field_name, field in fields.items():
+        start = field["offset"]
+        end = start + field["size"]
+        type_handler = types[field_name]
+        if isinstance(type_handler, TealishInt):
+            namespace[field_name] = _int_field(start, end)
+        elif isinstance(type_handler, TealishBytes):
+            namespace[field_name] = _bytes_field(start, end)
+        else:
+            namespace[field_name] = _view_field(start, end, type_handler)
+    return type(name, (Struct,), namespace)
+
+
+def get_box_costs(boxes):
+    cost = MINIMUM_BALANCE_REQUIREMENT_PER_BOX
+    for name, struct_class in boxes.items():
+        cost += len(name) * MINIMUM_BALANCE_REQUIREMENT_PER_BOX_BYTE
+        cost += struct_class._size * MINIMUM_BALANCE_REQUIREMENT_PER_BOX_BYTE
+    return cost
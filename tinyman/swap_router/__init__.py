@@ -0,0 +1,22 @@
+import importlib
+
+# Public names are imported from their modules on first access.
+LAZY_ATTRIBUTES = {
+    "PoolGraph": "graph",
+    "Route": "routes",
+    "get_best_fixed_input_route": "routes",
+    "get_best_fixed_output_route": "routes",
+    "prepare_swap_router_transactions": "swap_router",
+    "fetch_best_route_suggestion": "swap_router",
+}
+
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES:
+        module = importlib.import_module(f"{__name__}.{LAZY_ATTRIBUTES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
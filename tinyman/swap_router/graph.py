@@ -0,0 +1,132 @@
+from collections import defaultdict
+from typing import Iterable, Optional, Union
+
+from tinyman.assets import Asset
+from tinyman.swap_router.routes import (
+    Route,
+    get_best_fixed_input_route,
+    get_best_fixed_output_route,
+)
+from tinyman.v2.pools import Pool as TinymanV2Pool
+
+
+def get_pool_assets(pool) -> "tuple[Asset, Asset]":
+    if isinstance(pool, TinymanV2Pool):
+        return pool.asset_1, pool.asset_2
+    # Tinyman V1 Pool
+    return pool.asset1, pool.asset2
+
+
+class PoolGraph:
+    """
+    In-memory graph of pools keyed by asset id.
+
+    Routes are built from the pools in the graph without any network call, the pools must be refreshed by the caller.
+    Indirect (2 hop) routes only use V2 pools since the swap router only supports V2 pools.
+    """
+
+    def __init__(self, pools: Iterable = ()):
+        # asset_id -> {other_asset_id: [pool, ...]}
+        self.edges = defaultdict(lambda: defaultdict(list))
+        self.add_pools(pools)
+
+    def add_pool(self, pool):
+        asset_1, asset_2 = get_pool_assets(pool)
+        self.remove_pool(pool)
+        self.edges[asset_1.id][asset_2.id].append(pool)
+        self.edges[asset_2.id][asset_1.id].append(pool)
+
+    def add_pools(self, pools: Iterable):
+        for pool in pools:
+            self.add_pool(pool)
+
+    def remove_pool(self, pool):
+        asset_1, asset_2 = get_pool_assets(pool)
+        for asset_a_id, asset_b_id in (
+            (asset_1.id, asset_2.id),
+            (asset_2.id, asset_1.id),
+        ):
+            pools = self.edges.get(asset_a_id, {}).get(asset_b_id, [])
+            # Pools are replaced by (type, address), a refreshed copy of a pool replaces the old one.
+            pools[:] = [
+                p for p in pools if (type(p), p.address) != (type(pool), pool.address)
+            ]
+
+    def get_pools(self, asset_a_id: int, asset_b_id: int) -> list:
+        return list(self.edges.get(asset_a_id, {}).get(asset_b_id, []))
+
+    def get_asset(self, asset_id: int) -> Optional[Asset]:
+        for pools in self.edges.get(asset_id, {}).values():
+            for pool in pools:
+                for asset in get_pool_assets(pool):
+                    if asset.id == asset_id:
+                        return asset
+        return None
+
+    def get_routes(
+        self,
+        asset_in: Union[Asset, int],
+        asset_out: Union[Asset, int],
+        max_hops: int = 2,
+    ) -> "list[Route]":
+        assert max_hops in (1, 2)
+        asset_in_id = getattr(asset_in, "id", asset_in)
+        asset_out_id = getattr(asset_out, "id", asset_out)
+        if isinstance(asset_in, int):
+            asset_in = self.get_asset(asset_in_id)
+        if isinstance(asset_out, int):
+            asset_out = self.get_asset(asset_out_id)
+        if asset_in is None or asset_out is None or asset_in_id == asset_out_id:
+            return []
+
+        routes = [
+            Route(asset_in=asset_in, asset_out=asset_out, pools=[pool])
+            for pool in self.get_pools(asset_in_id, asset_out_id)
+        ]
+
+        if max_hops == 2:
+            asset_in_edges = self.edges.get(asset_in_id, {})
+            asset_out_edges = self.edges.get(asset_out_id, {})
+            for intermediary_asset_id in asset_in_edges.keys() & asset_out_edges.keys():
+                for pool_1 in asset_in_edges[intermediary_asset_id]:
+                    if not isinstance(pool_1, TinymanV2Pool):
+                        continue
+                    for pool_2 in asset_out_edges[intermediary_asset_id]:
+                        if not isinstance(pool_2, TinymanV2Pool):
+                            continue
+                        routes.append(
+                            Route(
+                                asset_in=asset_in,
+                                asset_out=asset_out,
+                                pools=[pool_1, pool_2],
+                            )
+                        )
+        return routes
+
+    def get_best_fixed_input_route(
+        self,
+        asset_in: Union[Asset, int],
+        asset_out: Union[Asset, int],
+        amount_in: int,
+        asset_in_algo_price: Optional[float] = None,
+        max_hops: int = 2,
+    ) -> Optional[Route]:
+        routes = self.get_routes(asset_in, asset_out, max_hops=max_hops)
+        return get_best_fixed_input_route(
+            routes=routes, amount_in=amount_in, asset_in_algo_price=asset_in_algo_price
+        )
+
+    def get_best_fixed_output_route(
+        self,
+        asset_in: Union[Asset, int],
+        asset_out: Union[Asset, int],
+        amount_out: int,
+        asset_in_algo_price: Optional[float] = None,
+        max_hops: int = 2,
+    ) -> Optional[Route]:
+        routes = self.get_routes(asset_in, asset_out, max_hops=max_hops)
+        return get_best_fixed_output_route(
+            routes=routes,
+            amount_out=amount_out,
+            asset_in_algo_price=asset_in_algo_price,
+        )
@@ -1,7 +1,7 @@
 import math
 from dataclasses import dataclass
 from typing import Optional
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from algosdk.constants import MIN_TXN_FEE
 
@@ -14,9 +14,18 @@ from tinyman.exceptions import (
 )
 from tinyman.utils import TransactionGroup
 from tinyman.swap_router.constants import FIXED_INPUT_SWAP_TYPE, FIXED_OUTPUT_SWAP_TYPE
-from tinyman.v1.pools import Pool as TinymanV1Pool
 from tinyman.v2.pools import Pool as TinymanV2Pool
-from tinyman.v2.quotes import SwapQuote as TinymanV2SwapQuote
+
+if TYPE_CHECKING:
+    from tinyman.v1.pools import Pool as TinymanV1Pool
+    from tinyman.v2.quotes import SwapQuote as TinymanV2SwapQuote
+
+
+def is_v1_pool(pool) -> bool:
+    # V1 is imported on demand, most routes only consist of V2 pools.
+    from tinyman.v1.pools import Pool as TinymanV1Pool
+
+    return isinstance(pool, TinymanV1Pool)
 
 
 @dataclass
@@ -122,7 +131,7 @@ class Route:
             if isinstance(pool, TinymanV2Pool):
                 asset_1_id = pool.asset_1.id
                 asset_2_id = pool.asset_2.id
-            elif isinstance(pool, TinymanV1Pool):
+            elif is_v1_pool(pool):
                 asset_1_id = pool.asset1.id
                 asset_2_id = pool.asset2.id
             else:
@@ -147,7 +156,7 @@ class Route:
                 pool_asset_1_price = pool.asset_1_price
                 pool_asset_2_price = pool.asset_2_price
 
-            elif isinstance(pool, TinymanV1Pool):
+            elif is_v1_pool(pool):
                 asset_1_id = pool.asset1.id
                 asset_2_id = pool.asset2.id
                 pool_asset_1_price = pool.asset1_price
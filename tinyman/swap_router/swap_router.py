@@ -21,7 +21,7 @@ from tinyman.swap_router.routes import Route
 from tinyman.utils import TransactionGroup
 from tinyman.v2.client import TinymanV2Client
 from tinyman.v2.constants import FIXED_INPUT_APP_ARGUMENT, FIXED_OUTPUT_APP_ARGUMENT
-from tinyman.v2.contracts import get_pool_logicsig
+from tinyman.v2.contracts import get_pool_address
 from tinyman.v2.pools import Pool as TinymanV2Pool
 
 
@@ -59,15 +59,13 @@ def prepare_swap_router_transactions(
     suggested_params: SuggestedParams,
     app_call_note: Optional[str] = None,
 ) -> TransactionGroup:
-    pool_1_logicsig = get_pool_logicsig(
+    pool_1_address = get_pool_address(
         validator_app_id, input_asset_id, intermediary_asset_id
     )
-    pool_1_address = pool_1_logicsig.address()
 
-    pool_2_logicsig = get_pool_logicsig(
+    pool_2_address = get_pool_address(
         validator_app_id, intermediary_asset_id, output_asset_id
     )
-    pool_2_address = pool_2_logicsig.address()
 
     txns = [
         AssetTransferTxn(
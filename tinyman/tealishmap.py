@@ -1,10 +1,20 @@
-from typing import Dict, Optional, Any
+from array import array
+from typing import Dict, Optional, Any, List, Sequence
+
+
+def compact_line_table(lines: List[Optional[int]]) -> Sequence[Optional[int]]:
+    # Line tables are large lists of small ints, an unsigned int array keeps them in a single buffer.
+    # Tables with gaps (None) are kept as lists.
+    try:
+        return array("I", lines)
+    except (TypeError, OverflowError):
+        return lines
 
 
 class TealishMap:
     def __init__(self, map: Dict[str, Any]) -> None:
-        self.pc_teal = map.get("pc_teal", [])
-        self.teal_tealish = map.get("teal_tealish", [])
+        self.pc_teal = compact_line_table(map.get("pc_teal", []))
+        self.teal_tealish = compact_line_table(map.get("teal_tealish", []))
         self.errors: Dict[int, str] = {
             int(k): v for k, v in map.get("errors", {}).items()
         }
@@ -0,0 +1,23 @@
+import importlib
+
+# Public names are imported from their modules on first access.
+LAZY_ATTRIBUTES = {
+    "TinymanClient": "client",
+    "TinymanTestnetClient": "client",
+    "TinymanMainnetClient": "client",
+    "Pool": "pools",
+    "SwapQuote": "pools",
+    "MintQuote": "pools",
+    "BurnQuote": "pools",
+}
+
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES:
+        module = importlib.import_module(f"{__name__}.{LAZY_ATTRIBUTES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
@@ -4,18 +4,26 @@ import importlib.resources
 from tinyman.compat import LogicSigAccount
 import tinyman.v1
 from base64 import b64decode
+from functools import lru_cache
 from tinyman.utils import encode_value
 
-if sys.version_info >= (3, 9):
-    _contracts = json.loads(
-        importlib.resources.files(tinyman.v1).joinpath("asc.json").read_text()
-    )
-else:
-    _contracts = json.loads(importlib.resources.read_text(tinyman.v1, "asc.json"))
 
-pool_logicsig_def = _contracts["contracts"]["pool_logicsig"]["logic"]
+@lru_cache(maxsize=None)
+def get_contracts():
+    if sys.version_info >= (3, 9):
+        return json.loads(
+            importlib.resources.files(tinyman.v1).joinpath("asc.json").read_text()
+        )
+    return json.loads(importlib.resources.read_text(tinyman.v1, "asc.json"))
+
 
-validator_app_def = _contracts["contracts"]["validator_app"]
+def __getattr__(name):
+    # asc.json is parsed on first use instead of at import time.
+    if name == "pool_logicsig_def":
+        return get_contracts()["contracts"]["pool_logicsig"]["logic"]
+    if name == "validator_app_def":
+        return get_contracts()["contracts"]["validator_app"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_program(definition, variables=None):
@@ -45,7 +53,7 @@ def get_pool_logicsig(validator_app_id, asset1_id, asset2_id):
     asset_id_1 = max(assets)
     asset_id_2 = min(assets)
     program_bytes = get_program(
-        pool_logicsig_def,
+        get_contracts()["contracts"]["pool_logicsig"]["logic"],
         variables=dict(
             validator_app_id=validator_app_id,
             asset_id_1=asset_id_1,
@@ -0,0 +1,25 @@
+import importlib
+
+# Public names are imported from their modules on first access.
+LAZY_ATTRIBUTES = {
+    "TinymanV2Client": "client",
+    "TinymanV2TestnetClient": "client",
+    "TinymanV2MainnetClient": "client",
+    "AsyncTinymanV2Client": "async_client",
+    "AsyncTinymanV2TestnetClient": "async_client",
+    "AsyncTinymanV2MainnetClient": "async_client",
+    "Pool": "pools",
+    "SwapQuote": "quotes",
+    "FlashLoanQuote": "quotes",
+}
+
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES:
+        module = importlib.import_module(f"{__name__}.{LAZY_ATTRIBUTES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
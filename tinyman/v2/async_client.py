@@ -0,0 +1,82 @@
+import asyncio
+from typing import Optional
+
+from tinyman.async_algod import AsyncAlgodClient
+from tinyman.async_client import AsyncBaseTinymanClient
+from tinyman.staking.constants import (
+    TESTNET_STAKING_APP_ID,
+    MAINNET_STAKING_APP_ID,
+)
+from tinyman.swap_router.constants import (
+    TESTNET_SWAP_ROUTER_APP_ID_V1,
+    MAINNET_SWAP_ROUTER_APP_ID_V1,
+)
+from tinyman.v2.client import TinymanV2Client
+from tinyman.v2.constants import (
+    TESTNET_VALIDATOR_APP_ID,
+    MAINNET_VALIDATOR_APP_ID,
+)
+
+
+class AsyncTinymanV2Client(AsyncBaseTinymanClient, TinymanV2Client):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The pool state cache reads through a sync algod, pools of the async client are refreshed with `Pool.refresh_async`.
+        self.pool_state_cache = None
+
+    async def fetch_pool(self, asset_a, asset_b, fetch=True):
+        from .pools import Pool
+
+        if fetch:
+            asset_a, asset_b = await asyncio.gather(
+                self.fetch_asset(getattr(asset_a, "id", asset_a)),
+                self.fetch_asset(getattr(asset_b, "id", asset_b)),
+            )
+
+        pool = Pool(self, asset_a, asset_b, fetch=False)
+        if fetch:
+            await pool.refresh_async()
+        return pool
+
+    async def fetch_pools(self, pairs: "list[tuple]") -> dict:
+        pairs = list(pairs)
+        pools = await asyncio.gather(*[self.fetch_pool(*pair) for pair in pairs])
+        return dict(zip(pairs, pools))
+
+
+class AsyncTinymanV2TestnetClient(AsyncTinymanV2Client):
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        user_address: Optional[str] = None,
+        client_name: Optional[str] = None,
+        api_base_url: Optional[str] = None,
+    ):
+        super().__init__(
+            algod_client,
+            validator_app_id=TESTNET_VALIDATOR_APP_ID,
+            router_app_id=TESTNET_SWAP_ROUTER_APP_ID_V1,
+            api_base_url=api_base_url or "https://testnet.analytics.tinyman.org/api/",
+            user_address=user_address,
+            staking_app_id=TESTNET_STAKING_APP_ID,
+            client_name=client_name,
+        )
+
+
+class AsyncTinymanV2MainnetClient(AsyncTinymanV2Client):
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        user_address: Optional[str] = None,
+        client_name: Optional[str] = None,
+        api_base_url: Optional[str] = None,
+    ):
+        super().__init__(
+            algod_client,
+            validator_app_id=MAINNET_VALIDATOR_APP_ID,
+            router_app_id=MAINNET_SWAP_ROUTER_APP_ID_V1,
+            api_base_url=api_base_url or "https://mainnet.analytics.tinyman.org/api/",
+            user_address=user_address,
+            staking_app_id=MAINNET_STAKING_APP_ID,
+            client_name=client_name,
+        )
@@ -9,7 +9,7 @@ from algosdk.logic import get_application_address
 
 from tinyman.utils import TransactionGroup
 from .constants import BOOTSTRAP_APP_ARGUMENT
-from .contracts import get_pool_logicsig
+from .contracts import get_pool_address, get_pool_logicsig
 
 
 def prepare_bootstrap_transactions(
@@ -23,7 +23,7 @@ def prepare_bootstrap_transactions(
     app_call_note: Optional[str] = None,
 ) -> TransactionGroup:
     pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
     assert asset_1_id > asset_2_id
 
     txns = list()
@@ -53,5 +53,5 @@ def prepare_bootstrap_transactions(
     txns.append(bootstrap_app_call)
 
     txn_group = TransactionGroup(txns)
-    txn_group.sign_with_logicsig(pool_logicsig)
+    txn_group.sign_with_logicsig(pool_logicsig, address=pool_address)
     return txn_group
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from algosdk.v2client.algod import AlgodClient
@@ -17,19 +18,80 @@ from tinyman.v2.constants import (
     TESTNET_VALIDATOR_APP_ID,
     MAINNET_VALIDATOR_APP_ID,
 )
+from tinyman.v2.pool_cache import PoolStateCache
 from tinyman.v2.utils import lookup_error, get_tealishmap
 
 
 class TinymanV2Client(BaseTinymanClient):
     def __init__(self, *args, **kwargs):
         self.router_app_id = kwargs.pop("router_app_id", None)
+        pool_state_max_age_ms = kwargs.pop("pool_state_max_age_ms", 0)
         super().__init__(*args, **kwargs)
+        self.pool_state_cache = PoolStateCache(
+            self.algod, max_age_ms=pool_state_max_age_ms
+        )
 
     def fetch_pool(self, asset_a, asset_b, fetch=True):
         from .pools import Pool
 
         return Pool(self, asset_a, asset_b, fetch=fetch)
 
+    def fetch_pools(self, pairs: "list[tuple]", max_workers: int = 10) -> dict:
+        from .contracts import get_pool_address
+        from .pools import Pool, generate_pool_info, get_pool_state_from_account_info
+
+        pairs = list(pairs)
+        asset_id_pairs = [
+            tuple(getattr(asset, "id", asset) for asset in pair) for pair in pairs
+        ]
+        addresses = [
+            get_pool_address(self.validator_app_id, asset_a_id, asset_b_id)
+            for asset_a_id, asset_b_id in asset_id_pairs
+        ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            account_infos = list(executor.map(self.algod.account_info, addresses))
+
+        asset_ids = set()
+        for (asset_a_id, asset_b_id), account_info in zip(
+            asset_id_pairs, account_infos
+        ):
+            asset_ids.update((asset_a_id, asset_b_id))
+            if pool_token_asset_id := get_pool_state_from_account_info(
+                account_info
+            ).get("pool_token_asset_id"):
+                asset_ids.add(pool_token_asset_id)
+        assets = self.fetch_assets(asset_ids, max_workers=max_workers)
+
+        pools = {}
+        for pair, (asset_a_id, asset_b_id), account_info in zip(
+            pairs, asset_id_pairs, account_infos
+        ):
+            if account_info.get("apps-local-state"):
+                pool = Pool.from_account_info(account_info=account_info, client=self)
+                self.pool_state_cache.set(
+                    generate_pool_info(
+                        address=pool.address,
+                        validator_app_id=pool.validator_app_id,
+                        round_number=account_info.get("round"),
+                        state=get_pool_state_from_account_info(account_info),
+                    )
+                )
+                # Replace the placeholder assets with the batch-resolved ones.
+                pool.asset_1 = assets[pool.asset_1.id]
+                pool.asset_2 = assets[pool.asset_2.id]
+                if pool.exists:
+                    pool.pool_token_asset = assets[pool.pool_token_asset.id]
+            else:
+                pool = Pool(
+                    client=self,
+                    asset_a=assets[asset_a_id],
+                    asset_b=assets[asset_b_id],
+                    fetch=False,
+                )
+            pools[pair] = pool
+        return pools
+
     def handle_error(self, exception, txn_group):
         error = parse_error(exception)
         if isinstance(error, LogicError):
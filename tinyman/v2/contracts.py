@@ -1,19 +1,38 @@
 from base64 import b64decode
+from functools import lru_cache
 
 from tinyman.compat import LogicSigAccount
 
 from tinyman.v2.constants import POOL_LOGICSIG_TEMPLATE
 
+POOL_LOGICSIG_TEMPLATE_BYTES = b64decode(POOL_LOGICSIG_TEMPLATE)
+POOL_LOGICSIG_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=POOL_LOGICSIG_CACHE_SIZE)
+def get_pool_logicsig_and_address(
+    validator_app_id: int, asset_1_id: int, asset_2_id: int
+) -> "tuple[LogicSigAccount, str]":
+    program = bytearray(POOL_LOGICSIG_TEMPLATE_BYTES)
+    program[3:11] = validator_app_id.to_bytes(8, "big")
+    program[11:19] = asset_1_id.to_bytes(8, "big")
+    program[19:27] = asset_2_id.to_bytes(8, "big")
+    logicsig = LogicSigAccount(bytes(program))
+    return logicsig, logicsig.address()
+
 
 def get_pool_logicsig(
     validator_app_id: int, asset_a_id: int, asset_b_id: int
 ) -> LogicSigAccount:
+    # The logicsig is cached and shared between callers, it is an escrow and must not be signed.
     assets = [asset_a_id, asset_b_id]
     asset_1_id = max(assets)
     asset_2_id = min(assets)
+    return get_pool_logicsig_and_address(validator_app_id, asset_1_id, asset_2_id)[0]
 
-    program = bytearray(b64decode(POOL_LOGICSIG_TEMPLATE))
-    program[3:11] = validator_app_id.to_bytes(8, "big")
-    program[11:19] = asset_1_id.to_bytes(8, "big")
-    program[19:27] = asset_2_id.to_bytes(8, "big")
-    return LogicSigAccount(program)
+
+def get_pool_address(validator_app_id: int, asset_a_id: int, asset_b_id: int) -> str:
+    assets = [asset_a_id, asset_b_id]
+    asset_1_id = max(assets)
+    asset_2_id = min(assets)
+    return get_pool_logicsig_and_address(validator_app_id, asset_1_id, asset_2_id)[1]
@@ -13,7 +13,7 @@ from .constants import (
     FLASH_LOAN_APP_ARGUMENT,
     VERIFY_FLASH_LOAN_APP_ARGUMENT,
 )
-from .contracts import get_pool_logicsig
+from .contracts import get_pool_address
 
 
 def prepare_flash_loan_transactions(
@@ -31,8 +31,7 @@ def prepare_flash_loan_transactions(
 ) -> TransactionGroup:
     assert asset_1_loan_amount or asset_2_loan_amount
 
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
     min_fee = suggested_params.min_fee
 
     if asset_1_loan_amount and asset_2_loan_amount:
@@ -0,0 +1,383 @@
+"""
+Integer-only versions of the V2 formulas.
+
+The functions in `tinyman.v2.formulas` use float division and `math.sqrt`, they lose precision once the products of
+reserves exceed 2^53. The functions below use floor division and `math.isqrt` like the AMM contract.
+"""
+import math
+
+from tinyman.utils import calculate_price_impact
+from tinyman.v2.constants import LOCKED_POOL_TOKENS
+from tinyman.exceptions import InsufficientReserves, LowSwapAmountError
+from tinyman.v2.formulas import (
+    calculate_fixed_input_fee_amount,
+    calculate_fixed_output_fee_amount,
+    calculate_poolers_fee_amount,
+    calculate_protocol_fee_amount,
+)
+
+# Below 2^52 the product is exact as a float and the correctly rounded square root can not round up to the next
+# integer, int(math.sqrt(n)) equals math.isqrt(n).
+MAX_EXACT_SQRT_INPUT = 2**52
+
+
+def ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+def calculate_internal_swap_fee_amount(swap_amount: int, total_fee_share: int) -> int:
+    total_fee_amount = (swap_amount * total_fee_share) // (10_000 - total_fee_share)
+    return total_fee_amount
+
+
+def calculate_flash_swap_asset_2_payment_amount(
+    asset_1_reserves: int,
+    asset_2_reserves: int,
+    total_fee_share: int,
+    protocol_fee_ratio: int,
+    asset_1_loan_amount: int,
+    asset_2_loan_amount: int,
+    asset_1_payment_amount: int,
+) -> int:
+    k = asset_1_reserves * asset_2_reserves
+    asset_1_total_fee_amount = calculate_fixed_input_fee_amount(
+        asset_1_payment_amount, total_fee_share
+    )
+    asset_1_protocol_fee_amount = calculate_protocol_fee_amount(
+        asset_1_total_fee_amount, protocol_fee_ratio
+    )
+    asset_1_poolers_fee_amount = calculate_poolers_fee_amount(
+        asset_1_total_fee_amount, protocol_fee_ratio
+    )
+
+    final_asset_1_reserves = (asset_1_reserves - asset_1_loan_amount) + (
+        asset_1_payment_amount - asset_1_protocol_fee_amount
+    )
+    final_asset_1_reserves_without_poolers_fee = (
+        final_asset_1_reserves - asset_1_poolers_fee_amount
+    )
+    # ceil((k / final_reserves - remaining_reserves) * 10_000 / (10_000 - total_fee_share)) as a single exact division.
+    remaining_asset_2_reserves = asset_2_reserves - asset_2_loan_amount
+    minimum_asset_2_payment_amount = ceil_div(
+        (k - remaining_asset_2_reserves * final_asset_1_reserves_without_poolers_fee)
+        * 10_000,
+        final_asset_1_reserves_without_poolers_fee * (10_000 - total_fee_share),
+    )
+    return minimum_asset_2_payment_amount
+
+
+def calculate_flash_swap_asset_1_payment_amount(
+    asset_1_reserves: int,
+    asset_2_reserves: int,
+    total_fee_share: int,
+    protocol_fee_ratio: int,
+    asset_1_loan_amount: int,
+    asset_2_loan_amount: int,
+    asset_2_payment_amount: int,
+) -> int:
+    k = asset_1_reserves * asset_2_reserves
+    asset_2_total_fee_amount = calculate_fixed_input_fee_amount(
+        asset_2_payment_amount, total_fee_share
+    )
+    asset_2_protocol_fee_amount = calculate_protocol_fee_amount(
+        asset_2_total_fee_amount, protocol_fee_ratio
+    )
+    asset_2_poolers_fee_amount = calculate_poolers_fee_amount(
+        asset_2_total_fee_amount, protocol_fee_ratio
+    )
+
+    final_asset_2_reserves = (asset_2_reserves - asset_2_loan_amount) + (
+        asset_2_payment_amount - asset_2_protocol_fee_amount
+    )
+    final_asset_2_reserves_without_poolers_fee = (
+        final_asset_2_reserves - asset_2_poolers_fee_amount
+    )
+    # ceil((k / final_reserves - remaining_reserves) * 10_000 / (10_000 - total_fee_share)) as a single exact division.
+    remaining_asset_1_reserves = asset_1_reserves - asset_1_loan_amount
+    minimum_asset_1_payment_amount = ceil_div(
+        (k - remaining_asset_1_reserves * final_asset_2_reserves_without_poolers_fee)
+        * 10_000,
+        final_asset_2_reserves_without_poolers_fee * (10_000 - total_fee_share),
+    )
+    return minimum_asset_1_payment_amount
+
+
+def calculate_initial_add_liquidity(asset_1_amount: int, asset_2_amount: int) -> int:
+    assert (
+        asset_1_amount and asset_2_amount
+    ), "Both assets are required for the initial add liquidity"
+
+    product = asset_1_amount * asset_2_amount
+    if product < MAX_EXACT_SQRT_INPUT:
+        # math.sqrt is exact in this range and faster than math.isqrt.
+        pool_token_asset_amount = int(math.sqrt(product)) - LOCKED_POOL_TOKENS
+    else:
+        pool_token_asset_amount = math.isqrt(product) - LOCKED_POOL_TOKENS
+    return pool_token_asset_amount
+
+
+def calculate_remove_liquidity_output_amounts(
+    pool_token_asset_amount: int,
+    asset_1_reserves: int,
+    asset_2_reserves: int,
+    issued_pool_tokens: int,
+) -> (int, int):
+    if issued_pool_tokens > (pool_token_asset_amount + LOCKED_POOL_TOKENS):
+        asset_1_output_amount = (
+            pool_token_asset_amount * asset_1_reserves
+        ) // issued_pool_tokens
+        asset_2_output_amount = (
+            pool_token_asset_amount * asset_2_reserves
+        ) // issued_pool_tokens
+    else:
+        asset_1_output_amount = asset_1_reserves
+        asset_2_output_amount = asset_2_reserves
+
+    return asset_1_output_amount, asset_2_output_amount
+
+
+def calculate_subsequent_add_liquidity(
+    asset_1_reserves: int,
+    asset_2_reserves: int,
+    issued_pool_tokens: int,
+    total_fee_share: int,
+    asset_1_amount: int,
+    asset_2_amount: int,
+) -> (int, bool, int, int, int, float):
+    assert asset_1_reserves and asset_2_reserves and issued_pool_tokens
+
+    old_k = asset_1_reserves * asset_2_reserves
+    new_asset_1_reserves = asset_1_reserves + asset_1_amount
+    new_asset_2_reserves = asset_2_reserves + asset_2_amount
+    new_k = new_asset_1_reserves * new_asset_2_reserves
+    new_issued_pool_tokens = math.isqrt((new_k * (issued_pool_tokens**2)) // old_k)
+
+    pool_token_asset_amount = new_issued_pool_tokens - issued_pool_tokens
+    calculated_asset_1_amount = (
+        pool_token_asset_amount * new_asset_1_reserves
+    ) // new_issued_pool_tokens
+    calculated_asset_2_amount = (
+        pool_token_asset_amount * new_asset_2_reserves
+    ) // new_issued_pool_tokens
+
+    asset_1_swap_amount = asset_1_amount - calculated_asset_1_amount
+    asset_2_swap_amount = asset_2_amount - calculated_asset_2_amount
+
+    if asset_1_swap_amount > asset_2_swap_amount:
+        swap_in_amount_without_fee = asset_1_swap_amount
+        swap_out_amount = -min(asset_2_swap_amount, 0)
+        swap_from_asset_1_to_asset_2 = True
+
+        swap_total_fee_amount = calculate_internal_swap_fee_amount(
+            swap_in_amount_without_fee,
+            total_fee_share,
+        )
+        fee_as_pool_tokens = (swap_total_fee_amount * new_issued_pool_tokens) // (
+            new_asset_1_reserves * 2
+        )
+        swap_in_amount = swap_in_amount_without_fee + swap_total_fee_amount
+        pool_token_asset_amount = pool_token_asset_amount - fee_as_pool_tokens
+    else:
+        swap_in_amount_without_fee = asset_2_swap_amount
+        swap_out_amount = -min(asset_1_swap_amount, 0)
+        swap_from_asset_1_to_asset_2 = False
+
+        swap_total_fee_amount = calculate_internal_swap_fee_amount(
+            swap_in_amount_without_fee,
+            total_fee_share,
+        )
+        fee_as_pool_tokens = (swap_total_fee_amount * new_issued_pool_tokens) // (
+            new_asset_2_reserves * 2
+        )
+        swap_in_amount = swap_in_amount_without_fee + swap_total_fee_amount
+        pool_token_asset_amount = pool_token_asset_amount - fee_as_pool_tokens
+
+    swap_price_impact = calculate_price_impact(
+        input_supply=asset_1_reserves
+        if swap_from_asset_1_to_asset_2
+        else asset_2_reserves,
+        output_supply=asset_2_reserves
+        if swap_from_asset_1_to_asset_2
+        else asset_1_reserves,
+        swap_input_amount=swap_in_amount,
+        swap_output_amount=swap_out_amount,
+    )
+    return (
+        pool_token_asset_amount,
+        swap_from_asset_1_to_asset_2,
+        swap_in_amount,
+        swap_out_amount,
+        swap_total_fee_amount,
+        swap_price_impact,
+    )
+
+
+def calculate_output_amount_of_fixed_input_swap(
+    input_supply: int, output_supply: int, swap_amount: int
+) -> int:
+    k = input_supply * output_supply
+    output_amount = output_supply - (k // (input_supply + swap_amount))
+    output_amount -= 1
+
+    # On-chain app raises an error if output_amount is less than zero.
+    output_amount = max(output_amount, 0)
+    return output_amount
+
+
+def calculate_swap_amount_of_fixed_output_swap(
+    input_supply: int, output_supply: int, output_amount: int
+) -> int:
+    assert output_supply > output_amount
+
+    k = input_supply * output_supply
+    swap_amount = (k // (output_supply - output_amount)) - input_supply
+    swap_amount += 1
+    return swap_amount
+
+
+def calculate_fixed_input_swap(
+    input_supply: int, output_supply: int, swap_input_amount: int, total_fee_share: int
+) -> (int, int, float):
+    if not swap_input_amount:
+        raise LowSwapAmountError()
+
+    total_fee_amount = calculate_fixed_input_fee_amount(
+        input_amount=swap_input_amount, total_fee_share=total_fee_share
+    )
+    swap_amount = swap_input_amount - total_fee_amount
+    swap_output_amount = calculate_output_amount_of_fixed_input_swap(
+        input_supply, output_supply, swap_amount
+    )
+
+    price_impact = calculate_price_impact(
+        input_supply=input_supply,
+        output_supply=output_supply,
+        swap_input_amount=swap_input_amount,
+        swap_output_amount=swap_output_amount,
+    )
+    return swap_output_amount, total_fee_amount, price_impact
+
+
+def calculate_fixed_output_swap(
+    input_supply: int, output_supply: int, swap_output_amount: int, total_fee_share: int
+) -> (int, int, float):
+    if output_supply <= swap_output_amount:
+        raise InsufficientReserves()
+
+    swap_amount = calculate_swap_amount_of_fixed_output_swap(
+        input_supply, output_supply, swap_output_amount
+    )
+    total_fee_amount = calculate_fixed_output_fee_amount(
+        swap_amount=swap_amount, total_fee_share=total_fee_share
+    )
+    swap_input_amount = swap_amount + total_fee_amount
+
+    price_impact = calculate_price_impact(
+        input_supply=input_supply,
+        output_supply=output_supply,
+        swap_input_amount=swap_input_amount,
+        swap_output_amount=swap_output_amount,
+    )
+    return swap_input_amount, total_fee_amount, price_impact
+
+
+def import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for the vectorized formulas. Install it with `pip install tinyman-py-sdk[numpy]`."
+        )
+    return numpy
+
+
+def calculate_fixed_input_swap_batch(
+    input_supply: int,
+    output_supply: int,
+    amounts: "list[int]",
+    total_fee_share: int,
+    use_numpy: bool = False,
+) -> ("list[int]", "list[int]", "list[float]"):
+    """
+    Returns swap output amounts, total fee amounts and price impacts of the given input amounts.
+    The default path is `tinyman.v2.calculate_fixed_input_swap` of each amount, it matches the on-chain rounding.
+    `use_numpy=True` returns float64 arrays, it is an approximation for charting.
+    """
+    if use_numpy:
+        np = import_numpy()
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if not amounts.all():
+            raise LowSwapAmountError()
+
+        total_fee_amounts = calculate_fixed_input_fee_amount(amounts, total_fee_share)
+        swap_amounts = amounts - total_fee_amounts
+        k = float(input_supply) * float(output_supply)
+        swap_output_amounts = output_supply - np.floor(
+            k / (input_supply + swap_amounts)
+        )
+        swap_output_amounts = np.maximum(swap_output_amounts - 1, 0)
+        # Same as `calculate_price_impact`, which can not round arrays.
+        pool_price = output_supply / input_supply
+        price_impacts = np.round(1 - ((swap_output_amounts / amounts) / pool_price), 5)
+        return swap_output_amounts, total_fee_amounts, price_impacts
+
+    swap_output_amounts = []
+    total_fee_amounts = []
+    price_impacts = []
+    for swap_input_amount in amounts:
+        (
+            swap_output_amount,
+            total_fee_amount,
+            price_impact,
+        ) = calculate_fixed_input_swap(
+            input_supply, output_supply, swap_input_amount, total_fee_share
+        )
+        swap_output_amounts.append(swap_output_amount)
+        total_fee_amounts.append(total_fee_amount)
+        price_impacts.append(price_impact)
+    return swap_output_amounts, total_fee_amounts, price_impacts
+
+
+def calculate_fixed_output_swap_batch(
+    input_supply: int,
+    output_supply: int,
+    amounts: "list[int]",
+    total_fee_share: int,
+    use_numpy: bool = False,
+) -> ("list[int]", "list[int]", "list[float]"):
+    """
+    Returns swap input amounts, total fee amounts and price impacts of the given output amounts.
+    The default path is `tinyman.v2.calculate_fixed_output_swap` of each amount, it matches the on-chain rounding.
+    `use_numpy=True` returns float64 arrays, it is an approximation for charting.
+    """
+    if use_numpy:
+        np = import_numpy()
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if (amounts >= output_supply).any():
+            raise InsufficientReserves()
+
+        k = float(input_supply) * float(output_supply)
+        swap_amounts = np.floor(k / (output_supply - amounts)) - input_supply + 1
+        total_fee_amounts = calculate_fixed_output_fee_amount(
+            swap_amounts, total_fee_share
+        )
+        swap_input_amounts = swap_amounts + total_fee_amounts
+        pool_price = output_supply / input_supply
+        price_impacts = np.round(1 - ((amounts / swap_input_amounts) / pool_price), 5)
+        return swap_input_amounts, total_fee_amounts, price_impacts
+
+    swap_input_amounts = []
+    total_fee_amounts = []
+    price_impacts = []
+    for swap_output_amount in amounts:
+        (
+            swap_input_amount,
+            total_fee_amount,
+            price_impact,
+        ) = calculate_fixed_output_swap(
+            input_supply, output_supply, swap_output_amount, total_fee_share
+        )
+        swap_input_amounts.append(swap_input_amount)
+        total_fee_amounts.append(total_fee_amount)
+        price_impacts.append(price_impact)
+    return swap_input_amounts, total_fee_amounts, price_impacts
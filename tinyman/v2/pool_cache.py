@@ -0,0 +1,117 @@
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional
+
+from algosdk.v2client.algod import AlgodClient
+
+from .contracts import get_pool_address
+
+
+@dataclass
+class PoolStateCacheEntry:
+    info: dict
+    fetched_at: float
+
+    @property
+    def round(self) -> Optional[int]:
+        return self.info.get("round")
+
+    def is_fresh(
+        self, min_round: Optional[int] = None, max_age_ms: Optional[int] = None
+    ) -> bool:
+        if min_round is not None and (self.round or 0) < min_round:
+            return False
+        if max_age_ms is not None:
+            age_ms = (time.monotonic() - self.fetched_at) * 1000
+            if age_ms >= max_age_ms:
+                return False
+        return True
+
+
+class PoolStateCache:
+    """
+    Pool infos keyed by pool address.
+
+    A cached info is returned if it is fresh as of `min_round` and younger than `max_age_ms`.
+    Concurrent requests for the same pool share a single algod request.
+    """
+
+    def __init__(self, algod: AlgodClient, max_age_ms: Optional[int] = 0):
+        self.algod = algod
+        # Used when the caller does not specify any freshness requirement. 0 disables caching, None never expires.
+        self.max_age_ms = max_age_ms
+        self.entries = {}
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def get(self, address: str) -> Optional[PoolStateCacheEntry]:
+        return self.entries.get(address)
+
+    def set(self, info: dict) -> None:
+        entry = PoolStateCacheEntry(info=info, fetched_at=time.monotonic())
+        with self.lock:
+            current_entry = self.entries.get(info["address"])
+            # Do not replace a newer state with an older one.
+            if current_entry is None or (current_entry.round or 0) <= (
+                entry.round or 0
+            ):
+                self.entries[info["address"]] = entry
+
+    def invalidate(self, address: Optional[str] = None) -> None:
+        with self.lock:
+            if address is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(address, None)
+
+    def get_pool_info(
+        self,
+        validator_app_id: int,
+        asset_1_id: int,
+        asset_2_id: int,
+        min_round: Optional[int] = None,
+        max_age_ms: Optional[int] = None,
+    ) -> dict:
+        from .pools import get_pool_info
+
+        if min_round is None and max_age_ms is None:
+            max_age_ms = self.max_age_ms
+
+        address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
+        while True:
+            with self.lock:
+                entry = self.entries.get(address)
+                if entry is not None and entry.is_fresh(min_round, max_age_ms):
+                    return entry.info
+
+                future = self.pending.get(address)
+                is_owner = future is None
+                if is_owner:
+                    future = Future()
+                    self.pending[address] = future
+
+            if is_owner:
+                break
+
+            # Another thread is already fetching the pool. Its result is recent enough unless it is older than `min_round`,
+            # e.g. the request was sent before the caller's transaction was confirmed.
+            info = future.result()
+            if min_round is None or (info.get("round") or 0) >= min_round:
+                return info
+
+        try:
+            info = get_pool_info(self.algod, validator_app_id, asset_1_id, asset_2_id)
+        except Exception as e:
+            # The pending fetch is removed before waking up the waiters, a waiter retrying sees a new fetch.
+            with self.lock:
+                self.pending.pop(address, None)
+            future.set_exception(e)
+            raise
+
+        self.set(info)
+        with self.lock:
+            self.pending.pop(address, None)
+        future.set_result(info)
+        return info
@@ -4,7 +4,7 @@ from algosdk.v2client.algod import AlgodClient
 
 from tinyman.assets import Asset, AssetAmount
 from tinyman.compat import LogicSigAccount, Transaction, SuggestedParams
-from tinyman.exceptions import LowSwapAmountError
+from tinyman.exceptions import AsyncClientNotSupported, LowSwapAmountError
 from tinyman.optin import prepare_asset_optin_transactions
 from tinyman.utils import TransactionGroup
 from .add_liquidity import (
@@ -15,7 +15,7 @@ from .add_liquidity import (
 from .bootstrap import prepare_bootstrap_transactions
 from .client import TinymanV2Client
 from .constants import MIN_POOL_BALANCE_ASA_ALGO_PAIR, MIN_POOL_BALANCE_ASA_ASA_PAIR
-from .contracts import get_pool_logicsig
+from .contracts import get_pool_address, get_pool_logicsig
 from .exceptions import (
     PoolAlreadyBootstrapped,
     PoolIsNotBootstrapped,
@@ -66,8 +66,7 @@ def generate_pool_info(address, validator_app_id, round_number, state):
 def get_pool_info(
     client: AlgodClient, validator_app_id: int, asset_1_id: int, asset_2_id: int
 ) -> dict:
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
     account_info = client.account_info(pool_address)
     pool_state = get_pool_state_from_account_info(account_info)
 
@@ -79,10 +78,25 @@ def get_pool_info(
     )
 
 
+async def get_pool_info_async(
+    client, validator_app_id: int, asset_1_id: int, asset_2_id: int
+) -> dict:
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
+    account_info = await client.account_info(pool_address)
+    pool_state = get_pool_state_from_account_info(account_info)
+
+    return generate_pool_info(
+        address=pool_address,
+        validator_app_id=validator_app_id,
+        round_number=account_info.get("round"),
+        state=pool_state,
+    )
+
+
 def get_validator_app_id_from_account_info(account_info: dict) -> Optional[int]:
     try:
         return account_info["apps-local-state"][0]["id"]
-    except IndexError:
+    except (IndexError, KeyError):
         return None
 
 
@@ -108,6 +122,10 @@ class Pool:
             if validator_app_id is not None
             else client.validator_app_id
         )
+        if fetch:
+            self._check_sync_client(
+                "Pool(fetch=True)", "await client.fetch_pool(asset_a, asset_b)"
+            )
 
         if isinstance(asset_a, int):
             if fetch:
@@ -202,20 +220,62 @@ class Pool:
         )
         return pool
 
-    def refresh(self, info: Optional[dict] = None) -> None:
+    def refresh(
+        self,
+        info: Optional[dict] = None,
+        min_round: Optional[int] = None,
+        max_age_ms: Optional[int] = None,
+    ) -> None:
+        """
+        Refreshes the pool state through the client's pool state cache.
+        The cached state is used if it is fresh as of `min_round` and younger than `max_age_ms`.
+        """
         if info is None:
-            info = get_pool_info(
-                self.client.algod,
+            self._check_sync_client("refresh", "await pool.refresh_async()")
+            info = self.client.pool_state_cache.get_pool_info(
                 self.validator_app_id,
                 self.asset_1.id,
                 self.asset_2.id,
+                min_round=min_round,
+                max_age_ms=max_age_ms,
             )
         self.update_from_info(info)
 
+    async def refresh_async(self, info: Optional[dict] = None) -> None:
+        if info is None:
+            info = await get_pool_info_async(
+                self.client.algod,
+                self.validator_app_id,
+                self.asset_1.id,
+                self.asset_2.id,
+            )
+        self.update_from_info(info, fetch=False)
+        if self.exists:
+            self.pool_token_asset = await self.client.fetch_asset(
+                info["pool_token_asset_id"]
+            )
+
+    def _check_sync_client(self, method: str, alternative: str) -> None:
+        # The algod of an async client returns coroutines, the sync methods can not use it.
+        if self.client.is_async:
+            raise AsyncClientNotSupported(
+                f"Pool.{method} is not supported with an async client, use `{alternative}` instead."
+            )
+
+    def _get_suggested_params(self) -> SuggestedParams:
+        self._check_sync_client(
+            "prepare_*_transactions without suggested_params",
+            "suggested_params=await client.algod.suggested_params()",
+        )
+        return self.client.algod.suggested_params()
+
     def update_from_info(self, info: dict, fetch: bool = True) -> None:
         if info.get("pool_token_asset_id"):
             self.exists = True
             if fetch:
+                self._check_sync_client(
+                    "update_from_info(fetch=True)", "update_from_info(fetch=False)"
+                )
                 self.pool_token_asset = self.client.fetch_asset(
                     info["pool_token_asset_id"]
                 )
@@ -241,9 +301,7 @@ class Pool:
 
     @property
     def address(self) -> str:
-        logicsig = self.get_logicsig()
-        pool_address = logicsig.address()
-        return pool_address
+        return get_pool_address(self.validator_app_id, self.asset_1.id, self.asset_2.id)
 
     @property
     def asset_1_price(self) -> float:
@@ -301,7 +359,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         txn_group = prepare_asset_optin_transactions(
             asset_id=self.pool_token_asset.id,
@@ -312,6 +370,10 @@ class Pool:
 
     def fetch_pool_position(self, user_address: Optional[str] = None) -> dict:
         user_address = user_address or self.client.user_address
+        self._check_sync_client(
+            "fetch_pool_position",
+            "await client.algod.account_info(user_address)",
+        )
         account_info = self.client.algod.account_info(user_address)
         assets = {a["asset-id"]: a for a in account_info["assets"]}
         pool_token_asset_amount = assets.get(self.pool_token_asset.id, {}).get(
@@ -341,11 +403,15 @@ class Pool:
             raise PoolAlreadyBootstrapped()
 
         if pool_algo_balance is None:
+            self._check_sync_client(
+                "prepare_bootstrap_transactions without pool_algo_balance",
+                "pool_algo_balance=(await client.algod.account_info(pool.address))['amount']",
+            )
             pool_account_info = self.client.algod.account_info(self.address)
             pool_algo_balance = pool_account_info["amount"]
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         if self.asset_2.id == 0:
             pool_minimum_balance = MIN_POOL_BALANCE_ASA_ALGO_PAIR
@@ -566,7 +632,7 @@ class Pool:
         asset_2_amount = amounts_in[self.asset_2]
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         txn_group = prepare_flexible_add_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -592,7 +658,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         txn_group = prepare_single_asset_add_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -623,7 +689,7 @@ class Pool:
         asset_2_amount = amounts_in[self.asset_2]
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         txn_group = prepare_initial_add_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -807,7 +873,7 @@ class Pool:
         asset_2_amount = amounts_out[self.asset_2]
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         txn_group = prepare_remove_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -838,7 +904,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         txn_group = prepare_single_asset_remove_liquidity_transactions(
             validator_app_id=self.validator_app_id,
@@ -981,7 +1047,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         txn_group = prepare_swap_transactions(
             validator_app_id=self.validator_app_id,
@@ -1102,7 +1168,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         txn_group = prepare_flash_loan_transactions(
             validator_app_id=self.validator_app_id,
@@ -1145,7 +1211,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         return prepare_claim_fees_transactions(
             validator_app_id=self.validator_app_id,
@@ -1167,7 +1233,7 @@ class Pool:
         user_address = user_address or self.client.user_address
 
         if suggested_params is None:
-            suggested_params = self.client.algod.suggested_params()
+            suggested_params = self._get_suggested_params()
 
         return prepare_set_fee_transactions(
             validator_app_id=self.validator_app_id,
@@ -1177,3 +1243,96 @@ class Pool:
             fee_manager=user_address,
             suggested_params=suggested_params,
         )
+
+    # Async counterparts of the fetch_*_quote methods, use them with AsyncTinymanV2Client.
+    async def fetch_flexible_add_liquidity_quote_async(
+        self,
+        amount_a: AssetAmount,
+        amount_b: AssetAmount,
+        slippage: float = 0.05,
+        refresh: bool = True,
+    ) -> FlexibleAddLiquidityQuote:
+        if refresh:
+            await self.refresh_async()
+        return self.fetch_flexible_add_liquidity_quote(
+            amount_a=amount_a, amount_b=amount_b, slippage=slippage, refresh=False
+        )
+
+    async def fetch_single_asset_add_liquidity_quote_async(
+        self, amount_a: AssetAmount, slippage: float = 0.05, refresh: bool = True
+    ) -> SingleAssetAddLiquidityQuote:
+        if refresh:
+            await self.refresh_async()
+        return self.fetch_single_asset_add_liquidity_quote(
+            amount_a=amount_a, slippage=slippage, refresh=False
+        )
+
+    async def fetch_initial_add_liquidity_quote_async(
+        self,
+        amount_a: AssetAmount,
+        amount_b: AssetAmount,
+        refresh: bool = True,
+    ) -> InitialAddLiquidityQuote:
+        if refresh:
+            await self.refresh_async()
+        return self.fetch_initial_add_liquidity_quote(
+            amount_a=amount_a, amount_b=amount_b, refresh=False
+        )
+
+    async def fetch_remove_liquidity_quote_async(
+        self,
+        pool_token_asset_in: [AssetAmount, int],
+        slippage: float = 0.05,
+        refresh: bool = True,
+    ) -> RemoveLiquidityQuote:
+        if refresh:
+            await self.refresh_async()
+        return self.fetch_remove_liquidity_quote(
+            pool_token_asset_in=pool_token_asset_in, slippage=slippage, refresh=False
+        )
+
+    async def fetch_single_asset_remove_liquidity_quote_async(
+        self,
+        pool_token_asset_in: [AssetAmount, int],
+        output_asset: Asset,
+        slippage: float = 0.05,
+        refresh: bool = True,
+    ) -> SingleAssetRemoveLiquidityQuote:
+        if refresh:
+            await self.refresh_async()
+        return self.fetch_single_asset_remove_liquidity_quote(
+            pool_token_asset_in=pool_token_asset_in,
+            output_asset=output_asset,
+            slippage=slippage,
+            refresh=False,
+        )
+
+    async def fetch_fixed_input_swap_quote_async(
+        self, amount_in: AssetAmount, slippage: float = 0.05, refresh: bool = True
+    ) -> SwapQuote:
+        if refresh:
+            await self.refresh_async()
+        return self.fetch_fixed_input_swap_quote(
+            amount_in=amount_in, slippage=slippage, refresh=False
+        )
+
+    async def fetch_fixed_output_swap_quote_async(
+        self, amount_out: AssetAmount, slippage: float = 0.05, refresh: bool = True
+    ) -> SwapQuote:
+        if refresh:
+            await self.refresh_async()
+        return self.fetch_fixed_output_swap_quote(
+            amount_out=amount_out, slippage=slippage, refresh=False
+        )
+
+    async def fetch_flash_loan_quote_async(
+        self,
+        loan_amount_a: AssetAmount,
+        loan_amount_b: AssetAmount,
+        refresh: bool = True,
+    ) -> FlashLoanQuote:
+        if refresh:
+            await self.refresh_async()
+        return self.fetch_flash_loan_quote(
+            loan_amount_a=loan_amount_a, loan_amount_b=loan_amount_b, refresh=False
+        )
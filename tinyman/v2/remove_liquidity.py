@@ -8,7 +8,7 @@ from tinyman.compat import (
 
 from tinyman.utils import TransactionGroup
 from .constants import REMOVE_LIQUIDITY_APP_ARGUMENT
-from .contracts import get_pool_logicsig
+from .contracts import get_pool_address
 
 
 def prepare_remove_liquidity_transactions(
@@ -23,8 +23,7 @@ def prepare_remove_liquidity_transactions(
     suggested_params: SuggestedParams,
     app_call_note: Optional[str] = None,
 ) -> TransactionGroup:
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
 
     txns = [
         AssetTransferTxn(
@@ -70,8 +69,7 @@ def prepare_single_asset_remove_liquidity_transactions(
     suggested_params: SuggestedParams,
     app_call_note: Optional[str] = None,
 ) -> TransactionGroup:
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
 
     if output_asset_id == asset_1_id:
         min_asset_1_amount = min_output_asset_amount
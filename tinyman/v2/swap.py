@@ -13,7 +13,7 @@ from .constants import (
     FIXED_INPUT_APP_ARGUMENT,
     FIXED_OUTPUT_APP_ARGUMENT,
 )
-from .contracts import get_pool_logicsig
+from .contracts import get_pool_address
 
 
 def prepare_swap_transactions(
@@ -28,8 +28,7 @@ def prepare_swap_transactions(
     suggested_params: SuggestedParams,
     app_call_note: Optional[str] = None,
 ) -> TransactionGroup:
-    pool_logicsig = get_pool_logicsig(validator_app_id, asset_1_id, asset_2_id)
-    pool_address = pool_logicsig.address()
+    pool_address = get_pool_address(validator_app_id, asset_1_id, asset_2_id)
 
     txns = [
         AssetTransferTxn(
@@ -2,6 +2,7 @@ import sys
 import importlib.resources
 import json
 from base64 import b64decode
+from functools import lru_cache
 
 import tinyman.v2
 from tinyman.swap_router.constants import (
@@ -12,32 +13,30 @@ from tinyman.tealishmap import TealishMap
 from tinyman.utils import bytes_to_int
 from tinyman.v2.constants import TESTNET_VALIDATOR_APP_ID, MAINNET_VALIDATOR_APP_ID
 
-if sys.version_info >= (3, 9):
-    amm_tealishmap = TealishMap(
-        json.loads(
-            importlib.resources.files(tinyman.v2)
-            .joinpath("amm_approval.map.json")
-            .read_text()
-        )
-    )
-    swap_router_tealishmap = TealishMap(
-        json.loads(
-            importlib.resources.files(tinyman.v2)
-            .joinpath("swap_router_approval.map.json")
-            .read_text()
-        )
-    )
+TEALISHMAP_FILES = {
+    TESTNET_VALIDATOR_APP_ID: "amm_approval.map.json",
+    MAINNET_VALIDATOR_APP_ID: "amm_approval.map.json",
+    TESTNET_SWAP_ROUTER_APP_ID_V1: "swap_router_approval.map.json",
+    MAINNET_SWAP_ROUTER_APP_ID_V1: "swap_router_approval.map.json",
+}
 
 
-else:
-    amm_tealishmap = TealishMap(
-        json.loads(importlib.resources.read_text(tinyman.v2, "amm_approval.map.json"))
-    )
-    swap_router_tealishmap = TealishMap(
-        json.loads(
-            importlib.resources.read_text(tinyman.v2, "swap_router_approval.map.json")
-        )
-    )
+@lru_cache(maxsize=None)
+def load_tealishmap(filename: str) -> TealishMap:
+    if sys.version_info >= (3, 9):
+        map_json = importlib.resources.files(tinyman.v2).joinpath(filename).read_text()
+    else:
+        map_json = importlib.resources.read_text(tinyman.v2, filename)
+    return TealishMap(json.loads(map_json))
+
+
+def __getattr__(name):
+    # The maps are only needed to explain failed transactions, they are loaded on first use.
+    if name == "amm_tealishmap":
+        return load_tealishmap("amm_approval.map.json")
+    if name == "swap_router_tealishmap":
+        return load_tealishmap("swap_router_approval.map.json")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def decode_logs(logs: "list") -> dict:
@@ -75,13 +74,10 @@ def get_state_from_account_info(account_info, app_id):
 
 
 def get_tealishmap(app_id):
-    maps = {
-        TESTNET_VALIDATOR_APP_ID: amm_tealishmap,
-        MAINNET_VALIDATOR_APP_ID: amm_tealishmap,
-        TESTNET_SWAP_ROUTER_APP_ID_V1: swap_router_tealishmap,
-        MAINNET_SWAP_ROUTER_APP_ID_V1: swap_router_tealishmap,
-    }
-    return maps.get(app_id)
+    filename = TEALISHMAP_FILES.get(app_id)
+    if filename is None:
+        return None
+    return load_tealishmap(filename)
 
 
 def lookup_error(pc, error_message, tealishmap):